@@ -1,6 +1,5 @@
 #Contains all functionality for minister investigations
 
-import random
 from typing import Tuple, Dict
 from . import action
 from ..util import action_utility, text_utility, minister_utility
@@ -159,10 +158,10 @@ class active_investigation(action.campaign):
                     difficulty = 5
                 else:
                     difficulty = 6
-                if random.randrange(1, 7) >= difficulty: # More common to find rumors for current position or for loyalty than for random skill
+                if constants.random_manager.get_stream('corruption').randrange(1, 7) >= difficulty: # More common to find rumors for current position or for loyalty than for random skill
                     if category == 'evidence':
                         if len(target.undetected_corruption_events) > 0:
-                            random_index = random.randrange(0, len(target.undetected_corruption_events))
+                            random_index = constants.random_manager.get_stream('corruption').randrange(0, len(target.undetected_corruption_events))
                             corruption_event = target.undetected_corruption_events[random_index] #random.choice(target.undetected_corruption_events)
                             if (target.check_corruption() or target.check_corruption()) and (prosecutor.check_corruption() or prosecutor.check_corruption()): #conspiracy check with advantage
                                 bribe_cost = 5
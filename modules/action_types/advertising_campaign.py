@@ -1,7 +1,6 @@
 #Contains all functionality for advertising campaigns
 
 import pygame
-import random
 from . import action
 from ..util import action_utility, text_utility, market_utility, scaling, game_transitions
 import modules.constants.constants as constants
@@ -201,9 +200,9 @@ class advertising_campaign(action.campaign):
         '''
         flags.choosing_advertised_commodity = False
         self.target_commodity = commodity
-        self.target_unadvertised_commodity = random.choice(constants.commodity_types)
+        self.target_unadvertised_commodity = constants.random_manager.get_stream('actions').choice(constants.commodity_types)
         while (not self.target_unadvertised_commodity in constants.collectable_resources) or self.target_unadvertised_commodity == self.target_commodity or constants.item_prices[self.target_unadvertised_commodity] == 1:
-            self.target_unadvertised_commodity = random.choice(constants.commodity_types)
+            self.target_unadvertised_commodity = constants.random_manager.get_stream('actions').choice(constants.commodity_types)
 
         if super().start(unit):
             constants.notification_manager.display_notification({
@@ -1,6 +1,5 @@
 #Contains all functionality for finding an artifact at a rumored location
 
-import random
 import pygame
 from . import action
 from ..util import action_utility, text_utility, actor_utility
@@ -161,8 +160,8 @@ class artifact_search(action.action):
         if self.roll_result >= self.current_min_success:
             location = status.current_lore_mission.get_possible_artifact_location(self.current_unit.x, self.current_unit.y)
             if location == status.current_lore_mission.artifact_location:
-                self.prize_money = random.randrange(25, 51) * 10
-                self.public_opinion_increase = random.randrange(30, 61)
+                self.prize_money = constants.random_manager.get_stream('actions').randrange(25, 51) * 10
+                self.public_opinion_increase = constants.random_manager.get_stream('actions').randrange(30, 61)
                 text = 'The ' + status.current_country.government_type_adjective.capitalize() + ' Geographical Society awarded ' + str(self.prize_money) + ' money for finding the ' + status.current_lore_mission.name + '. /n /n'
                 text += 'Additionally, public opinion has increased by ' + str(self.public_opinion_increase) + '. /n /n'
                 self.lore_type = status.current_lore_mission.lore_type
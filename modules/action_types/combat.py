@@ -190,7 +190,7 @@ class combat(action.action):
         elif subject == 'critical_failure': #lose
             if self.defending:
                 if self.opponent.npmob_type == 'beast':
-                    self.public_opinion_change = random.randrange(1, 4) * -1
+                    self.public_opinion_change = constants.random_manager.get_stream('combat').randrange(1, 4) * -1
                     if self.current_unit.number == 1:
                         text += 'The ' + self.opponent.name + ' slaughtered your ' + self.current_unit.name + '. /n /n'
                     else:
@@ -200,7 +200,7 @@ class combat(action.action):
                                               'Sensationalized news stories circulate of \'brave conquerors\' aimlessly wandering the jungle at the mercy of beasts, no better than savages.']
                     text += random.choice(killed_by_beast_flavor) + ' Public opinion has decreased by ' + str(self.public_opinion_change * -1) + '. /n /n'
                 else:
-                    self.public_opinion_change = random.randrange(-3, 4)
+                    self.public_opinion_change = constants.random_manager.get_stream('combat').randrange(-3, 4)
                     if self.current_unit.number == 1:
                         text += 'The ' + self.opponent.name + ' decisively defeated your ' + self.current_unit.name + ', who was either slain or captured. /n /n'
                     else:
@@ -258,7 +258,7 @@ class combat(action.action):
             else:
                 if self.opponent.npmob_type == 'beast':
                     text += 'Your ' + self.current_unit.name + ' tracked down and killed the ' + self.opponent.name + '. /n /n'
-                    self.public_relations_change = random.randrange(1, 7)
+                    self.public_relations_change = constants.random_manager.get_stream('combat').randrange(1, 7)
                     text += 'Sensationalized stories of your safari\'s exploits and the death of the ' + self.opponent.name + ' increase public opinion by ' + str(self.public_relations_change) + '. /n /n'
                 else:
                     text += 'Your ' + self.current_unit.name + ' decisively defeated and destroyed the ' + self.opponent.name + '. /n /n'
@@ -281,7 +281,7 @@ class combat(action.action):
             roll_modifier = self.opponent.get_combat_modifier()
         else:
             roll_modifier = super().generate_current_roll_modifier()
-            roll_modifier += int(self.current_unit.equipment.get('Maxim gun', False)) * random.randrange(0, 2) # positive modifier if Maxim gun equipped
+            roll_modifier += int(self.current_unit.equipment.get('Maxim gun', False)) * constants.random_manager.get_stream('combat').randrange(0, 2) # positive modifier if Maxim gun equipped
             roll_modifier += self.current_unit.get_combat_modifier(opponent=self.opponent, include_tile=True)
         return(roll_modifier)
 
@@ -464,9 +464,9 @@ class combat(action.action):
             )
             results = minister_rolls
         elif (self.current_unit.is_safari and self.opponent.npmob_type == 'beast') or (self.current_unit.is_battalion and self.opponent.npmob_type != 'beast'):
-            results = [random.randrange(1, 7), self.current_unit.controlling_minister.no_corruption_roll(6), self.current_unit.controlling_minister.no_corruption_roll(6)]
+            results = [constants.random_manager.get_stream('combat').randrange(1, 7), self.current_unit.controlling_minister.no_corruption_roll(6), self.current_unit.controlling_minister.no_corruption_roll(6)]
         else:
-            results = [random.randrange(1, 7), random.randrange(1, 7), random.randrange(1, 7)] #civilian ministers don't get to roll for combat with their units
+            results = [constants.random_manager.get_stream('combat').randrange(1, 7), constants.random_manager.get_stream('combat').randrange(1, 7), constants.random_manager.get_stream('combat').randrange(1, 7)] #civilian ministers don't get to roll for combat with their units
 
         if constants.effect_manager.effect_active('ministry_of_magic'):
             results = [1, 6, 6]
@@ -624,6 +624,5 @@ class combat(action.action):
             for current_pmob in status.pmob_list:
                 if current_pmob.is_vehicle:
                     current_pmob.reembark()
-            for current_building in status.building_list:
-                if current_building.building_type == 'resource':
-                    current_building.reattach_work_crews()
+            for current_resource_building in status.resource_building_list:
+                current_resource_building.reattach_work_crews()
@@ -1,7 +1,6 @@
 #Contains all functionality for village conversion
 
 import pygame
-import random
 from . import action
 from ..util import action_utility, text_utility
 import modules.constants.constants as constants
@@ -86,7 +85,7 @@ class conversion(action.action):
         elif subject == 'success':
             text += 'The missionaries have made progress in converting the natives and have reduced their aggressiveness from '
             text += str(self.current_village.aggressiveness) + ' to ' + str(self.current_village.aggressiveness - 1) + '. /n /n'
-            self.public_relations_change = random.randrange(0, 2)
+            self.public_relations_change = constants.random_manager.get_stream('actions').randrange(0, 2)
             if self.public_relations_change > 0:
                 text += 'Working to fulfill your company\'s proclaimed mission of enlightening the heathens of Africa has increased your public opinion by '
                 text += str(self.public_relations_change) + '. /n /n'
@@ -1,6 +1,5 @@
 #Contains all functionality for exploration
 
-import random
 from . import action
 from ..util import action_utility
 import modules.constants.constants as constants
@@ -88,7 +87,7 @@ class exploration(action.action):
             text += (constants.flavor_text_manager.generate_flavor_text(self.action_type) + ' /n /n')
         elif subject == 'success':
             text += '/n'
-            self.public_relations_change = random.randrange(0, 3)
+            self.public_relations_change = constants.random_manager.get_stream('actions').randrange(0, 3)
             if self.future_cell.resource != 'none':
                 if self.future_cell.resource == 'natives':
                     text += 'The expedition has discovered a ' + self.future_cell.terrain.upper() + ' tile containing the village of ' + self.future_cell.village.name + '. /n /n'
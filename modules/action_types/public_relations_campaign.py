@@ -1,7 +1,6 @@
 #Contains all functionality for public relations campaigns
 
 import pygame
-import random
 from . import action
 from ..util import action_utility, text_utility
 import modules.constants.constants as constants
@@ -68,7 +67,7 @@ class public_relations_campaign(action.campaign):
         elif subject == 'initial':
             text += 'The evangelist campaigns to increase your company\'s public opinion with word of your company\'s benevolent goals and righteous deeds in Africa. /n /n'
         elif subject == 'success':
-            self.public_relations_change = random.randrange(1, 7)
+            self.public_relations_change = constants.random_manager.get_stream('actions').randrange(1, 7)
             text += 'Met with gullible and enthusiastic audiences, the evangelist successfully improves your company\'s public opinion by ' + str(self.public_relations_change) + '. /n /n'
         elif subject == 'failure':
             text += 'Whether by a lack of charisma, a reluctant audience, or a doomed cause, the evangelist fails to improve your company\'s public opinion. /n /n'
@@ -1,7 +1,6 @@
 #Contains all functionality for slave capture
 
 import pygame
-import random
 from . import action
 from ..util import action_utility, text_utility, actor_utility
 import modules.constants.constants as constants
@@ -121,12 +120,12 @@ class slave_capture(action.action):
             else:
                 text += 'A majority of the natives managed to evade capture. /n /n'
             
-            if self.current_village.population > 1 and random.randrange(1, 7) >= 4:
+            if self.current_village.population > 1 and constants.random_manager.get_stream('actions').randrange(1, 7) >= 4:
                 self.aggressiveness_increase = 1
                 text += 'The natives of this village have grown wary of and even vengeful torwards the invaders, increasing their aggressiveness by 1. /n /n'
             else:
                 self.aggressiveness_increase = 0
-            self.public_relations_change = -1 * random.randrange(0, 3)
+            self.public_relations_change = -1 * constants.random_manager.get_stream('actions').randrange(0, 3)
             if abs(self.public_relations_change) > 0: #reports could be based on the orders even be given - can occur even if corruption occurred
                 text += 'Rumors of your company\'s brutal treatment of the natives reaches Europe, decreasing public opinion by ' + str(-1 * self.public_relations_change) + '. /n /n'
         elif subject == 'critical_failure':
@@ -1,7 +1,6 @@
 #Contains all functionality for slave trade suppression
 
 import pygame
-import random
 from . import action
 from ..util import action_utility, text_utility, actor_utility, market_utility
 import modules.constants.constants as constants
@@ -103,8 +102,8 @@ class suppress_slave_trade(action.action):
         elif subject == 'initial':
             text += 'The battalion tries to suppress the slave trade. /n /n'
         elif subject == 'success':
-            self.strength_decrease = random.randrange(1, 4)
-            self.public_opinion_increase = random.randrange(1, 4)
+            self.strength_decrease = constants.random_manager.get_stream('actions').randrange(1, 4)
+            self.public_opinion_increase = constants.random_manager.get_stream('actions').randrange(1, 4)
             text += 'The battalion successfully disrupt certain slave trader operations, decreasing the strength of the slave traders by ' + str(self.strength_decrease) + '. /n /n'
             text += 'Word of your company\'s suppression of the slave trade reaches Europe, increasing public opinion by ' + str(self.public_opinion_increase) + '. /n /n'
         elif subject == 'failure':
@@ -186,10 +185,10 @@ class suppress_slave_trade(action.action):
             actor_utility.set_slave_traders_strength(constants.slave_traders_strength - self.strength_decrease)
             if constants.slave_traders_strength <= 0:
                 constants.slave_traders_strength = 0
-                num_freed_slaves = random.randrange(1, 7) + random.randrange(1, 7)
+                num_freed_slaves = constants.random_manager.get_stream('actions').randrange(1, 7) + constants.random_manager.get_stream('actions').randrange(1, 7)
                 initial_public_opinion_increase = self.public_opinion_increase
                 for i in range(num_freed_slaves):
-                    self.public_opinion_increase += 4 + random.randrange(-3, 4) #1-7 each
+                    self.public_opinion_increase += 4 + constants.random_manager.get_stream('actions').randrange(-3, 4) #1-7 each
                     market_utility.attempt_worker_upkeep_change('decrease', 'African')
                     constants.evil_tracker.change(-2)
                     constants.num_wandering_workers += 1
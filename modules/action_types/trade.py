@@ -1,6 +1,5 @@
 #Contains all functionality for transactions with villages
 
-import random
 from . import action
 from ..util import action_utility, utility, actor_utility, market_utility, scaling
 import modules.constants.constants as constants
@@ -86,11 +85,11 @@ class trade(action.action):
         elif subject in ['success', 'failure']:
             text += '/n'
             if subject == 'success':
-                self.commodity = random.choice(constants.collectable_resources)
+                self.commodity = constants.random_manager.get_stream('actions').choice(constants.collectable_resources)
                 text += 'The merchant managed to buy a unit of ' + self.commodity + ' (currently worth ' + str(constants.item_prices[self.commodity]) + ' money). /n /n'
             else:
                 text += 'The merchant bought items that turned out to be worthless. /n /n'
-            if (self.current_village.population != self.current_village.available_workers) and random.randrange(1, 7) >= 4: #half chance of getting worker
+            if (self.current_village.population != self.current_village.available_workers) and constants.random_manager.get_stream('actions').randrange(1, 7) >= 4: #half chance of getting worker
                 self.attracted_worker = True
                 text += 'Drawn to the Western lifestyle by consumer goods, some of the villagers are now available to be hired by your company. /n /n'
             else:
@@ -1,8 +1,7 @@
 #Contains functionality for actors
 
 import pygame
-import random
-from ..util import text_utility, utility, actor_utility, scaling, market_utility
+from ..util import text_utility, actor_utility, scaling, market_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -21,11 +20,14 @@ class actor():
                 'grid': grid value - grid in which this tile can appear
                 'modes': string list value - Game modes during which this actor's images can appear
                 'inventory': dictionary value - This actor's initial items carried, with an integer value corresponding to amount of each item type 
+                'registry_orders': dictionary value - Required if from save, this actor's position in each saved registry containing it, with the registry names as keys
         Output:
             None
         '''
         self.from_save = from_save
-        status.actor_list.append(self)
+        if self.from_save:
+            self.saved_registry_orders = input_dict.get('registry_orders', {})
+        status.actor_list.add(self)
         self.modes = input_dict['modes']
         self.x, self.y = input_dict['coordinates']
         if self.from_save:
@@ -60,6 +62,7 @@ class actor():
                 'grid_type': string value - String matching the status key of this actor's primary grid, allowing loaded object to start in that grid
                 'name': string value - This actor's name
                 'inventory': dictionary value - This actor's items carried, with an integer value corresponding to amount of each item type
+                'registry_orders': dictionary value - This actor's position in each saved registry containing it, with the registry names as keys
         '''
         save_dict = {}
         init_type = ''
@@ -98,6 +101,7 @@ class actor():
                 save_dict['grid_type'] = grid_type
         save_dict['name'] = self.name
         save_dict['inventory'] = self.inventory
+        save_dict['registry_orders'] = constants.save_load_manager.get_registry_orders(self)
         return(save_dict)
             
     def set_image(self, new_image):
@@ -250,7 +254,7 @@ class actor():
             None
         '''
         if self.get_inventory_used() > 0:
-            if random.randrange(1, 7) <= 1 or constants.effect_manager.effect_active('boost_attrition') or (self.actor_type == 'mob' and (not self.is_vehicle) and random.randrange(1, 7) <= 1): #extra chance of failure when carried by porters/caravan
+            if constants.random_manager.get_stream('attrition').randrange(1, 7) <= 1 or constants.effect_manager.effect_active('boost_attrition') or (self.actor_type == 'mob' and (not self.is_vehicle) and constants.random_manager.get_stream('attrition').randrange(1, 7) <= 1): #extra chance of failure when carried by porters/caravan
                 transportation_minister = status.current_ministers[constants.type_minister_dict['transportation']]
                 if self.actor_type == 'tile':
                     current_cell = self.cell
@@ -260,7 +264,7 @@ class actor():
                     else:
                         return() #only surface-level mobs can have inventories and need to roll for attrition
 
-                if (random.randrange(1, 7) <= 2 and transportation_minister.check_corruption()): #1/18 chance of corruption check to take commodities - 1/36 chance for most corrupt to steal
+                if (constants.random_manager.get_stream('corruption').randrange(1, 7) <= 2 and transportation_minister.check_corruption()): #1/18 chance of corruption check to take commodities - 1/36 chance for most corrupt to steal
                     self.trigger_inventory_attrition(transportation_minister, True)
                     return()
                 elif current_cell.local_attrition('inventory') and transportation_minister.no_corruption_roll(6) < 4: #1/6 chance of doing tile conditions check, if passes minister needs to make a 4+ roll to avoid attrition
@@ -268,7 +272,7 @@ class actor():
                     return()
 
             #this part of function only reached if no inventory attrition was triggered
-            if self.actor_type == 'mob' and self.is_pmob and self.is_group and self.group_type == 'porters' and (not self.veteran) and random.randrange(1, 7) == 6 and random.randrange(1, 7) == 6: #1/36 chance of porters promoting on successful inventory attrition roll
+            if self.actor_type == 'mob' and self.is_pmob and self.is_group and self.group_type == 'porters' and (not self.veteran) and constants.random_manager.get_stream('attrition').randrange(1, 7) == 6 and constants.random_manager.get_stream('attrition').randrange(1, 7) == 6: #1/36 chance of porters promoting on successful inventory attrition roll
                 self.promote()
                 constants.notification_manager.display_notification({
                     'message': 'By avoiding losses and damage to the carried commodities, the porters\' driver is now a veteran and will have more movement points each turn.',
@@ -291,7 +295,7 @@ class actor():
             value_stolen = 0
         for current_commodity in self.get_held_commodities():
             initial_amount = self.get_inventory(current_commodity)
-            amount_lost = random.randrange(0, int(initial_amount / 2) + 2) #0-50%
+            amount_lost = constants.random_manager.get_stream('attrition').randrange(0, int(initial_amount / 2) + 2) #0-50%
             if amount_lost > initial_amount:
                 amount_lost = initial_amount
             if amount_lost > 0:
@@ -301,7 +305,7 @@ class actor():
                 if stealing:
                     value_stolen += (constants.item_prices[current_commodity] * amount_lost)
                     for i in range(amount_lost):
-                        if random.randrange(1, 7) <= 1: #1/6 chance
+                        if constants.random_manager.get_stream('attrition').randrange(1, 7) <= 1: #1/6 chance
                             market_utility.change_price(current_commodity, -1)
         for current_index in range(0, len(types_lost_list)):
             lost_commodity = types_lost_list[current_index]
@@ -417,7 +421,8 @@ class actor():
         Output:
             None
         '''
-        status.actor_list = utility.remove_from_list(status.actor_list, self)
+        status.actor_list.remove(self)
+        constants.hit_test_manager.remove('actors', self)
 
     def touching_mouse(self):
         '''
@@ -429,10 +434,21 @@ class actor():
             boolean: Returns True if any of this actor's images is colliding with the mouse, otherwise returns False
         '''
         for current_image in self.images:
-            if current_image.Rect.collidepoint(pygame.mouse.get_pos()): #if mouse is in image
+            if current_image.Rect.collidepoint(constants.mouse_position): #if mouse is in image
                 return(True)
         return(False) #return false if none touch mouse
 
+    def get_hit_test_rects(self):
+        '''
+        Description:
+            Returns the Rects used to find whether this actor is under a pixel location in the hit test index
+        Input:
+            None
+        Output:
+            pygame.Rect list: Returns the Rect of each of this actor's images
+        '''
+        return([current_image.Rect for current_image in self.images])
+
     def can_show_tooltip(self):
         '''
         Description:
@@ -461,7 +477,7 @@ class actor():
             None
         '''
         self.update_tooltip()
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = constants.mouse_position
         if below_screen:
             mouse_y = constants.display_height + 10 - height
         if beyond_screen:
@@ -1,9 +1,8 @@
 #Contains functionality for buildings
 
 import pygame
-import random
 from .actors import actor
-from ..util import utility, scaling, actor_utility, text_utility
+from ..util import scaling, actor_utility, text_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -40,7 +39,9 @@ class building(actor):
         if input_dict['building_type'] == 'warehouses':
             self.image_dict['damaged'] = self.image_dict['default']
         self.cell = self.grids[0].find_cell(self.x, self.y)
-        status.building_list.append(self)
+        status.building_list.add(self)
+        constants.actor_registry_manager.add_to_index('building_type', self.building_type, self)
+        constants.target_index_manager.invalidate()
         self.set_name(input_dict['name'])
         self.contained_work_crews = []
         if from_save:
@@ -52,6 +53,7 @@ class building(actor):
         if (not from_save) and self.can_damage():
             self.set_damaged(False, True)
         self.cell.contained_buildings[self.building_type] = self
+        self.cell.grid.update_cell_arrays(self.cell)
         self.cell.tile.update_image_bundle()
 
         if (not from_save) and input_dict['building_type'] in ['resource', 'port', 'train_station', 'fort'] and not self.cell.settlement:
@@ -110,8 +112,11 @@ class building(actor):
             None
         '''
         self.cell.contained_buildings[self.building_type] = 'none'
+        self.cell.grid.update_cell_arrays(self.cell)
         super().remove()
-        status.building_list = utility.remove_from_list(status.building_list, self)
+        status.building_list.remove(self)
+        constants.actor_registry_manager.remove_from_index('building_type', self.building_type, self)
+        constants.target_index_manager.invalidate()
 
     def update_tooltip(self): #should be shown below mob tooltips
         '''
@@ -193,6 +198,8 @@ class building(actor):
             None
         '''
         self.damaged = new_value
+        self.cell.grid.update_cell_arrays(self.cell)
+        constants.target_index_manager.invalidate()
         if self.building_type == 'infrastructure':
             actor_utility.update_roads()
         if self.damaged:
@@ -368,6 +375,7 @@ class infrastructure_building(building):
                     self.image_dict['default'] = self.connection_image_dict['horizontal_road_bridge']
                 else:
                     self.image_dict['default'] = self.connection_image_dict['horizontal_railroad_bridge']
+            self.cell.grid.update_cell_arrays(self.cell) #records which cells the bridge connects
         actor_utility.update_roads()
 
     def to_save_dict(self):
@@ -670,7 +678,7 @@ class resource_building(building):
         self.num_upgrades = 0
         self.ejected_work_crews = []
         super().__init__(from_save, input_dict)
-        status.resource_building_list.append(self)
+        status.resource_building_list.add(self)
         if from_save:
             while self.scale < input_dict['scale']:
                 self.upgrade('scale')
@@ -748,7 +756,7 @@ class resource_building(building):
         Output:
             None
         '''
-        status.resource_building_list = utility.remove_from_list(status.resource_building_list, self)
+        status.resource_building_list.remove(self)
         super().remove()
 
     def manage_health_attrition(self, current_cell = 'default'):
@@ -772,7 +780,7 @@ class resource_building(building):
             if current_cell.local_attrition():
                 if transportation_minister.no_corruption_roll(6, 'health_attrition') == 1 or constants.effect_manager.effect_active('boost_attrition'):
                     worker_type = current_work_crew.worker.worker_type
-                    if (not worker_type in ['African', 'slave']) or random.randrange(1, 7) == 1:
+                    if (not worker_type in ['African', 'slave']) or constants.random_manager.get_stream('attrition').randrange(1, 7) == 1:
                         worker_attrition_list.append(current_work_crew)
         for current_work_crew in worker_attrition_list:
             current_work_crew.attrition_death('worker')
@@ -836,19 +844,6 @@ class resource_building(building):
             cost += (constants.base_upgrade_price * (i + 1))
         return(cost)
     
-    def produce(self):
-        '''
-        Description:
-            Orders each work crew attached to this building to attempt producing commodities at the end of a turn. Based on work crew experience and minister skill/corruption, each work crew can produce a number of commodities up to the
-                building's efficiency
-        Input:
-            None
-        Output:
-            None
-        '''
-        for current_work_crew in self.contained_work_crews:
-            current_work_crew.attempt_production(self)
-
 class slums(building):
     '''
     Building automatically formed by unemployed workers and freed slaves around places of employment
@@ -873,7 +868,7 @@ class slums(building):
         Output:
             None
         '''
-        status.slums_list.append(self)
+        status.slums_list.add(self)
         input_dict['building_type'] = 'slums'
         self.available_workers = 0
         if from_save:
@@ -930,7 +925,7 @@ class slums(building):
             None
         '''
         super().remove()
-        status.slums_list = utility.remove_from_list(status.slums_list, self)
+        status.slums_list.remove(self)
 
     def change_population(self, change):
         '''
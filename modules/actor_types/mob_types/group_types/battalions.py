@@ -44,7 +44,7 @@ class battalion(group):
             self.set_disorganized(True)
             actor_utility.calibrate_actor_info_display(status.mob_info_display, self) #updates label to show new combat strength
 
-    def get_movement_cost(self, x_change, y_change, post_attack = False):
+    def get_movement_cost(self, x_change, y_change, post_attack = False, local_cell = 'default'):
         '''
         Description:
             Returns the cost in movement points of moving by the inputted amounts. Only works when one inputted amount is 0 and the other is 1 or -1, with 0 and -1 representing moving 1 cell downward
@@ -53,14 +53,16 @@ class battalion(group):
             int y_change: How many cells would be moved upward in the hypothetical movement
             boolean post_attack = False: Whether this movement is occuring directly after an attack order or not. A battalion/safari can move into a cell to attack it by using only 1 movement point but must return afterward if not
                 enough movement points to move there normally
+            cell local_cell = 'default': Cell the hypothetical movement would start from, or 'default' to use this unit's current cell
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         '''
         cost = self.movement_cost
-        if not (self.is_npmob and not self.visible()):
-            local_cell = self.images[0].current_cell
-        else:
-            local_cell = self.grids[0].find_cell(self.x, self.y)
+        if local_cell == 'default':
+            if not (self.is_npmob and not self.visible()):
+                local_cell = self.images[0].current_cell
+            else:
+                local_cell = self.grids[0].find_cell(self.x, self.y)
 
         direction = 'none'
         if x_change < 0:
@@ -85,7 +87,7 @@ class battalion(group):
             elif (not post_attack) and self.is_safari and not adjacent_cell.get_best_combatant('npmob', 'beast') == 'none': #if safari attacking beast
                 cost = 1
             else:
-                cost = super().get_movement_cost(x_change, y_change)
+                cost = super().get_movement_cost(x_change, y_change, local_cell = local_cell)
         return(cost)
 
     def move(self, x_change, y_change, attack_confirmed = False):
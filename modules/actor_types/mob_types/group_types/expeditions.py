@@ -1,6 +1,5 @@
 #Contains functionality for expeditions
 
-import random
 from ..groups import group
 from ....util import actor_utility, dice_utility
 import modules.constants.constants as constants
@@ -125,7 +124,7 @@ class expedition(group):
                         text = 'From the water, the expedition has discovered a '
                     elif target_cell.terrain == 'water':
                         text = 'The expedition has discovered a '
-                    public_opinion_increase = random.randrange(0, 3)
+                    public_opinion_increase = constants.random_manager.get_stream('actions').randrange(0, 3)
                     if not target_cell.resource == 'none':
                         if target_cell.resource == 'natives':
                             text += target_cell.terrain.upper() + ' tile to the ' + cardinal_directions[current_direction] + ' that contains the village of ' + target_cell.village.name + '. /n /n'
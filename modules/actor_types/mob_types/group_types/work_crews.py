@@ -1,6 +1,7 @@
 #Contains functionality for work crews
 
-import random
+import bisect
+import itertools
 from ..groups import group
 from ....util import actor_utility, utility, market_utility
 import modules.constants.constants as constants
@@ -74,43 +75,121 @@ class work_crew(group):
         actor_utility.calibrate_actor_info_display(status.mob_info_display, None, override_exempt=True)
         self.select()
 
-    def attempt_production(self, building):
+    def get_production_outcome_weights(self):
         '''
         Description:
-            Attempts to produce commodities at a production building at the end of a turn. A work crew makes a number of rolls equal to the building's efficiency level, and each successful roll produces a unit of the building's
-                commodity. Each roll has a success chance based on the work crew's experience and its minister's skill/corruption levels. Promotes foreman to veteran on critical success
+            Returns the cumulative chances of each outcome of a single production attempt by this work crew, based on its experience and its minister's skill/corruption levels. A
+                production roll of 4+ on a D6 succeeds, with veterans rolling twice and keeping the higher result, and the minister may then steal the commodity
+        Input:
+            None
+        Output:
+            double list: Returns the cumulative chances of failing, producing a commodity, producing a commodity with a critical success, and having the commodity stolen, in order
+        '''
+        result_chances = self.controlling_minister.get_roll_result_chances(6)
+        if self.veteran: #chance of the higher of 2 rolls being at most each result is the chance of each roll being at most that result
+            cumulative_chances = list(itertools.accumulate(result_chances))
+            cumulative_chances = [current_chance ** 2 for current_chance in cumulative_chances]
+            result_chances = [cumulative_chances[0]] + [cumulative_chances[index] - cumulative_chances[index - 1] for index in range(1, 6)]
+            critical_chance = 0 #veterans can not be promoted
+        else:
+            critical_chance = result_chances[5]
+        success_chance = sum(result_chances[3:]) #4+ required on D6 for production
+        corruption_chance = self.controlling_minister.get_corruption_chance()
+        return(list(itertools.accumulate([
+            1 - success_chance,
+            (success_chance - critical_chance) * (1 - corruption_chance),
+            critical_chance * (1 - corruption_chance),
+            success_chance * corruption_chance
+        ])))
+
+    def get_case_outcome_chances(self, modifiers):
+        '''
+        Description:
+            Returns the chances of each outcome of a single production attempt by this work crew if its production rolls receive the inputted modifiers
+        Input:
+            int list modifiers: Modifier applied to each of this work crew's production rolls - veterans roll twice and keep the higher result
+        Output:
+            double list: Returns the chances of failing, producing a commodity, producing a commodity with a critical success, and having the commodity stolen, in order
+        '''
+        failure_chance = 1
+        for current_modifier in modifiers:
+            failure_chance *= len([die_result for die_result in range(1, 7) if min(6, max(1, die_result + current_modifier)) < 4]) / 6 #4+ required on D6 for production
+        success_chance = 1 - failure_chance
+        if self.veteran: #veterans can not be promoted
+            critical_chance = 0
+        else:
+            critical_chance = len([die_result for die_result in range(1, 7) if min(6, max(1, die_result + modifiers[0])) >= 6]) / 6
+        corruption_chance = self.controlling_minister.get_corruption_chance()
+        return([
+            failure_chance,
+            (success_chance - critical_chance) * (1 - corruption_chance),
+            critical_chance * (1 - corruption_chance),
+            success_chance * corruption_chance
+        ])
+
+    def print_production_modifiers(self, outcome, case_value):
+        '''
+        Description:
+            Prints the modifiers that this work crew's minister gave to the rolls of a production attempt with the inputted outcome, like an individual production roll does with the
+                show_modifiers effect active. The modifiers are chosen with their chances given the outcome, so the printed modifiers could have caused the outcome
+        Input:
+            int outcome: Index of the attempt's outcome in the production outcome weights
+            double case_value: Value between 0 and 1 used to choose the modifiers - the position of the attempt's random value within the range of values causing its outcome
+        Output:
+            None
+        '''
+        modifier_cases = self.controlling_minister.get_roll_modifier_cases()
+        if self.veteran:
+            roll_cases = [(first_chance * second_chance, [first_modifier, second_modifier], first_messages + second_messages)
+                for first_chance, first_modifier, first_messages in modifier_cases for second_chance, second_modifier, second_messages in modifier_cases]
+        else:
+            roll_cases = [(current_chance, [current_modifier], current_messages) for current_chance, current_modifier, current_messages in modifier_cases]
+        case_weights = list(itertools.accumulate([current_chance * self.get_case_outcome_chances(current_modifiers)[outcome] for current_chance, current_modifiers, current_messages in roll_cases]))
+        if case_weights[-1] > 0:
+            for current_message in roll_cases[min(len(roll_cases) - 1, bisect.bisect_right(case_weights, case_value * case_weights[-1]))][2]:
+                print(current_message)
+
+    def attempt_production(self, building, roll_values):
+        '''
+        Description:
+            Attempts to produce commodities at a production building at the end of a turn. A work crew makes a number of attempts equal to the building's efficiency level, and each successful attempt produces a unit of the building's
+                commodity. Each attempt has a success chance based on the work crew's experience and its minister's skill/corruption levels. Promotes foreman to veteran on critical success
         Input:
             building building: building in which this work crew is working
+            double iterator roll_values: Random values between 0 and 1 drawn for all of this work crew's minister's production attempts, from which one value is taken for each
+                of this work crew's attempts
         Output:
             None
         '''
         value_stolen = 0
-        if self.movement_points >= 1: #do not attempt production if unit already did something this turn or suffered from attrition #not self.temp_movement_disabled:
-            if not building.resource_type in constants.attempted_commodities:
-                constants.attempted_commodities.append(building.resource_type)
-            for current_attempt in range(building.efficiency):
-                if self.veteran:
-                    results = [self.controlling_minister.no_corruption_roll(6), self.controlling_minister.no_corruption_roll(6)]
-                    roll_result = max(results[0], results[1])
+        num_produced = 0
+        outcome_weights = self.get_production_outcome_weights()
+        for current_attempt in range(building.efficiency):
+            roll_value = next(roll_values) * outcome_weights[-1] #scaled by the total chance in case it was rounded below 1
+            outcome = bisect.bisect_right(outcome_weights, roll_value)
+            if constants.effect_manager.effect_active('show_modifiers'):
+                if outcome == 0:
+                    outcome_start = 0
                 else:
-                    roll_result = self.controlling_minister.no_corruption_roll(6)
-                    
-                if roll_result >= 4: #4+ required on D6 for production
-                    if not self.controlling_minister.check_corruption():
-                        building.cell.tile.change_inventory(building.resource_type, 1)
-                        constants.commodities_produced[building.resource_type] += 1
-
-                        if (not self.veteran) and roll_result >= 6:
-                            self.promote()
-                            message = 'The work crew working in the ' + building.name + ' at (' + str(building.cell.x) + ', ' + str(building.cell.y)
-                            message += ') has become a veteran and will be more successful in future production attempts. /n /n'
-                            constants.notification_manager.display_notification({
-                                'message': message,
-                                'zoom_destination': building.cell.tile,
-                            })
-                    else:
-                        value_stolen += constants.item_prices[building.resource_type]
-            if value_stolen > 0:
-                self.controlling_minister.steal_money(value_stolen, 'production') #minister steals value of commodities
-                if random.randrange(1, 7) <= 1: #1/6 chance
-                    market_utility.change_price(building.resource_type, -1)
+                    outcome_start = outcome_weights[outcome - 1]
+                self.print_production_modifiers(outcome, (roll_value - outcome_start) / (outcome_weights[outcome] - outcome_start))
+            if outcome in [1, 2]:
+                num_produced += 1
+                if outcome == 2:
+                    self.promote()
+                    outcome_weights = self.get_production_outcome_weights() #remaining attempts are made as a veteran
+                    message = 'The work crew working in the ' + building.name + ' at (' + str(building.cell.x) + ', ' + str(building.cell.y)
+                    message += ') has become a veteran and will be more successful in future production attempts. /n /n'
+                    constants.notification_manager.display_notification({
+                        'message': message,
+                        'zoom_destination': building.cell.tile,
+                    })
+            elif outcome == 3:
+                value_stolen += constants.item_prices[building.resource_type]
+        if num_produced > 0:
+            building.cell.tile.change_inventory(building.resource_type, num_produced)
+            constants.commodities_produced[building.resource_type] += num_produced
+        if value_stolen > 0:
+            self.controlling_minister.steal_money(value_stolen, 'production') #minister steals value of commodities
+            if constants.random_manager.get_stream('market').randrange(1, 7) <= 1: #1/6 chance
+                market_utility.change_price(building.resource_type, -1)
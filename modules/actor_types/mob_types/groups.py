@@ -1,6 +1,5 @@
 #Contains functionality for group units
 
-import random
 import math
 from .pmobs import pmob
 from ...util import actor_utility
@@ -142,7 +141,7 @@ class group(pmob):
         if current_cell.local_attrition():
             if transportation_minister.no_corruption_roll(6, 'health_attrition') == 1 or constants.effect_manager.effect_active('boost_attrition'):
                 worker_type = self.worker.worker_type
-                if (not worker_type in ['African', 'slave']) or random.randrange(1, 7) == 1:
+                if (not worker_type in ['African', 'slave']) or constants.random_manager.get_stream('attrition').randrange(1, 7) == 1:
                     self.attrition_death('worker')
 
     def attrition_death(self, target):
@@ -1,8 +1,6 @@
 #Contains functionality for wild beasts
 
-import random
 from ..npmobs import npmob
-from ....util import utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -33,7 +31,8 @@ class beast(npmob):
             None
         '''
         self.hidden = False
-        status.beast_list.append(self)
+        self.planned_target_steps = 'none'
+        status.beast_list.add(self)
         self.animal_type = input_dict['animal_type']
         self.adjective = input_dict['adjective']
         if self.adjective == 'king':
@@ -56,13 +55,14 @@ class beast(npmob):
             
         self.just_revealed = False
 
-    def get_movement_cost(self, x_change, y_change):
+    def get_movement_cost(self, x_change, y_change, local_cell = 'default'):
         '''
         Description:
             Returns the cost in movement points of moving by the inputted amounts. Unlike most mobs, beasts ignore terrain movement penalties and use their default movement cost regardless of terrain moved to
         Input:
             int x_change: How many cells would be moved to the right in the hypothetical movement
             int y_change: How many cells would be moved upward in the hypothetical movement
+            cell local_cell = 'default': Cell the hypothetical movement would start from, or 'default' to use this unit's current cell
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         '''
@@ -101,7 +101,7 @@ class beast(npmob):
         target_list = []
         current_cell = self.grids[0].find_cell(self.x, self.y)
         possible_cells = current_cell.adjacent_list + [current_cell]
-        if random.randrange(1, 7) >= 3 and not constants.effect_manager.effect_active('nine_mortal_men'): #1/3 chance of moving to pmob if present, 2/3 chance of moving randomly, possibly torward pmob but not necessarily
+        if constants.random_manager.get_stream('ai').randrange(1, 7) >= 3 and not constants.effect_manager.effect_active('nine_mortal_men'): #1/3 chance of moving to pmob if present, 2/3 chance of moving randomly, possibly torward pmob but not necessarily
             ignoring_pmobs = True
         else:
             ignoring_pmobs = False
@@ -120,7 +120,34 @@ class beast(npmob):
                             target_list.append(current_cell)
         if len(target_list) == 0:
             target_list.append(self.images[0].current_cell)
-        return(random.choice(target_list))
+        return(constants.random_manager.get_stream('ai').choice(target_list))
+
+    def find_target_steps(self):
+        '''
+        Description:
+            Returns the movement to the adjacent cell this beast chose to move to. Unlike other npmobs, beasts choose from adjacent cells rather than following the distance field.
+                The choice is remembered until this beast next moves, so checking where it will move does not change where it moves
+        Input:
+            None
+        Output:
+            int tuple list: Returns a list containing an (x_change, y_change) tuple, which is (0, 0) if this beast chose to stay in its current cell
+        '''
+        if self.planned_target_steps == 'none':
+            target_cell = self.find_closest_target()
+            self.planned_target_steps = [(target_cell.x - self.x, target_cell.y - self.y)]
+        return(self.planned_target_steps)
+
+    def reset_movement_points(self):
+        '''
+        Description:
+            Sets this beast's movement points to its maximum number of movement points at the end of the turn and forgets any movement it chose during the previous turn
+        Input:
+            None
+        Output:
+            None
+        '''
+        super().reset_movement_points()
+        self.planned_target_steps = 'none'
 
     def end_turn_move(self):
         '''
@@ -135,6 +162,7 @@ class beast(npmob):
         self.just_revealed = False
         self.set_hidden(True)
         super().end_turn_move()
+        self.planned_target_steps = 'none'
         if self.grids[0].find_cell(self.x, self.y).has_pmob():
             self.set_hidden(False)
 
@@ -174,7 +202,7 @@ class beast(npmob):
         Output:
             None
         '''
-        if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
+        if constants.random_manager.get_stream('ai').randrange(1, 7) == 1 and constants.random_manager.get_stream('ai').randrange(1, 7) == 1:
             self.remove_complete()
 
     def remove(self):
@@ -187,7 +215,7 @@ class beast(npmob):
             None
         '''
         super().remove()
-        status.beast_list = utility.remove_from_list(status.beast_list, self)
+        status.beast_list.remove(self)
 
     def damage_buildings(self):
         '''
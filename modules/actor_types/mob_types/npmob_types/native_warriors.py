@@ -1,6 +1,5 @@
 #Contains functionality for native warriors units
 
-import random
 from ..npmobs import npmob
 from ....util import utility
 import modules.constants.constants as constants
@@ -45,7 +44,7 @@ class native_warriors(npmob):
             self.set_max_movement_points(4)
             if not flags.creating_new_game:
                 self.hide_images() #show native warriors spawning in main_loop during enemy turn, except during setup
-            self.second_image_variant = random.randrange(0, len(self.image_variants))
+            self.second_image_variant = constants.random_manager.get_stream('appearance').randrange(0, len(self.image_variants))
         self.set_has_canoes(True)
 
     def attack_on_spawn(self):
@@ -66,7 +65,7 @@ class native_warriors(npmob):
                     if not cell.has_pmob() and not cell.y == 0: #can't retreat to ocean or into player units
                         possible_directions.append(direction)
             if len(possible_directions) > 0:
-                self.last_move_direction = random.choice(possible_directions)
+                self.last_move_direction = constants.random_manager.get_stream('ai').choice(possible_directions)
                 if flags.player_turn:
                     if self.grids[0].find_cell(self.x, self.y).get_best_combatant('pmob', self.npmob_type) == 'none':
                         self.kill_noncombatants()
@@ -104,7 +103,7 @@ class native_warriors(npmob):
         Output:
             None
         '''
-        if random.randrange(1, 7) >= 4 and random.randrange(1, 7) >= 4: #1/4 chance of despawn
+        if constants.random_manager.get_stream('ai').randrange(1, 7) >= 4 and constants.random_manager.get_stream('ai').randrange(1, 7) >= 4: #1/4 chance of despawn
             self.despawning = True
             self.origin_village.change_population(1)
 
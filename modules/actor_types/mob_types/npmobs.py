@@ -1,8 +1,7 @@
 #Contains functionality for non-player-controlled mobs
 
-import random
 from ..mobs import mob
-from ...util import utility, turn_management_utility
+from ...util import turn_management_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -45,7 +44,7 @@ class npmob(mob):
             self.last_move_direction = (0, 1)
         else:
             self.last_move_direction = (0, -1)
-        status.npmob_list.append(self)
+        status.npmob_list.add(self)
         self.turn_done = True
     
     def remove(self):
@@ -58,7 +57,7 @@ class npmob(mob):
             None
         '''
         super().remove()
-        status.npmob_list = utility.remove_from_list(status.npmob_list, self)
+        status.npmob_list.remove(self)
 
     def visible(self):
         '''
@@ -77,38 +76,17 @@ class npmob(mob):
             return(False)
         return(True)
 
-    def find_closest_target(self):
+    def find_target_steps(self):
         '''
         Description:
-            Find and returns one of the closest reachable pmobs or buildings
+            Finds and returns each movement that would bring this unit closer to one of the closest reachable pmobs or buildings. Rather than checking the distance to every pmob and
+                building, uses the target index's distance field, which records each cell's distance to its closest target and is shared by all npmobs
         Input:
             None
         Output:
-            string/actor: Returns one of the closest reachable pmobs or buildings, or returns 'none' if none are reachable
+            int tuple list: Returns a list of (x_change, y_change) tuples, which is [(0, 0)] if this unit is already at a target or empty if no targets are reachable
         '''
-        target_list = []
-        for current_building in status.building_list:
-            if current_building.can_damage() and not current_building.damaged:
-                target_list.append(current_building)
-        target_list += status.pmob_list
-        min_distance = -1
-        closest_targets = ['none']
-        for possible_target in target_list:
-            if (not possible_target.y == 0): #ignore units in the ocean if can't swim in ocean
-                if possible_target.actor_type == 'building' or not (possible_target.in_vehicle or possible_target.in_group or possible_target.in_building):
-                    distance = utility.find_grid_distance(self, possible_target)
-                    if distance <= self.aggro_distance: #will ignore player's units more than 6 tiles away
-                        if min_distance == -1 and (not distance == -1): #automatically choose first one to replace initial value
-                            min_distance = distance
-                            closest_targets = [possible_target]
-                        else:
-                            if not distance == -1: #if on same grid
-                                if distance < min_distance: #if closer than any previous, replace all previous
-                                    min_distance = distance
-                                    closest_targets = [possible_target]
-                                elif distance == min_distance: #if as close as previous, add as alternative to previous
-                                    closest_targets.append(possible_target)
-        return(random.choice(closest_targets)) #return one of the closest ones, or 'none' if none were found
+        return(constants.target_index_manager.find_steps(self.grids[0], self.x, self.y, self.aggro_distance)) #will ignore player's units more than aggro distance away
 
     def attempt_local_combat(self):
         '''
@@ -188,68 +166,31 @@ class npmob(mob):
             
     def end_turn_move(self):
         '''
-        Description: Moves this npmob towards pmobs and buildings at the end of the turn and schedules this npmob to start combat if any pmobs are encountered. Movement is weighted based on the distance on each axis, so movement towards a pmob
-            that is far to the north and slightly to the east will be more likely to move north than east. An npmob will use end_turn_move each time it moves during the enemy turn, which may happen multiple times depending on distance
-            moved
+        Description: Moves this npmob towards pmobs and buildings at the end of the turn and schedules this npmob to start combat if any pmobs are encountered. Each step moves to an adjacent cell
+            that is closer to the closest target, choosing randomly between equally good cells. An npmob will use end_turn_move each time it moves during the enemy turn, which may happen multiple
+            times depending on distance moved
         Input:
             None
         Output:
             None
         '''
-        closest_target = self.find_closest_target()
-        if self.npmob_type == 'native_warriors' and random.randrange(1, 7) <= 3: #half chance of moving randomly instead
+        if self.npmob_type == 'native_warriors' and constants.random_manager.get_stream('ai').randrange(1, 7) <= 3: #half chance of moving randomly instead
             if not self.visible():
                 current_cell = self.grids[0].find_cell(self.x, self.y)
             else:
                 current_cell = self.images[0].current_cell
-            closest_target = random.choice(current_cell.adjacent_list)
-            while closest_target.y == 0: #npmobs avoid the ocean if can't swim in ocean
-                closest_target = random.choice(current_cell.adjacent_list)
-        if not closest_target == 'none':
-            if not (closest_target.x == self.x and closest_target.y == self.y): #don't move if target is own tile
-                if closest_target.x > self.x: #decides moving left or right
-                    horizontal_multiplier = 1
-                elif closest_target.x == self.x:
-                    horizontal_multiplier = 0
-                else:
-                    horizontal_multiplier = -1
-
-                if closest_target.y > self.y: #decides moving up or down
-                    vertical_multiplier = 1
-                elif closest_target.y == self.y:
-                    vertical_multiplier = 0
-                else:
-                    vertical_multiplier = -1
-
-
-                if horizontal_multiplier == 0:
-                    if not vertical_multiplier == 0:
-                        #while self.movement_points > 0:
-                        if self.movement_points >= self.get_movement_cost(0, 1 * vertical_multiplier):
-                            self.move(0, 1 * vertical_multiplier)
-                        else:
-                            self.movement_points -= 1
-                elif vertical_multiplier == 0:
-                    #while self.movement_points > 0:
-                    if self.movement_points >= self.get_movement_cost(1 * horizontal_multiplier, 0):
-                        self.move(1 * horizontal_multiplier, 0)
-                    else:
-                        self.movement_points -= 1
+            random_cell = constants.random_manager.get_stream('ai').choice(current_cell.adjacent_list)
+            while random_cell.y == 0: #npmobs avoid the ocean if can't swim in ocean
+                random_cell = constants.random_manager.get_stream('ai').choice(current_cell.adjacent_list)
+            target_steps = [(random_cell.x - self.x, random_cell.y - self.y)]
+        else:
+            target_steps = self.find_target_steps()
+        if len(target_steps) > 0:
+            x_change, y_change = constants.random_manager.get_stream('ai').choice(target_steps)
+            if not (x_change == 0 and y_change == 0): #don't move if already at target
+                if self.movement_points >= self.get_movement_cost(x_change, y_change):
+                    self.move(x_change, y_change)
                 else:
-                    horizontal_difference = abs(self.x - closest_target.x) #decides moving left/right or up/down
-                    vertical_difference = abs(self.y - closest_target.y)
-                    total_difference = horizontal_difference + vertical_difference #if horizontal is 3 and vertical is 2, move horizontally if random from 1 to 5 is 3 or lower: 60% chance of moving horizontally, 40% of moving vertically
-                    if random.randrange(0, total_difference + 1) <= horizontal_difference: #allows weighting of movement to be more likely to move along more different axis
-                        if self.movement_points >= self.get_movement_cost(1 * horizontal_multiplier, 0):
-                            self.move(1 * horizontal_multiplier, 0)
-                        else:
-                            self.movement_points -= 1
-                    else:
-                        if self.movement_points >= self.get_movement_cost(0, 1 * vertical_multiplier):
-                            self.move(0, 1 * vertical_multiplier)
-                        else:
-                            self.movement_points -= 1
-                if horizontal_multiplier == 0 and vertical_multiplier == 0:
                     self.movement_points -= 1
             else:
                 self.movement_points -= 1
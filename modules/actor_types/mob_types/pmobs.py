@@ -1,7 +1,6 @@
 #Contains functionality for player-controlled mobs
 
 import pygame
-import random
 from ..mobs import mob
 from ...util import text_utility, utility, actor_utility, minister_utility, game_transitions
 import modules.constants.constants as constants
@@ -35,16 +34,19 @@ class pmob(mob):
                 'base_automatic_route': int tuple list value - Required if from save, list of the coordinates in this unit's automatic movement route, with the first coordinates being the start and the last being the end. List empty if
                     no automatic movement route has been designated
                 'in_progress_automatic_route': string/int tuple list value - Required if from save, list of the coordinates and string commands this unit will execute, changes as the route is executed
+                'movement_destination': string or int tuple value - Optional if from save, 'none' if no go to order, otherwise coordinates this unit is moving towards over multiple turns
                 'inventory': dictionary value - This actor's initial items carried, with an integer value corresponding to amount of each item type 
                 'equipment': dictionary value - This actor's initial items equipped, with a boolean value corresponding to whether each type of equipment is equipped
         Output:
             None
         '''
         self.sentry_mode = False
+        self.movement_destination = 'none'
         super().__init__(from_save, input_dict)
         self.selection_outline_color = 'bright green'
-        status.pmob_list.append(self)
+        status.pmob_list.add(self)
         self.is_pmob = True
+        constants.target_index_manager.invalidate()
         self.set_controlling_minister_type('none')
         self.equipment = input_dict.get('equipment', {})
         if from_save:
@@ -52,6 +54,8 @@ class pmob(mob):
                 end_turn_destination_x, end_turn_destination_y = input_dict['end_turn_destination']
                 end_turn_destination_grid = getattr(status, input_dict['end_turn_destination_grid_type'])
                 self.end_turn_destination = end_turn_destination_grid.find_cell(end_turn_destination_x, end_turn_destination_y).tile
+            if input_dict.get('movement_destination', 'none') != 'none':
+                self.movement_destination = tuple(input_dict['movement_destination'])
             self.default_name = input_dict['default_name']
             self.set_name(self.default_name)
             self.set_sentry_mode(input_dict['sentry_mode'])
@@ -92,6 +96,7 @@ class pmob(mob):
                 'base_automatic_route': int tuple list value - List of the coordinates in this unit's automatic movement route, with the first coordinates being the start and the last being the end. List empty if
                     no automatic movement route has been designated
                 'in_progress_automatic_route': string/int tuple list value - List of the coordinates and string commands this unit will execute, changes as the route is executed
+                'movement_destination': string or int tuple value - 'none' if no go to order, otherwise coordinates this unit is moving towards over multiple turns
                 'automatically_replace': boolean value  Whether this unit or any of its components should be replaced automatically in the event of attrition
                 'equipment': dictionary value - This actor's items equipped, with a boolean value corresponding to whether each type of equipment is equipped
         '''
@@ -108,6 +113,7 @@ class pmob(mob):
         save_dict['in_turn_queue'] = (self in status.player_turn_queue)
         save_dict['base_automatic_route'] = self.base_automatic_route
         save_dict['in_progress_automatic_route'] = self.in_progress_automatic_route
+        save_dict['movement_destination'] = self.movement_destination
         save_dict['automatically_replace'] = self.automatically_replace
         save_dict['equipment'] = self.equipment
         return(save_dict)
@@ -158,6 +164,25 @@ class pmob(mob):
         if self == status.displayed_mob:
             actor_utility.calibrate_actor_info_display(status.mob_info_display, self)
 
+    def add_path_to_automatic_route(self, new_coordinates):
+        '''
+        Description:
+            Adds each step of the least costly route from the end of this unit's automated movement route to the inputted coordinates, allowing a route to be drawn between distant
+                tiles without choosing each tile along the way
+        Input:
+            int tuple new_coordinates: New x and y coordinates to end the route at
+        Output:
+            boolean: Returns whether a route to the inputted coordinates was found and added
+        '''
+        path = constants.pathfinding_manager.find_path(self, new_coordinates, self.base_automatic_route[-1])
+        if path == 'none':
+            return(False)
+        self.base_automatic_route += path
+        self.calculate_automatic_route()
+        if self == status.displayed_mob:
+            actor_utility.calibrate_actor_info_display(status.mob_info_display, self)
+        return(True)
+
     def calculate_automatic_route(self):
         '''
         Description:
@@ -244,6 +269,49 @@ class pmob(mob):
                 
         return(progressed) #returns whether unit did anything to show unit in movement routes report
 
+    def set_movement_destination(self, new_destination):
+        '''
+        Description:
+            Orders this unit to move to the inputted coordinates over as many turns as needed, following the least costly route. The route is found again before each movement,
+                allowing it to avoid enemies and use new roads
+        Input:
+            string/int tuple new_destination: Two values representing the x and y coordinates to move to, or 'none' to cancel this unit's go to order
+        Output:
+            None
+        '''
+        self.movement_destination = new_destination
+        if new_destination != 'none':
+            self.remove_from_turn_queue()
+        if self == status.displayed_mob:
+            actor_utility.calibrate_actor_info_display(status.mob_info_display, self)
+
+    def follow_movement_destination(self):
+        '''
+        Description:
+            Moves along the least costly route to this unit's go to destination until it arrives or cannot complete the next step, such as from running out of movement points.
+                The go to order is cancelled once this unit arrives, or if no route exists
+        Input:
+            None
+        Output:
+            boolean: Returns whether this unit moved
+        '''
+        progressed = False
+        if self.movement_destination == 'none':
+            return(progressed)
+        path = constants.pathfinding_manager.find_path(self, self.movement_destination)
+        if path == 'none':
+            text_utility.print_to_screen('The ' + self.name + ' can no longer find a route to (' + str(self.movement_destination[0]) + ', ' + str(self.movement_destination[1]) + ').')
+            self.set_movement_destination('none')
+            return(progressed)
+        for next_x, next_y in path:
+            if self.in_vehicle or not self.can_move(next_x - self.x, next_y - self.y, False): #stops if out of movement points, blocked, or embarked on a ship along the way
+                break
+            self.move(next_x - self.x, next_y - self.y)
+            progressed = True
+        if (self.x, self.y) == self.movement_destination or self.in_vehicle:
+            self.set_movement_destination('none')
+        return(progressed)
+
     def get_next_automatic_stop(self):
         '''
         Description:
@@ -355,7 +423,7 @@ class pmob(mob):
         Output:
             None
         '''
-        if (not self.sentry_mode) and self.movement_points > 0 and self.end_turn_destination == 'none' and not self in status.player_turn_queue:
+        if (not self.sentry_mode) and self.movement_points > 0 and self.end_turn_destination == 'none' and self.movement_destination == 'none' and not self in status.player_turn_queue:
             if not self in status.player_turn_queue:
                 status.player_turn_queue.append(self)
 
@@ -404,7 +472,7 @@ class pmob(mob):
                 worker_type = 'none'
                 if self.is_worker:
                     worker_type = self.worker_type
-                if (not worker_type in ['African', 'slave']) or random.randrange(1, 7) <= 2:
+                if (not worker_type in ['African', 'slave']) or constants.random_manager.get_stream('attrition').randrange(1, 7) <= 2:
                     self.attrition_death()
 
     def attrition_death(self, show_notification = True):
@@ -469,12 +537,13 @@ class pmob(mob):
                 current_tile.change_inventory(current_commodity, self.get_inventory(current_commodity))
         self.remove_from_turn_queue()
         super().remove()
-        status.pmob_list = utility.remove_from_list(status.pmob_list, self)
+        status.pmob_list.remove(self)
+        constants.target_index_manager.invalidate()
 
     def draw_outline(self):
         '''
         Description:
-            Draws a flashing outline around this mob if it is selected, also shows its end turn destination, if any
+            Draws a flashing outline around this mob if it is selected, also shows its end turn destination and go to destination, if any
         Input:
             None
         Output:
@@ -507,6 +576,14 @@ class pmob(mob):
                 if not equivalent_tile == 'none':
                     equivalent_tile.draw_destination_outline()
 
+            if (not self.movement_destination == 'none') and self.grids[0] == status.strategic_map_grid:
+                destination_tile = self.grids[0].find_cell(self.movement_destination[0], self.movement_destination[1]).tile
+                if destination_tile.images[0].can_show():
+                    destination_tile.draw_destination_outline()
+                equivalent_tile = destination_tile.get_equivalent_tile()
+                if not equivalent_tile == 'none':
+                    equivalent_tile.draw_destination_outline()
+
     def set_controlling_minister_type(self, new_type):
         '''
         Description:
@@ -717,6 +794,7 @@ class pmob(mob):
         if not flags.loading_save:
             self.movement_sound()
         self.clear_automatic_route()
+        self.set_movement_destination('none')
 
     def disembark_vehicle(self, vehicle, focus = True):
         '''
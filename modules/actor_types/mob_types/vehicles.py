@@ -1,6 +1,5 @@
 #Contains functionality for vehicle units
 
-import random
 
 from .pmobs import pmob
 from ...util import text_utility, actor_utility
@@ -134,9 +133,9 @@ class vehicle(pmob):
                 worker_type = current_sub_mob.worker_type
             elif current_sub_mob.is_group:
                 worker_type = current_sub_mob.worker.worker_type
-            if current_cell.local_attrition() and random.randrange(1, 7) >= 4: #vehicle removes 1/2 of attrition, slightly less than forts, ports, etc.
+            if current_cell.local_attrition() and constants.random_manager.get_stream('attrition').randrange(1, 7) >= 4: #vehicle removes 1/2 of attrition, slightly less than forts, ports, etc.
                 if transportation_minister.no_corruption_roll(6, 'health_attrition') == 1 or constants.effect_manager.effect_active('boost_attrition'):
-                    if (not worker_type in ['African', 'slave']) or random.randrange(1, 7) == 1: #only 1/6 chance of continuing attrition for African workers, others automatically continue
+                    if (not worker_type in ['African', 'slave']) or constants.random_manager.get_stream('attrition').randrange(1, 7) == 1: #only 1/6 chance of continuing attrition for African workers, others automatically continue
                         if current_sub_mob == self.crew: #if crew died of attrition
                             crew = self.crew
                             if not current_sub_mob.automatically_replace:
@@ -144,7 +143,7 @@ class vehicle(pmob):
                                 self.eject_crew()
                             self.crew_attrition_death(crew)
                         elif current_sub_mob.is_group: #if group passenger died of attrition
-                            attrition_unit_type = random.choice(['officer', 'worker'])
+                            attrition_unit_type = constants.random_manager.get_stream('attrition').choice(['officer', 'worker'])
                             current_sub_mob.attrition_death(attrition_unit_type)
 
                         else: #if non-group passenger died of attrition
@@ -412,6 +411,7 @@ class train(vehicle):
         self.vehicle_type = 'train'
         self.can_swim = False
         self.can_walk = True
+        self.uniform_movement_cost = True
         if not from_save:
             actor_utility.calibrate_actor_info_display(status.mob_info_display, self)
 
@@ -435,13 +435,14 @@ class train(vehicle):
                 return(False)
         return(result)
 
-    def get_movement_cost(self, x_change, y_change):
+    def get_movement_cost(self, x_change, y_change, local_cell = 'default'):
         '''
         Description:
             Returns the cost in movement points of moving by the inputted amounts. Unlike most pmobs, trains use their default movement cost to move to all railroad tiles
         Input:
             int x_change: How many cells would be moved to the right in the hypothetical movement
             int y_change: How many cells would be moved upward in the hypothetical movement
+            cell local_cell = 'default': Cell the hypothetical movement would start from, or 'default' to use this unit's current cell
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         '''
@@ -575,15 +576,17 @@ class boat(ship):
         self.can_swim_river = True
         self.can_swim_ocean = False
         self.can_walk = False
+        self.uniform_movement_cost = True
         self.travel_possible = False
 
-    def get_movement_cost(self, x_change, y_change):
+    def get_movement_cost(self, x_change, y_change, local_cell = 'default'):
         '''
         Description:
             Returns the cost in movement points of moving by the inputted amounts. Unlike most pmobs, steamboats use their default movement cost to move to all water or port tiles
         Input:
             int x_change: How many cells would be moved to the right in the hypothetical movement
             int y_change: How many cells would be moved upward in the hypothetical movement
+            cell local_cell = 'default': Cell the hypothetical movement would start from, or 'default' to use this unit's current cell
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         '''
@@ -1,5 +1,4 @@
 #Contains functionality for worker units
-import random
 
 from .pmobs import pmob
 from ...util import actor_utility
@@ -45,7 +44,7 @@ class worker(pmob):
         self.set_controlling_minister_type(constants.type_minister_dict['production'])
 
         if not from_save:
-            self.second_image_variant = random.randrange(0, len(self.image_variants))
+            self.second_image_variant = constants.random_manager.get_stream('appearance').randrange(0, len(self.image_variants))
         self.update_image_bundle()
         if not from_save:
             if ('select_on_creation' in input_dict) and input_dict['select_on_creation']:
@@ -76,7 +75,7 @@ class worker(pmob):
                 new_worker_source = actor_utility.find_closest_available_worker(destination)
                 if new_worker_source != 'none':
                     if new_worker_source in status.village_list: #both village and slum have change_population, but slum change population automatically changes number of workers while village does not
-                        new_worker_source.available_workers -= 1
+                        new_worker_source.change_available_workers(-1)
                     new_worker_source.change_population(-1)
 
                     if new_worker_source in status.village_list:
@@ -247,7 +246,7 @@ class worker(pmob):
             for variant_type in ['soldier', 'porter']: #adds image_dict['soldier']: '.../soldier.png' and image_dict['porter']: '.../porter.png' if any are present in folders
                 variants = actor_utility.get_image_variants(self.image_dict['default'], keyword = variant_type)
                 if len(variants) > 0:
-                    self.image_dict[variant_type] = random.choice(variants)
+                    self.image_dict[variant_type] = constants.random_manager.get_stream('appearance').choice(variants)
         super().image_variants_setup(from_save, input_dict)
 
     def get_image_id_list(self, override_values={}):
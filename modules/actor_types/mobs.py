@@ -64,7 +64,9 @@ class mob(actor):
         self.status_icons = []
         for current_grid in self.grids:
             self.images.append(images.mob_image(self, current_grid.get_cell_width(), current_grid.get_cell_height(), current_grid, 'default'))
-        status.mob_list.append(self)
+        status.mob_list.add(self)
+        for current_grid in self.grids:
+            constants.actor_registry_manager.add_to_index('grid', current_grid, self)
         self.set_name(input_dict['name'])
         self.can_swim = False #if can enter water areas without ships in them
         self.can_swim_river = False
@@ -74,6 +76,7 @@ class mob(actor):
         self.max_movement_points = 1
         self.movement_points = self.max_movement_points
         self.movement_cost = 1
+        self.uniform_movement_cost = False #if each movement costs the same, regardless of terrain and infrastructure
         self.has_infinite_movement = False
         self.temp_movement_disabled = False
         #self.default_interface_tab = 'reorganization'
@@ -105,7 +108,7 @@ class mob(actor):
         self.image_variants = actor_utility.get_image_variants(self.image_dict['default'])
         if self.image_dict['default'].endswith('default.png') and not from_save:
             if not from_save:
-                self.image_variant = random.randrange(0, len(self.image_variants))
+                self.image_variant = constants.random_manager.get_stream('appearance').randrange(0, len(self.image_variants))
                 self.image_dict['default'] = self.image_variants[self.image_variant]
         elif from_save and 'image_variant' in input_dict:
             self.image_variant = input_dict['image_variant']
@@ -306,21 +309,23 @@ class mob(actor):
                     return(True)
         return(False)
 
-    def get_movement_cost(self, x_change, y_change):
+    def get_movement_cost(self, x_change, y_change, local_cell = 'default'):
         '''
         Description:
             Returns the cost in movement points of moving by the inputted amounts. Only works when one inputted amount is 0 and the other is 1 or -1, with 0 and -1 representing moving 1 cell downward
         Input:
             int x_change: How many cells would be moved to the right in the hypothetical movement
             int y_change: How many cells would be moved upward in the hypothetical movement
+            cell local_cell = 'default': Cell the hypothetical movement would start from, or 'default' to use this mob's current cell
         Output:
             double: How many movement points would be spent by moving by the inputted amount
         '''
         cost = self.movement_cost
-        if not (self.is_npmob and not self.visible()):
-            local_cell = self.images[0].current_cell
-        else:
-            local_cell = self.grids[0].find_cell(self.x, self.y)
+        if local_cell == 'default':
+            if not (self.is_npmob and not self.visible()):
+                local_cell = self.images[0].current_cell
+            else:
+                local_cell = self.grids[0].find_cell(self.x, self.y)
 
         
         direction = 'none'
@@ -491,11 +496,15 @@ class mob(actor):
         old_image_id = self.images[0].image_id
         for current_image in self.images:
             current_image.remove_from_cell()
+        for current_grid in self.grids:
+            constants.actor_registry_manager.remove_from_index('grid', current_grid, self)
         self.grids = [new_grid]
         self.grid = new_grid
         if new_grid.mini_grid != 'none':
             new_grid.mini_grid.calibrate(new_coordinates[0], new_coordinates[1])
             self.grids.append(new_grid.mini_grid)
+        for current_grid in self.grids:
+            constants.actor_registry_manager.add_to_index('grid', current_grid, self)
         self.images = []
         for current_grid in self.grids:
             self.images.append(images.mob_image(self, current_grid.get_cell_width(), current_grid.get_cell_height(), current_grid, old_image_id))
@@ -662,7 +671,9 @@ class mob(actor):
         for current_image in self.images:
             current_image.remove_from_cell()
         super().remove()
-        status.mob_list = utility.remove_from_list(status.mob_list, self)
+        status.mob_list.remove(self)
+        for current_grid in self.grids:
+            constants.actor_registry_manager.remove_from_index('grid', current_grid, self)
         for current_status_icon in self.status_icons:
             current_status_icon.remove_complete()
         self.status_icons = []
@@ -939,7 +950,7 @@ class mob(actor):
             boolean: True if any of this mob's images is colliding with the mouse, otherwise return False
         '''
         for current_image in self.images:
-            if current_image.Rect.collidepoint(pygame.mouse.get_pos()): #if mouse is in image
+            if current_image.Rect.collidepoint(constants.mouse_position): #if mouse is in image
                 if not (current_image.grid == status.minimap_grid and not current_image.grid.is_on_mini_grid(self.x, self.y)): #do not consider as touching mouse if off-map
                     return(True)
         return(False)
@@ -1,7 +1,6 @@
 #Contains functionality for tiles and other cell icons
 
 import pygame
-import random
 from ..constructs import images, villages
 from ..util import utility, actor_utility, main_loop_utility, text_utility
 from .actors import actor
@@ -160,7 +159,7 @@ class tile(actor): #to do: make terrain tiles a subclass
                 commodity_types = self.get_held_commodities()
                 amount_removed = 0
                 while amount_removed < amount_to_remove:
-                    commodity_removed = random.choice(commodity_types)
+                    commodity_removed = constants.random_manager.get_stream('attrition').choice(commodity_types)
                     if self.get_inventory(commodity_removed) > 0:
                         self.change_inventory(commodity_removed, -1)
                         amount_removed += 1
@@ -281,10 +280,13 @@ class tile(actor): #to do: make terrain tiles a subclass
         Output:
             None
         '''
-        if override_image:
+        if self.grid.is_mini_grid and self.grid.sampling_attached_terrain: #minimap terrain is scaled from the strategic map, so minimap tiles do not need their own images
+            pass
+        elif override_image:
             self.set_image(override_image)
         else:
             self.set_image(self.get_image_id_list())
+        self.cell.invalidate_terrain()
         if self.grid == status.strategic_map_grid:
             equivalent_tile = self.get_equivalent_tile()
             if equivalent_tile != 'none':
@@ -2,12 +2,19 @@ import pygame
 from typing import Dict, List
 from modules.tools.data_managers.sound_manager_template import sound_manager_template
 from modules.tools.data_managers.save_load_manager_template import save_load_manager_template
+from modules.tools.data_managers.save_slot_manager_template import save_slot_manager_template
 from modules.tools.data_managers.flavor_text_manager_template import flavor_text_manager_template
 from modules.tools.data_managers.input_manager_template import input_manager_template
 from modules.tools.data_managers.actor_creation_manager_template import actor_creation_manager_template
 from modules.tools.data_managers.event_manager_template import event_manager_template
 from modules.tools.data_managers.effect_manager_template import effect_manager_template
 from modules.tools.data_managers.notification_manager_template import notification_manager_template
+from modules.tools.data_managers.surface_cache_manager_template import surface_cache_manager_template
+from modules.tools.data_managers.hit_test_manager_template import hit_test_manager_template
+from modules.tools.data_managers.random_manager_template import random_manager_template
+from modules.tools.data_managers.target_index_manager_template import target_index_manager_template
+from modules.tools.data_managers.pathfinding_manager_template import pathfinding_manager_template
+from modules.tools.data_managers.actor_registry_manager_template import actor_registry_manager_template
 from modules.tools.data_managers.value_tracker_template import value_tracker_template, public_opinion_tracker_template, money_tracker_template
 from modules.tools.mouse_followers import mouse_follower_template
 from modules.interface_types.labels import money_label_template
@@ -44,12 +51,20 @@ game_display: pygame.Surface = pygame.display.set_mode((display_width, display_h
 
 sound_manager: sound_manager_template = sound_manager_template()
 save_load_manager: save_load_manager_template = save_load_manager_template()
+save_slot_manager: save_slot_manager_template = save_slot_manager_template(num_slots=10, num_autosave_slots=3) #chooses save slots and keeps an index of summaries of saved games
 flavor_text_manager: flavor_text_manager_template = flavor_text_manager_template()
 input_manager: input_manager_template = input_manager_template()
 actor_creation_manager: actor_creation_manager_template = actor_creation_manager_template()
 event_manager: event_manager_template = event_manager_template()
 effect_manager: effect_manager_template = effect_manager_template()
 notification_manager: notification_manager_template = None #requires additional setup before initialization
+combined_surface_cache: surface_cache_manager_template = surface_cache_manager_template(memory_budget=32 * 1024 * 1024) #shares image bundle surfaces between bundles with identical contents
+text_surface_cache: surface_cache_manager_template = surface_cache_manager_template(memory_budget=8 * 1024 * 1024) #reuses rendered text surfaces for labels, tooltips, the text box, etc.
+hit_test_manager: hit_test_manager_template = hit_test_manager_template(bucket_size=64) #finds the buttons, cells, actors, and free images under the mouse
+random_manager: random_manager_template = random_manager_template(['terrain', 'ai', 'combat', 'actions', 'attrition', 'corruption', 'market', 'migration', 'lore', 'appearance'])
+target_index_manager: target_index_manager_template = target_index_manager_template() #finds the pmobs and buildings closest to each npmob
+pathfinding_manager: pathfinding_manager_template = pathfinding_manager_template() #finds the least costly routes for pmobs
+actor_registry_manager: actor_registry_manager_template = actor_registry_manager_template() #indexes actors by grid, building type, and available workers
 mouse_follower: mouse_follower_template = None
 
 turn: int = 0
@@ -80,6 +95,7 @@ end_turn_wait_time: float = 0.8
 
 old_mouse_x: int = pygame.mouse.get_pos()[0]
 old_mouse_y: int = pygame.mouse.get_pos()[1]
+mouse_position: tuple = pygame.mouse.get_pos() #sampled once per frame by main_loop
 
 font_name: str = 'times new roman'
 default_font_size: int = 15
@@ -88,6 +104,7 @@ default_notification_font_size: int = 25
 notification_font_size: float = None
 myfont: font = None
 fonts: Dict[str, font] = {}
+max_calculated_sizes: int = 2048 #number of message widths each font remembers before forgetting them
 
 default_music_volume: float = 0.5
 
@@ -237,6 +254,15 @@ terrain_movement_cost_dict: Dict[str, int] = {
     'swamp': 3,
     'desert': 2
 }
+terrain_id_list: List[str] = list(terrain_movement_cost_dict) #terrain with each id in grids' terrain arrays
+infrastructure_mask_dict: Dict[str, int] = { #bit for each intact building type in grids' infrastructure arrays
+    'road': 1,
+    'railroad': 2,
+    'bridge': 4,
+    'port': 8,
+    'train_station': 16,
+    'vertical_bridge': 32 #bridge that connects the cells above and below it, rather than to its left and right
+}
 terrain_build_cost_multiplier_dict: Dict[str, int] = {
     'savannah': 1,
     'hills': 2,
@@ -25,3 +25,9 @@ capital: bool = False
 r_ctrl: bool = False
 l_ctrl: bool = False
 ctrl: bool = False
+full_redraw: bool = True
+tooltips_checked: bool = False
+interface_visibility_outdated: bool = True
+headless: bool = False
+hide_grid_lines: bool = False #whether the hide_grid_lines effect is active, updated by the effect manager
+track_fps: bool = False #whether the track_fps effect is active, updated by the effect manager
@@ -29,6 +29,7 @@ from modules.constructs.lore_missions import lore_mission
 from modules.util.market_utility import loan
 from modules.action_types.action import action
 from modules.tools.effects import effect
+from modules.tools.data_managers.actor_registry_manager_template import actor_registry
 
 strategic_map_grid: grid = None
 minimap_grid: mini_grid = None
@@ -56,6 +57,8 @@ displayed_notification: notification = None
 
 rendered_images: Dict[str, pygame.Surface] = {}
 button_list: List[button] = []
+keybind_button_dict: Dict[int, List[button]] = {} #buttons bound to each key code, in the same order as button_list
+pressed_button_list: List[button] = [] #buttons currently being pressed with their keybinds
 recruitment_button_list: List[button] = []
 instructions_list: List[str] = []
 minister_list: List[minister] = []
@@ -70,16 +73,16 @@ free_image_list: List[free_image] = []
 minister_image_list: List[Any] = []
 available_minister_portrait_list: List[button] = []
 
-actor_list: List[actor] = []
-mob_list: List[mob] = []
-pmob_list: List[pmob] = []
-npmob_list: List[npmob] = []
-beast_list: List[beast] = []
-village_list: List[village] = []
-settlement_list: List[settlement] = []
-building_list: List[building] = []
-slums_list: List[slums] = []
-resource_building_list: List[resource_building] = []
+actor_list: actor_registry = actor_registry()
+mob_list: actor_registry = actor_registry()
+pmob_list: actor_registry = actor_registry()
+npmob_list: actor_registry = actor_registry()
+beast_list: actor_registry = actor_registry()
+village_list: actor_registry = actor_registry()
+settlement_list: actor_registry = actor_registry()
+building_list: actor_registry = actor_registry()
+slums_list: actor_registry = actor_registry()
+resource_building_list: actor_registry = actor_registry()
 loan_list: List[loan] = []
 attacker_queue: List[npmob] = []
 enemy_turn_queue: List[npmob] = []
@@ -87,6 +90,8 @@ player_turn_queue: List[pmob] = []
 independent_interface_elements: List[Any] = []
 dice_list: List[die] = []
 draw_list: List[Any] = []
+dirty_rects: List[pygame.Rect] = []
+tooltip_rects: List[pygame.Rect] = []
 lore_mission_list: List[lore_mission] = []
 same_tile_icon_list: List[same_tile_icon] = []
 
@@ -1,6 +1,5 @@
 #Contains functionality for timed function call events
 
-from ..util import utility
 import modules.constants.constants as constants
 
 class event():
@@ -19,6 +18,7 @@ class event():
         self.function = function
         self.inputs = inputs
         self.activation_time = activation_time
+        self.deadline = 0.0 #set by event manager when scheduled
         self.event_manager = event_manager
 
     def activate(self):
@@ -53,8 +53,7 @@ class event():
         Output:
             None
         '''
-        if self in self.event_manager.event_list:
-            self.event_manager.event_list = utility.remove_from_list(self.event_manager.event_list, self)
+        self.event_manager.cancel(self)
 
 class repeating_event(event):
     '''
@@ -1,6 +1,7 @@
 #Contains wrapper for pygame font
 
 import pygame
+from collections import OrderedDict
 import modules.constants.constants as constants
 
 class font():
@@ -24,18 +25,27 @@ class font():
             input_dict = {}
         if input_dict.get('descriptor', None):
             constants.fonts[input_dict['descriptor']] = self
-        self.pygame_font = pygame.font.SysFont(input_dict.get('name', constants.font_name), input_dict.get('size', constants.font_size))
+        self.name = input_dict.get('name', constants.font_name)
+        self.pygame_font = pygame.font.SysFont(self.name, input_dict.get('size', constants.font_size))
         self.color = input_dict.get('color', 'black')
         self.size = input_dict.get('size', constants.font_size)
+        self.calculated_sizes = OrderedDict() #ordered from least to most recently used
     
     def calculate_size(self, message):
         '''
         Description:
-            Wrapper for pygame.font.size, calculates and returns the pixel width of the inputted string in this font
+            Wrapper for pygame.font.size, calculates and returns the pixel width of the inputted string in this font. Widths are remembered for up to max_calculated_sizes messages,
+                forgetting the least recently used message first
         Input:
             string message: Message for which to calculate length
         Output:
             int: Returns pixel width of resulting message
         '''
-        return(self.pygame_font.size(message)[0])
+        if message in self.calculated_sizes:
+            self.calculated_sizes.move_to_end(message)
+        else:
+            if len(self.calculated_sizes) >= constants.max_calculated_sizes: #forget the least recently used width rather than growing indefinitely as messages change
+                self.calculated_sizes.popitem(last=False)
+            self.calculated_sizes[message] = self.pygame_font.size(message)[0]
+        return(self.calculated_sizes[message])
         
\ No newline at end of file
@@ -1,7 +1,7 @@
 #Contains functionality for images
 
 import pygame
-from ..util import utility, drawing_utility, text_utility, scaling
+from ..util import utility, drawing_utility, text_utility, scaling, traversal_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -49,10 +49,23 @@ class image():
         Output:
             boolean: Returns True if this image is colliding with the mouse, otherwise returns False
         '''
-        if self.Rect != 'none' and self.Rect.collidepoint(pygame.mouse.get_pos()): #if mouse is in button
+        if self.Rect != 'none' and self.Rect.collidepoint(constants.mouse_position): #if mouse is in button
             return(True)
         else:
             return(False)
+
+    def get_hit_test_rects(self):
+        '''
+        Description:
+            Returns the Rects used to find whether this image is under a pixel location in the hit test index
+        Input:
+            None
+        Output:
+            pygame.Rect list: Returns this image's Rect, if any
+        '''
+        if self.Rect == 'none':
+            return([])
+        return([self.Rect])
         
     def remove_complete(self):
         '''
@@ -156,12 +169,16 @@ class image_bundle(image):
         self.members = []
         if isinstance(image_id_list, list):
             for current_image_id in image_id_list:
-                self.add_member(current_image_id)
+                self.add_member(current_image_id, update_combined_surface=False)
+            self.combined_surface = self.generate_combined_surface()
         else:
             if image_id_list.contains_bundle:
                 image_id_list = image_id_list.image
             self.members = image_id_list.members
-            self.combined_surface = pygame.transform.scale(image_id_list.combined_surface, (self.width, self.height))
+            if image_id_list.combined_surface.get_size() == (self.width, self.height): #copies of the same size can share a surface
+                self.combined_surface = image_id_list.combined_surface
+            else:
+                self.combined_surface = pygame.transform.scale(image_id_list.combined_surface, (self.width, self.height))
         self.scale()
 
     def copy(self):
@@ -189,13 +206,14 @@ class image_bundle(image):
         for member in self.members:
             member.scale()
 
-    def add_member(self, image_id, member_type = 'default'):
+    def add_member(self, image_id, member_type = 'default', update_combined_surface = True):
         '''
         Description:
             Adds a new member image to this bundle
         Input:
             string/dictionary image_id: String image file path or offset image dictionary that defines the member added
             string member_type = 'default': Optional string to designate this member's type, allowing it to be specifically removed or found based on type later
+            boolean update_combined_surface = True: Whether to update the combined surface - if multiple members are being added, optimal to only update after the last one
         '''
         if isinstance(image_id, str):
             new_member = bundle_image(self, image_id, member_type)
@@ -205,18 +223,41 @@ class image_bundle(image):
         while index < len(self.members) and self.members[index].level <= new_member.level: #inserts at back of same level
             index += 1
         self.members.insert(index, new_member)
-        self.combined_surface = self.generate_combined_surface()
+        if update_combined_surface:
+            self.combined_surface = self.generate_combined_surface()
+
+    def get_signature(self):
+        '''
+        Description:
+            Returns a key describing this bundle's appearance, which is the same for any bundles that would have identical combined surfaces
+        Input:
+            None
+        Output:
+            tuple/string: Returns a tuple of this bundle's size and each of its members' signatures, or 'none' if any member can not be described by a signature
+        '''
+        member_signatures = []
+        for member in self.members:
+            member_signature = member.get_signature()
+            if member_signature == 'none':
+                return('none')
+            member_signatures.append(member_signature)
+        return((self.width, self.height, tuple(member_signatures)))
 
     def generate_combined_surface(self):
         '''
         Description:
-            Creates and returns a surface that is a combination of each of this bundle's images - allows all images to be drawn with only one blit per frame
+            Creates and returns a surface that is a combination of each of this bundle's images - allows all images to be drawn with only one blit per frame. Bundles with identical
+                signatures share the same surface through the combined surface cache
         Input:
             None
         Output:
             pygame.Surface: Returns a Pygame Surface that is a combination of each of this bundle's images
         '''
-        #this is running whenever image is set, even if being set to same image as another bundle
+        signature = self.get_signature()
+        if signature != 'none':
+            cached_surface = constants.combined_surface_cache.get(signature)
+            if cached_surface != 'none':
+                return(cached_surface)
         combined_surface = pygame.Surface((self.width, self.height)) #has strange interaction with smoke effects
         combined_surface.fill(constants.color_dict['transparent'])
         combined_surface.set_colorkey(constants.color_dict['transparent'], pygame.RLEACCEL)
@@ -229,6 +270,8 @@ class image_bundle(image):
                     blit_sequence.append((member.image, (0, 0)))
         if blit_sequence:
             combined_surface.blits(blit_sequence)
+        if signature != 'none':
+            constants.combined_surface_cache.set(signature, combined_surface)
         return(combined_surface)
 
     def complete_draw(self):
@@ -370,6 +413,28 @@ class bundle_image():
             self.load()
         self.scale()
 
+    def get_signature(self):
+        '''
+        Description:
+            Returns a key describing this member's appearance within its bundle, including its image id, offsets, size, level, and green screen colors
+        Input:
+            None
+        Output:
+            tuple/string: Returns a tuple of the values that determine this member's appearance, or 'none' if it was given a surface rather than an image id
+        '''
+        if type(self.image_id) == pygame.Surface: #surfaces can not be compared by content without reading every pixel
+            return('none')
+        if not self.is_offset:
+            return((self.image_id,))
+        font_signature = 'none'
+        if hasattr(self, 'font'):
+            font_signature = (id(self.font.pygame_font), self.font.color)
+        green_screen_signature = 'none'
+        if self.has_green_screen:
+            green_screen_signature = tuple([current_color if type(current_color) == str else tuple(current_color) for current_color in self.green_screen_colors])
+        return((self.image_id, self.x_size, self.y_size, self.x_offset, self.y_offset, self.level, getattr(self, 'override_width', 'none'), getattr(self, 'override_height', 'none'),
+            getattr(self, 'free', False), green_screen_signature, font_signature))
+
     def get_blit_x_offset(self):
         '''
         Description:
@@ -450,20 +515,15 @@ class bundle_image():
                     print(full_image_id)
                     self.image = pygame.image.load(full_image_id)
                 self.image.convert()
-                if self.is_offset and self.has_green_screen:
-                    width, height = self.image.get_size()
+                if self.is_offset and self.has_green_screen: #recolored images are stored with their colors in the key, so each combination is only recolored once
                     index = 0
                     for current_green_screen_color in constants.green_screen_colors:
                         if index < len(self.green_screen_colors):
                             if type(self.green_screen_colors[index]) == str: #like 'red'
-                                replace_with = self.bundle.constants.color_dict[self.green_screen_colors[index]]
+                                replace_with = constants.color_dict[self.green_screen_colors[index]]
                             else: #like (255, 0, 0)
                                 replace_with = self.green_screen_colors[index]
-                            for x in range(width):
-                                for y in range(height):
-                                    current_color = self.image.get_at((x, y))
-                                    if current_color[0] == current_green_screen_color[0] and current_color[1] == current_green_screen_color[1] and current_color[2] == current_green_screen_color[2]:
-                                        self.image.set_at((x, y), (replace_with[0], replace_with[1], replace_with[2], current_color[3])) #preserves alpha value
+                            drawing_utility.replace_color(self.image, current_green_screen_color, replace_with) #preserves alpha value
                         index += 1
             else:
                 self.text = True
@@ -518,6 +578,7 @@ class free_image(image):
 
         self.to_front = input_dict.get('to_front', False)
         status.free_image_list.append(self)
+        traversal_utility.invalidate_interface_visibility()
 
     def calibrate(self, new_actor):
         return
@@ -532,11 +593,15 @@ class free_image(image):
         Output:
             None
         '''
+        if hasattr(self, 'x'):
+            drawing_utility.mark_image_dirty(self)
         self.x = new_x
         self.y = constants.display_height - new_y
         if hasattr(self, 'Rect') and self.Rect != 'none':
             self.Rect.x = self.x
             self.Rect.y = constants.display_height - (new_y + self.height)
+            constants.hit_test_manager.invalidate('free images', self)
+        drawing_utility.mark_image_dirty(self)
         if self.has_parent_collection:
             self.x_offset = new_x - self.parent_collection.x
             self.y_offset = new_y - self.parent_collection.y
@@ -587,8 +652,12 @@ class free_image(image):
             None
         '''
         super().remove()
+        if self.showing: #removed images are no longer traversed, so they report their regions here
+            drawing_utility.mark_image_dirty(self)
         status.independent_interface_elements = utility.remove_from_list(status.independent_interface_elements, self)
         status.free_image_list = utility.remove_from_list(status.free_image_list, self)
+        constants.hit_test_manager.remove('free images', self)
+        traversal_utility.invalidate_interface_visibility()
 
     def remove_recursive(self, complete=False):
         '''
@@ -613,6 +682,8 @@ class free_image(image):
         Output:
             None
         '''
+        if hasattr(self, 'x'):
+            drawing_utility.mark_image_dirty(self)
         if isinstance(new_image, image_bundle):
             self.contains_bundle = True
             self.image = new_image.copy()
@@ -733,6 +804,7 @@ class tooltip_free_image(free_image):
         super().__init__(input_dict)
         self.Rect = pygame.Rect(self.x, constants.display_height - (self.y + self.height), self.width, self.height)
         self.Rect.y = self.y - self.height
+        constants.hit_test_manager.invalidate('free images', self)
         self.tooltip_text = []
         self.update_tooltip()
 
@@ -795,7 +867,7 @@ class tooltip_free_image(free_image):
         '''
         if self.can_show():
             self.update_tooltip()
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = constants.mouse_position
             if below_screen:
                 mouse_y = constants.display_height + 10 - height
             if beyond_screen:
@@ -1102,6 +1174,48 @@ class loading_image_template(free_image):
         '''
         return(True)
 
+class save_thumbnail_image(free_image):
+    '''
+    Image showing the map thumbnail of a saved game from the save index, used when choosing a saved game to load
+    '''
+    def __init__(self, input_dict):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            dictionary input_dict: Keys corresponding to the values needed to initialize this object
+                'file_name': string value - File name of the saved game whose thumbnail is shown
+                'image_id': string value - File path to the image shown if the saved game has no thumbnail
+                'coordinates' = (0, 0): int tuple value - Two values representing x and y coordinates for the pixel location of this image
+                'width': int value - Pixel width of this image
+                'height': int value - Pixel height of this image
+                'modes': string list value - Game modes during which this image can appear
+        Output:
+            None
+        '''
+        self.file_name = input_dict['file_name']
+        super().__init__(input_dict)
+
+    def set_image(self, new_image):
+        '''
+        Description:
+            Changes this image to the saved game's thumbnail, or to the inputted image file path if the saved game has no thumbnail
+        Input:
+            string new_image: Image file path to use if the saved game has no thumbnail
+        Output:
+            None
+        '''
+        thumbnail_surface = constants.save_slot_manager.get_thumbnail_surface(self.file_name, self.width, self.height)
+        if thumbnail_surface == 'none': #saves found by rebuilding the index have no thumbnail
+            super().set_image(new_image)
+        else:
+            if hasattr(self, 'x'):
+                drawing_utility.mark_image_dirty(self)
+            self.image_id = self.file_name #not drawn if left as the empty image
+            self.contains_bundle = False
+            self.text = False
+            self.image = thumbnail_surface
+
 class actor_image(image):
     '''
     Image that is attached to an actor and a grid, representing the actor on a certain grid. An actor will have a different actor_image for each grid on which it appears
@@ -1136,6 +1250,7 @@ class actor_image(image):
             grid_x = self.actor.x
             grid_y = self.actor.y
         self.go_to_cell((grid_x, grid_y))
+        constants.hit_test_manager.invalidate('actors', self.actor)
         self.set_tooltip('')
         self.change_with_other_images = True #determines whether set_image function of actor affects this image
 
@@ -1162,6 +1277,8 @@ class actor_image(image):
         Output:
             None
         '''
+        if self.Rect != 'none':
+            drawing_utility.mark_dirty(self.Rect)
         if isinstance(new_image_description, str) and new_image_description in self.actor.image_dict:
             self.image_description = new_image_description
             self.image_id = self.actor.image_dict[new_image_description]
@@ -1228,8 +1345,10 @@ class actor_image(image):
             None
         '''
         self.x, self.y = self.grid.convert_coordinates(coordinates)
-        self.Rect.x = self.x
-        self.Rect.y = self.y - self.height
+        if self.Rect.x != self.x or self.Rect.y != self.y - self.height: #go_to_cell is called each time this image is drawn, so only update the hit test index if it moved
+            self.Rect.x = self.x
+            self.Rect.y = self.y - self.height
+            constants.hit_test_manager.invalidate('actors', self.actor)
         self.outline.x = self.x
         self.outline.y = self.y - self.height
         if self.contains_bundle:
@@ -1303,6 +1422,9 @@ class mob_image(actor_image):
         '''
         if not self.current_cell in ['none', None]:
             self.current_cell.contained_mobs = utility.remove_from_list(self.current_cell.contained_mobs, self.actor)
+            drawing_utility.mark_dirty(self.current_cell.Rect)
+            if self.actor.is_pmob:
+                constants.target_index_manager.invalidate()
         self.current_cell = 'none'
 
     def add_to_cell(self):
@@ -1331,6 +1453,10 @@ class mob_image(actor_image):
             if not self.actor in self.current_cell.contained_mobs and not (self.actor.in_group or self.actor.in_vehicle or self.actor.in_building):
                 self.current_cell.contained_mobs.insert(0, self.actor)
             self.go_to_cell((self.current_cell.x, self.current_cell.y))
+        if self.current_cell != 'none':
+            drawing_utility.mark_dirty(self.current_cell.Rect)
+        if self.actor.is_pmob: #npmobs may now find this unit in a different location
+            constants.target_index_manager.invalidate()
             
     def can_show(self, skip_parent_collection=False):
         '''
@@ -1402,6 +1528,8 @@ class button_image(actor_image):
         Output:
             None
         '''
+        if hasattr(self, 'Rect'):
+            drawing_utility.mark_dirty(self.Rect)
         self.image_id = new_image_id
         if isinstance(self.image_id, str): #if set to string image path
             self.contains_bundle = False
@@ -1494,10 +1622,29 @@ class tile_image(actor_image):
             None
         '''
         self.x, self.y = self.grid.convert_coordinates(coordinates)
-        self.Rect.x = self.x
-        self.Rect.y = self.y - self.height
+        if self.Rect.x != self.x or self.Rect.y != self.y - self.height:
+            self.Rect.x = self.x
+            self.Rect.y = self.y - self.height
+            constants.hit_test_manager.invalidate('actors', self.actor)
         self.outline.x = self.x - self.outline_width
         self.outline.y = self.y - (self.height + self.outline_width)
+
+    def reuse_image(self, image_id, image):
+        '''
+        Description:
+            Changes this image to show an already generated image of the same size without generating a new one, like when a minimap cell scrolls to show a tile previously shown by another cell
+        Input:
+            string/list image_id: Image file path or image path list that the inputted image was generated from
+            image/pygame.Surface image: Already generated image to show, which is transferred to this image rather than copied
+        Output:
+            None
+        '''
+        drawing_utility.mark_dirty(self.Rect)
+        self.image_id = image_id
+        self.image = image
+        self.contains_bundle = isinstance(image, image_bundle)
+        if self.contains_bundle:
+            self.image.parent_image = self
         
     def draw(self):
         '''
@@ -1512,3 +1659,21 @@ class tile_image(actor_image):
             return() #do not show if resource icon in undiscovered tile
         self.go_to_cell((self.actor.x, self.actor.y))
         self.complete_draw()
+
+    def draw_to_surface(self, surface, origin):
+        '''
+        Description:
+            Draws this image onto the inputted surface rather than the screen, like its grid's terrain layer
+        Input:
+            pygame.Surface surface: Surface to draw this image onto
+            int tuple origin: Two values representing the pixel coordinates of the surface's top left corner on the screen
+        Output:
+            None
+        '''
+        if self.actor.name == 'resource icon' and not self.actor.cell.visible:
+            return() #do not show if resource icon in undiscovered tile
+        self.go_to_cell((self.actor.x, self.actor.y))
+        if self.contains_bundle:
+            surface.blit(self.image.combined_surface, (self.x - origin[0], self.y - self.image.height - origin[1]))
+        elif self.image_id != 'misc/empty.png':
+            surface.blit(self.image, (self.x - origin[0], self.y - self.height - origin[1]))
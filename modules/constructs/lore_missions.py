@@ -1,6 +1,5 @@
 #Contains functionality for lore missions
 
-import random
 from ..util import utility
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -42,11 +41,11 @@ class lore_mission():
                     self.artifact_location = new_possible_artifact_location
             self.confirmed_all_locations_revealed = input_dict['confirmed_all_locations_revealed']
         else:
-            self.lore_type = random.choice(constants.lore_types)
-            self.artifact_type = random.choice(constants.lore_types_artifact_dict[self.lore_type])
-            self.adjective = random.choice(constants.lore_types_adjective_dict[self.lore_type])
+            self.lore_type = constants.random_manager.get_stream('lore').choice(constants.lore_types)
+            self.artifact_type = constants.random_manager.get_stream('lore').choice(constants.lore_types_artifact_dict[self.lore_type])
+            self.adjective = constants.random_manager.get_stream('lore').choice(constants.lore_types_adjective_dict[self.lore_type])
             self.name = self.adjective + self.artifact_type
-            num_possible_artifact_locations = random.randrange(1, 7)
+            num_possible_artifact_locations = constants.random_manager.get_stream('lore').randrange(1, 7)
             while len(self.possible_artifact_locations) < num_possible_artifact_locations:
 
                 new_possible_artifact_location = possible_artifact_location(False, {
@@ -59,7 +58,7 @@ class lore_mission():
             for current_village in status.village_list:
                 current_village.found_rumors = False
             self.confirmed_all_locations_revealed = False
-            self.artifact_location = random.choice(self.possible_artifact_locations)
+            self.artifact_location = constants.random_manager.get_stream('lore').choice(self.possible_artifact_locations)
             text = 'A new ' + self.lore_type + ' mission has been issued by the ' + status.current_country.government_type_adjective.capitalize() + ' Geographical Society'
             text += ' to find the ' + self.name + '. /n /n'
             text += 'Expeditions may search villages for rumors regarding the ' + self.name + ', possibly revealing locations where it can be found. /n /n'
@@ -110,9 +109,9 @@ class lore_mission():
         used_coordinates = []
         for current_possible_artifact_location in self.possible_artifact_locations:
             used_coordinates.append((current_possible_artifact_location.x, current_possible_artifact_location.y))
-        possible_coordinates = (random.randrange(0, constants.strategic_map_width), random.randrange(1, constants.strategic_map_height))
+        possible_coordinates = (constants.random_manager.get_stream('lore').randrange(0, constants.strategic_map_width), constants.random_manager.get_stream('lore').randrange(1, constants.strategic_map_height))
         while possible_coordinates in used_coordinates: #would cause infinite loop if too many possible locations existed
-            possible_coordinates = (random.randrange(0, constants.strategic_map_width), random.randrange(1, constants.strategic_map_height))
+            possible_coordinates = (constants.random_manager.get_stream('lore').randrange(0, constants.strategic_map_width), constants.random_manager.get_stream('lore').randrange(1, constants.strategic_map_height))
         return(possible_coordinates)
 
     def remove_complete(self):
@@ -168,9 +167,9 @@ class lore_mission():
         '''
         if self.get_num_revealed_possible_artifact_locations() == len(self.possible_artifact_locations):
             return('none')
-        current_possible_artifact_location = random.choice(self.possible_artifact_locations)
+        current_possible_artifact_location = constants.random_manager.get_stream('lore').choice(self.possible_artifact_locations)
         while current_possible_artifact_location.revealed or current_possible_artifact_location.proven_false:
-            current_possible_artifact_location = random.choice(self.possible_artifact_locations)
+            current_possible_artifact_location = constants.random_manager.get_stream('lore').choice(self.possible_artifact_locations)
         return(current_possible_artifact_location)
 
     def has_revealed_possible_artifact_location(self, x, y):
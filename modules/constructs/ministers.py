@@ -74,14 +74,14 @@ class minister():
             else:
                 status.available_minister_list.append(self)
         else:
-            self.background: str = random.choice(constants.weighted_backgrounds)
+            self.background: str = constants.random_manager.get_stream('corruption').choice(constants.weighted_backgrounds)
             self.first_name: str
             self.last_name: str
             self.first_name, self.last_name = constants.flavor_text_manager.generate_minister_name(self.background)
             self.name = self.first_name + ' ' + self.last_name
             self.status_number: int = constants.background_status_dict[self.background]
             self.status: str = status_number_dict[self.status_number]
-            self.personal_savings: float = 5 ** (self.status_number - 1) + random.randrange(0, 6) #1-6 for lowborn, 5-10 for middle, 25-30 for high, 125-130 for very high
+            self.personal_savings: float = 5 ** (self.status_number - 1) + constants.random_manager.get_stream('corruption').randrange(0, 6) #1-6 for lowborn, 5-10 for middle, 25-30 for high, 125-130 for very high
             self.current_position: str = 'none'
             self.skill_setup()
             self.voice_setup()
@@ -452,7 +452,7 @@ class minister():
         if (predetermined_corruption or self.check_corruption()):
             if not self.stolen_already: #true if stealing
                 self.steal_money(value, roll_type)
-            result = random.randrange(max_crit_fail + 1, min_success) #if crit fail on 1 and success on 4+, do random.randrange(2, 4), pick between 2 and 3
+            result = constants.random_manager.get_stream('corruption').randrange(max_crit_fail + 1, min_success) #if crit fail on 1 and success on 4+, do randrange(2, 4), pick between 2 and 3
 
         if result < min_result:
             result = min_result
@@ -476,7 +476,7 @@ class minister():
         '''
         min_result = 1
         max_result = num_sides
-        result = random.randrange(1, num_sides + 1) + self.get_roll_modifier(roll_type)
+        result = constants.random_manager.get_stream('corruption').randrange(1, num_sides + 1) + self.get_roll_modifier(roll_type)
         result = max(min_result, result)
         result = min(max_result, result)
         return(result)
@@ -499,7 +499,7 @@ class minister():
         if self.check_corruption() and value > 0:
             self.steal_money(value, roll_type)
             self.stolen_already = True
-            corrupt_index = random.randrange(0, num_dice)
+            corrupt_index = constants.random_manager.get_stream('corruption').randrange(0, num_dice)
             for i in range(num_dice): #num_sides, min_success, max_crit_fail, value, roll_type, predetermined_corruption = False
                 if i == corrupt_index: #if rolling multiple dice, choose one of the dice randomly and make it the corrupt result, making it a non-critical failure
                     results.append(self.roll(num_sides, min_success, max_crit_fail, value, 'none', True)) #use roll_type none because roll is fake, does not apply modifiers
@@ -532,21 +532,21 @@ class minister():
                 results.append(0)
             difference = 10
             while difference >= 2: #keep rolling until a combination of attacker and defender rolls with an inconclusive result is found
-                own_roll = random.randrange(1, 7)
-                enemy_roll = random.randrange(1, 7)
+                own_roll = constants.random_manager.get_stream('corruption').randrange(1, 7)
+                enemy_roll = constants.random_manager.get_stream('corruption').randrange(1, 7)
                 difference = abs((own_roll + own_modifier) - (enemy_roll + enemy_modifier))
-            corrupt_index = random.randrange(0, num_dice)
+            corrupt_index = constants.random_manager.get_stream('corruption').randrange(0, num_dice)
             for i in range(num_dice):
                 if i == corrupt_index: #if rolling multiple dice, choose one of the dice randomly to be the chosen result, with the others being lower
                     results[i] = own_roll
                 else:
-                    results[i] = random.randrange(1, own_roll + 1) # if own_roll is 1, range is 1-2 non-inclusive, always chooses 1
+                    results[i] = constants.random_manager.get_stream('corruption').randrange(1, own_roll + 1) # if own_roll is 1, range is 1-2 non-inclusive, always chooses 1
             results = [enemy_roll] + results #inserts enemy roll at beginning
 
         else: #if not corrupt, just roll with minister modifier
             for i in range(num_dice):
                 results.append(self.no_corruption_roll(6, roll_type))
-            enemy_roll = random.randrange(1, 7)
+            enemy_roll = constants.random_manager.get_stream('corruption').randrange(1, 7)
             results = [enemy_roll] + results
         self.stolen_already = False
         return(results)
@@ -605,15 +605,15 @@ class minister():
         Output:
             None
         '''
-        self.general_skill = random.randrange(1, 4) #1-3, general skill as in all fields, not military
+        self.general_skill = constants.random_manager.get_stream('corruption').randrange(1, 4) #1-3, general skill as in all fields, not military
         self.specific_skills = {}
         self.apparent_skills = {}
         self.apparent_skill_descriptions = {}
-        background_skill = random.choice(constants.background_skills_dict[self.background])
+        background_skill = constants.random_manager.get_stream('corruption').choice(constants.background_skills_dict[self.background])
         if background_skill == 'random':
-            background_skill = random.choice(constants.skill_types)
+            background_skill = constants.random_manager.get_stream('corruption').choice(constants.skill_types)
         for current_minister_type in constants.minister_types:
-            self.specific_skills[current_minister_type] = random.randrange(0, 4) #0-3
+            self.specific_skills[current_minister_type] = constants.random_manager.get_stream('corruption').randrange(0, 4) #0-3
             if constants.minister_type_dict[current_minister_type] == background_skill and (self.specific_skills[current_minister_type] + self.general_skill) < 6:
                 self.specific_skills[current_minister_type] += 1
             if constants.effect_manager.effect_active('transparent_ministers'):
@@ -680,12 +680,12 @@ class minister():
                 highest_skill_number = self.specific_skills[type_minister_dict[current_skill]]
             elif self.specific_skills[type_minister_dict[current_skill]] == highest_skill_number:
                 highest_skills.append(current_skill)
-        first_interest = random.choice(highest_skills)
+        first_interest = constants.random_manager.get_stream('corruption').choice(highest_skills)
         second_interest = first_interest
         while second_interest == first_interest:
-            second_interest = random.choice(constants.skill_types)
+            second_interest = constants.random_manager.get_stream('corruption').choice(constants.skill_types)
 
-        if random.randrange(1, 7) >= 4:
+        if constants.random_manager.get_stream('corruption').randrange(1, 7) >= 4:
             self.interests = (first_interest, second_interest)
         else:
             self.interests = (second_interest, first_interest)
@@ -699,7 +699,7 @@ class minister():
         Output:
             None
         '''
-        self.corruption = random.randrange(1, 7) #1-6
+        self.corruption = constants.random_manager.get_stream('corruption').randrange(1, 7) #1-6
         self.corruption_threshold = 10 - self.corruption #minimum roll on D6 required for corruption to occur
         
         if constants.effect_manager.effect_active('transparent_ministers'):
@@ -774,7 +774,7 @@ class minister():
             None
         '''
         if prosecutor == 'none':
-            roll_result = random.randrange(1, 7) - random.randrange(0, 2) #as if done by a prosecutor with a negative skill modifier
+            roll_result = constants.random_manager.get_stream('corruption').randrange(1, 7) - constants.random_manager.get_stream('corruption').randrange(0, 2) #as if done by a prosecutor with a negative skill modifier
         else:
             roll_result = prosecutor.no_corruption_roll(6)
 
@@ -785,7 +785,7 @@ class minister():
 
         if roll_result < 5: #5+ accuracy roll
             for i in range(3):
-                apparent_value += random.randrange(-1, 2)
+                apparent_value += constants.random_manager.get_stream('corruption').randrange(-1, 2)
 
         apparent_value = max(apparent_value, 1)
         apparent_value = min(apparent_value, 6)
@@ -800,7 +800,7 @@ class minister():
                             self.stolen_money += self.personal_savings
                             self.personal_savings = 0
                         prosecutor.steal_money(bribe_cost, 'bribery')
-                        apparent_value = random.randrange(1, 4)
+                        apparent_value = constants.random_manager.get_stream('corruption').randrange(1, 4)
             self.set_apparent_corruption(apparent_value)
         else:
             self.set_apparent_skill(rumor_type, apparent_value)
@@ -834,8 +834,8 @@ class minister():
             return_value = True
         elif constants.effect_manager.effect_active('ministry_of_magic') or (constants.effect_manager.effect_active('lawbearer') and self == status.current_ministers['Prosecutor']):
             return_value = False
-        elif random.randrange(1, 7) >= self.corruption_threshold:
-            if random.randrange(1, 7) >= constants.fear: #higher fear reduces chance of exceeding threshold and stealing
+        elif constants.random_manager.get_stream('corruption').randrange(1, 7) >= self.corruption_threshold:
+            if constants.random_manager.get_stream('corruption').randrange(1, 7) >= constants.fear: #higher fear reduces chance of exceeding threshold and stealing
                 return_value = True
             else:
                 if constants.effect_manager.effect_active('show_fear'):
@@ -845,6 +845,23 @@ class minister():
             return_value = False
         return(return_value)
 
+    def get_corruption_chance(self):
+        '''
+        Description:
+            Returns the chance that check_corruption returns True for this minister, allowing many rolls to be resolved at once
+        Input:
+            None
+        Output:
+            double: Returns the chance that this minister will be corrupt for a roll
+        '''
+        if constants.effect_manager.effect_active('band_of_thieves') or ((constants.effect_manager.effect_active('lawbearer') and self != status.current_ministers['Prosecutor'])):
+            return(1.0)
+        elif constants.effect_manager.effect_active('ministry_of_magic') or (constants.effect_manager.effect_active('lawbearer') and self == status.current_ministers['Prosecutor']):
+            return(0.0)
+        threshold_chance = min(1, max(0, (7 - self.corruption_threshold) / 6)) #chance of rolling at least corruption threshold on D6
+        fear_chance = min(1, max(0, (7 - constants.fear) / 6)) #chance of rolling at least fear on D6
+        return(threshold_chance * fear_chance)
+
     def gain_experience(self):
         '''
         Description:
@@ -871,7 +888,7 @@ class minister():
         if self.no_corruption_roll(6) >= 4:
             return(base)
         else:
-            multiplier = random.randrange(80, 121)
+            multiplier = constants.random_manager.get_stream('corruption').randrange(80, 121)
             multiplier /= 100
             if allow_decimals:
                 return(round(base * multiplier, 2))
@@ -912,7 +929,7 @@ class minister():
             return(5)
         elif constants.effect_manager.effect_active('nine_mortal_men'):
             return(-10)
-        if random.randrange(1, 3) == 1: #half chance to apply skill modifier, otherwise return 0
+        if constants.random_manager.get_stream('corruption').randrange(1, 3) == 1: #half chance to apply skill modifier, otherwise return 0
             modifier += self.get_skill_modifier()
             if constants.effect_manager.effect_active('show_modifiers'):
                 if modifier >= 0:
@@ -922,7 +939,7 @@ class minister():
         if constants.effect_manager.effect_active(roll_type + '_plus_modifier'):
             if not (roll_type == 'construction' and status.displayed_mob.officer.officer_type != 'engineer'):
                 # Exclude non-construction gang units from construction modifiers
-                if random.randrange(1, 3) == 1:
+                if constants.random_manager.get_stream('corruption').randrange(1, 3) == 1:
                     modifier += 1
                     if constants.effect_manager.effect_active('show_modifiers'):
                         print('Country gave modifier of +1 to ' + roll_type + ' roll.')
@@ -931,7 +948,7 @@ class minister():
         elif constants.effect_manager.effect_active(roll_type + '_minus_modifier'):
             if not (roll_type == 'construction' and status.displayed_mob.officer.officer_type != 'engineer'):
                 # Exclude non-construction gang units from construction modifiers
-                if random.randrange(1, 3) == 1:
+                if constants.random_manager.get_stream('corruption').randrange(1, 3) == 1:
                     modifier -= 1
                     if constants.effect_manager.effect_active('show_modifiers'):
                         print('Country gave modifier of -1 to ' + roll_type + ' roll.')
@@ -939,6 +956,78 @@ class minister():
                     print('Country attempted to give -1 modifier to ' + roll_type + ' roll.')
         return(modifier)
 
+    def get_roll_modifier_cases(self, roll_type = 'none'):
+        '''
+        Description:
+            Returns each way that get_roll_modifier could decide the modifier for a given roll, along with its chance and the messages get_roll_modifier prints for it when the
+                show_modifiers effect is active, allowing many rolls to be resolved at once
+        Input:
+            string roll_type = 'none': Type of roll being done, used to apply action-specific modifiers
+        Output:
+            list: Returns a list of (chance, modifier, message list) tuples, one for each way the modifier could be decided
+        '''
+        if constants.effect_manager.effect_active('ministry_of_magic') or (constants.effect_manager.effect_active('lawbearer') and self == status.current_ministers['Prosecutor']):
+            return([(1.0, 5, [])])
+        elif constants.effect_manager.effect_active('nine_mortal_men'):
+            return([(1.0, -10, [])])
+        skill_modifier = self.get_skill_modifier()
+        if skill_modifier >= 0:
+            skill_message = 'Minister gave modifier of +' + str(skill_modifier) + ' to ' + roll_type + ' roll.'
+        else:
+            skill_message = 'Minister gave modifier of ' + str(skill_modifier) + ' to ' + roll_type + ' roll.'
+        modifier_cases = [(0.5, 0, []), (0.5, skill_modifier, [skill_message])] #half chance to apply skill modifier
+        country_modifier = 0
+        if not (roll_type == 'construction' and status.displayed_mob.officer.officer_type != 'engineer'):
+            if constants.effect_manager.effect_active(roll_type + '_plus_modifier'):
+                country_modifier = 1
+            elif constants.effect_manager.effect_active(roll_type + '_minus_modifier'):
+                country_modifier = -1
+        if country_modifier != 0: #half chance to apply country modifier
+            if country_modifier > 0:
+                applied_message = 'Country gave modifier of +1 to ' + roll_type + ' roll.'
+                unapplied_message = 'Country attempted to give +1 modifier to ' + roll_type + ' roll.'
+            else:
+                applied_message = 'Country gave modifier of -1 to ' + roll_type + ' roll.'
+                unapplied_message = 'Country attempted to give -1 modifier to ' + roll_type + ' roll.'
+            previous_modifier_cases = modifier_cases
+            modifier_cases = []
+            for current_chance, current_modifier, current_messages in previous_modifier_cases:
+                modifier_cases.append((current_chance / 2, current_modifier, current_messages + [unapplied_message]))
+                modifier_cases.append((current_chance / 2, current_modifier + country_modifier, current_messages + [applied_message]))
+        return(modifier_cases)
+
+    def get_roll_modifier_chances(self, roll_type = 'none'):
+        '''
+        Description:
+            Returns the chance of each modifier that get_roll_modifier could apply to a given roll, allowing many rolls to be resolved at once
+        Input:
+            string roll_type = 'none': Type of roll being done, used to apply action-specific modifiers
+        Output:
+            dictionary: Returns a dictionary of the chance of each possible modifier, with the possible modifiers as keys
+        '''
+        modifier_chances = {}
+        for current_chance, current_modifier, current_messages in self.get_roll_modifier_cases(roll_type):
+            modifier_chances[current_modifier] = modifier_chances.get(current_modifier, 0) + current_chance
+        return(modifier_chances)
+
+    def get_roll_result_chances(self, num_sides, roll_type = 'none'):
+        '''
+        Description:
+            Returns the chance of each result of no_corruption_roll with the inputted number of sides, allowing many rolls to be resolved at once
+        Input:
+            int num_sides: Number of sides on the die rolled
+            string roll_type = 'none': Type of roll being done, used to apply action-specific modifiers
+        Output:
+            double list: Returns a list of the chance of each result, with the chance of a result of 1 at index 0
+        '''
+        result_chances = [0.0] * num_sides
+        modifier_chances = self.get_roll_modifier_chances(roll_type)
+        for die_result in range(1, num_sides + 1):
+            for current_modifier in modifier_chances:
+                result = min(num_sides, max(1, die_result + current_modifier))
+                result_chances[result - 1] += modifier_chances[current_modifier] / num_sides
+        return(result_chances)
+
     def remove_complete(self):
         '''
         Description:
@@ -993,7 +1082,7 @@ class minister():
         
         if event == 'first hired':
             if self.status_number >= 3:
-                public_opinion_change = self.status_number + random.randrange(-1, 2)
+                public_opinion_change = self.status_number + constants.random_manager.get_stream('corruption').randrange(-1, 2)
                 if self.status_number == 4:
                     public_opinion_change += 6
             text += 'From: ' + self.name + ' /n /n'
@@ -1028,7 +1117,7 @@ class minister():
             audio = self.get_voice_line('hired')
             
         elif event == 'fired':
-            multiplier = random.randrange(8, 13) / 10.0 #0.8-1.2
+            multiplier = constants.random_manager.get_stream('corruption').randrange(8, 13) / 10.0 #0.8-1.2
             public_opinion_change = -10 * self.status_number * multiplier #4-6 for lowborn, 32-48 for very high
             constants.evil_tracker.change(2)
             text += 'From: ' + self.name + ' /n /n'
@@ -1084,12 +1173,12 @@ class minister():
             if self.current_position == 'none':
                 text = self.name + ' no longer desires to be appointed as a minister and has left the pool of available minister appointees. /n /n'
             else:
-                if random.randrange(0, 100) < constants.evil:
+                if constants.random_manager.get_stream('corruption').randrange(0, 100) < constants.evil:
                     tone = 'guilty'
                 else:
                     tone = 'content'
                     
-                if self.stolen_money >= 10.0 and random.randrange(1, 7) >= 4:
+                if self.stolen_money >= 10.0 and constants.random_manager.get_stream('corruption').randrange(1, 7) >= 4:
                     tone = 'confession'
                     
                 if tone == 'guilty':
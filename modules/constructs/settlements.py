@@ -1,7 +1,6 @@
 #Contains functionality for settlements
 
-import random
-from ..util import utility, actor_utility
+from ..util import actor_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -18,6 +17,7 @@ class settlement():
             dictionary input_dict: Keys corresponding to the values needed to initialize this object
                 'coordinates': int tuple value - Two values representing x and y coordinates on one of the game grids
                 'name': string value - Required if from save, starting name of settlement
+                'registry_orders': dictionary value - Required if from save, this settlement's position in each saved registry containing it, with the registry names as keys
         Output:
             None
         '''
@@ -31,7 +31,7 @@ class settlement():
                 self.name = self.cell.village.name
             else:
                 self.name = constants.flavor_text_manager.generate_flavor_text('settlement_names')
-                if random.randrange(1, 7) >= 4:
+                if constants.random_manager.get_stream('actions').randrange(1, 7) >= 4:
                     if self.cell.has_building('port'):
                         if status.current_country.adjective == 'british':
                             self.name = 'Port ' + self.name
@@ -40,9 +40,10 @@ class settlement():
                             self.name = 'Fort ' + self.name
         else:
             self.name = input_dict['name']
+            self.saved_registry_orders = input_dict.get('registry_orders', {})
         self.cell.tile.set_name(self.name)
-        status.actor_list.append(self)
-        status.settlement_list.append(self)
+        status.actor_list.add(self)
+        status.settlement_list.add(self)
 
     def rename(self, new_name: str):
         '''
@@ -80,11 +81,13 @@ class settlement():
                 'init_type': string value - Represents the type of actor this is, used to initialize the correct type of object on loading
                 'name': string value - Name of this settlement
                 'coordinates': int tuple value - Two values representing x and y coordinates on one of the game grids
+                'registry_orders': dictionary value - This settlement's position in each saved registry containing it, with the registry names as keys
         '''
         save_dict = {}
         save_dict['init_type'] = 'settlement'
         save_dict['name'] = self.name
         save_dict['coordinates'] = (self.x, self.y)
+        save_dict['registry_orders'] = constants.save_load_manager.get_registry_orders(self)
         return(save_dict)
 
     def remove(self):
@@ -96,8 +99,8 @@ class settlement():
         Output:
             None
         '''
-        status.actor_list = utility.remove_from_list(status.actor_list, self)
-        status.settlement_list = utility.remove_from_list(status.settlement_list, self)
+        status.actor_list.remove(self)
+        status.settlement_list.remove(self)
         self.cell.settlement = None
 
     def can_show_tooltip(self):
@@ -1,7 +1,6 @@
 #Contains functionality for villages
 
-import random
-from ..util import village_name_generator, actor_utility, utility
+from ..util import village_name_generator, actor_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -47,7 +46,8 @@ class village():
         self.y = self.cell.y
         self.tiles = [] #added in set_resource for tiles
         if not self.cell.grid.is_mini_grid: #villages should not be created in mini grid cells, so do not allow village to be visible to rest of program if it is on a mini grid cell
-            status.village_list.append(self) #have more permanent fix later
+            status.village_list.add(self) #have more permanent fix later
+            self.update_available_workers_index()
             if not self.cell.settlement:
                 self.cell.tile.set_name(self.name)
 
@@ -72,7 +72,8 @@ class village():
         Output:
             None
         '''
-        status.village_list = utility.remove_from_list(status.village_list, self)
+        status.village_list.remove(self)
+        constants.actor_registry_manager.remove_from_index('available_workers', 'village', self)
 
     def manage_warriors(self):
         '''
@@ -86,9 +87,9 @@ class village():
         for current_attached_warrior in self.attached_warriors:
             current_attached_warrior.check_despawn()
 
-        if self.can_spawn_warrior() and random.randrange(1, 7) >= 3: #2/3 chance of even attempting
+        if self.can_spawn_warrior() and constants.random_manager.get_stream('ai').randrange(1, 7) >= 3: #2/3 chance of even attempting
             min_spawn_result = 6 + self.get_aggressiveness_modifier() # 6-1 = 5 on high aggressiveness, 6 on average aggressiveness, 6+1 = 7 on low aggressiveness
-            if random.randrange(1, 7) >= min_spawn_result: #1/3 on high, 1/6 on average, 0 on low
+            if constants.random_manager.get_stream('ai').randrange(1, 7) >= min_spawn_result: #1/3 on high, 1/6 on average, 0 on low
                 self.spawn_warrior()
             
     def can_spawn_warrior(self):
@@ -170,7 +171,7 @@ class village():
         Output:
             None
         '''
-        self.population = random.randrange(1, 10)
+        self.population = constants.random_manager.get_stream('terrain').randrange(1, 10)
     
     def set_initial_aggressiveness(self):
         '''
@@ -185,7 +186,7 @@ class village():
         remaining_rolls = 9
         while remaining_rolls > 0:
             remaining_rolls -= 1
-            roll = random.randrange(1, 7)
+            roll = constants.random_manager.get_stream('terrain').randrange(1, 7)
             if roll <= 2: #1-2
                 self.aggressiveness -= 1
                 if roll == 1:
@@ -291,6 +292,7 @@ class village():
             None
         '''
         self.available_workers += change
+        self.update_available_workers_index()
         if self.cell.tile == status.displayed_tile: #if being displayed, change displayed available workers value
             actor_utility.calibrate_actor_info_display(status.tile_info_display, self.cell.tile)    
 
@@ -304,8 +306,21 @@ class village():
             None
         '''
         self.available_workers = new_value
+        self.update_available_workers_index()
         if self.cell.tile == status.displayed_tile: #if being displayed, change displayed available workers value
             actor_utility.calibrate_actor_info_display(status.tile_info_display, self.cell.tile)
+
+    def update_available_workers_index(self):
+        '''
+        Description:
+            Records whether this village has any available workers, allowing villages with available workers to be found without checking every village
+        Input:
+            None
+        Output:
+            None
+        '''
+        if self in status.village_list:
+            constants.actor_registry_manager.update_index('available_workers', 'village', self, self.available_workers > 0)
     
     def change_population(self, change):
         '''
@@ -1,6 +1,5 @@
 # Contains functionality for worker type templates, such as European, African, Asian, slave workers
 
-import random
 from typing import Dict, List
 import modules.constants.status as status
 import modules.constants.constants as constants
@@ -129,7 +128,7 @@ class worker_type():
             'init_type': self.init_type,
             'worker_type': self.adjective
         }
-        if self.adjective == 'Asian' and random.randrange(1, 7) >= 4: # Half chance each for East/South Asian variants
+        if self.adjective == 'Asian' and constants.random_manager.get_stream('appearance').randrange(1, 7) >= 4: # Half chance each for East/South Asian variants
             input_dict['image'] = 'mobs/' + self.name + ' 1/default.png'
         return(input_dict)
 
@@ -147,7 +146,7 @@ class worker_type():
         elif self.adjective == 'slave':
             if purchased: #as opposed to captured
                 if not constants.effect_manager.effect_active('no_slave_trade_penalty'):
-                    public_opinion_penalty = 5 + random.randrange(-3, 4) #2-8
+                    public_opinion_penalty = 5 + constants.random_manager.get_stream('market').randrange(-3, 4) #2-8
                     current_public_opinion = constants.public_opinion_tracker.get()
                     constants.public_opinion_tracker.change(-1 * public_opinion_penalty)
                     resulting_public_opinion = constants.public_opinion_tracker.get()
@@ -159,7 +158,7 @@ class worker_type():
                 constants.evil_tracker.change(6)
                 actor_utility.set_slave_traders_strength(constants.slave_traders_strength + 1)
             else:
-                public_opinion_penalty = 5 + random.randrange(-3, 4) #2-8
+                public_opinion_penalty = 5 + constants.random_manager.get_stream('market').randrange(-3, 4) #2-8
                 current_public_opinion = constants.public_opinion_tracker.get()
                 constants.public_opinion_tracker.change(-1 * public_opinion_penalty)
                 resulting_public_opinion = constants.public_opinion_tracker.get()
@@ -181,7 +180,7 @@ class worker_type():
 
         if self.adjective == 'slave':
             constants.evil_tracker.change(-2)
-            public_opinion_bonus = 4 + random.randrange(-3, 4) #1-7, less bonus than penalty for buying slaves on average
+            public_opinion_bonus = 4 + constants.random_manager.get_stream('market').randrange(-3, 4) #1-7, less bonus than penalty for buying slaves on average
             current_public_opinion = constants.public_opinion_tracker.get()
             constants.public_opinion_tracker.change(public_opinion_bonus)
             resulting_public_opinion = constants.public_opinion_tracker.get()
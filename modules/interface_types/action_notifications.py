@@ -61,6 +61,8 @@ class action_notification(notification):
                 for element_input_dict in self.attached_interface_elements:
                     if type(element_input_dict) == dict:
                         element_input_dict['parent_collection'] = self.notification_ordered_collection #self.parent_collection
+                        if element_input_dict['init_type'] == 'anonymous button': #attached anonymous buttons act as choice buttons of this notification
+                            element_input_dict['notification'] = self
                         self.attached_interface_elements[index] = constants.actor_creation_manager.create_interface_element(element_input_dict) #if given input dict, create it and add it to notification
                     else:
                         self.notification_ordered_collection.add_member(element_input_dict, member_config=element_input_dict.transfer_info_dict)
@@ -2,7 +2,7 @@
 
 import pygame
 from ..util import text_utility, scaling, main_loop_utility, actor_utility, utility, turn_management_utility, market_utility, game_transitions, \
-    minister_utility
+    minister_utility, drawing_utility
 from ..constructs import equipment_types
 from . import interface_elements
 import modules.constants.constants as constants
@@ -45,10 +45,12 @@ class button(interface_elements.interface_element):
         self.has_released = True
         self.button_type = input_dict['button_type']
         status.button_list.append(self)
+        constants.hit_test_manager.invalidate('buttons', self)
         self.keybind_id = input_dict.get('keybind_id', 'none')
         self.has_keybind = self.keybind_id != 'none'
         if self.has_keybind:
             self.set_keybind(self.keybind_id)
+            status.keybind_button_dict.setdefault(self.keybind_id, []).append(self)
         if 'color' in input_dict:
             self.color = constants.color_dict[input_dict['color']]
         self.has_button_press_override = False
@@ -113,6 +115,7 @@ class button(interface_elements.interface_element):
         super().set_origin(new_x, new_y)
         self.outline.y = self.Rect.y - self.outline_width
         self.outline.x = self.Rect.x - self.outline_width
+        constants.hit_test_manager.invalidate('buttons', self)
 
     def update_tooltip(self):
         '''
@@ -416,7 +419,7 @@ class button(interface_elements.interface_element):
             self.set_tooltip(['Saves this game'])
 
         elif self.button_type == 'load game':
-            self.set_tooltip(['Loads a saved game'])
+            self.set_tooltip(['Chooses a saved game to load, from the most recently saved'])
 
         elif self.button_type == 'cycle available ministers':
             self.set_tooltip(['Cycles through the candidates available to be appointed'])
@@ -649,11 +652,22 @@ class button(interface_elements.interface_element):
         Output:
             boolean: Returns True if this button is colliding with the mouse, otherwise returns False
         '''
-        if self.Rect.collidepoint(pygame.mouse.get_pos()): #if mouse is in button
+        if self.Rect.collidepoint(constants.mouse_position): #if mouse is in button
             return(True)
         else:
             return(False)
 
+    def get_hit_test_rects(self):
+        '''
+        Description:
+            Returns the Rects used to find whether this button is under a pixel location in the hit test index
+        Input:
+            None
+        Output:
+            pygame.Rect list: Returns this button's Rect
+        '''
+        return([self.Rect])
+
     def can_show_tooltip(self):
         '''
         Description:
@@ -686,7 +700,7 @@ class button(interface_elements.interface_element):
             if self.has_keybind: #The key to which a button is bound will appear on the button's image
                 message = self.keybind_name
                 color = 'white'
-                textsurface = constants.myfont.pygame_font.render(message, False, constants.color_dict[color])
+                textsurface = text_utility.text(message, constants.myfont, color=constants.color_dict[color])
                 constants.game_display.blit(textsurface, (self.x + scaling.scale_width(10), (constants.display_height -
                     (self.y + self.height - scaling.scale_height(5)))))
 
@@ -705,7 +719,7 @@ class button(interface_elements.interface_element):
         '''
         if self.showing:
             self.update_tooltip()
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = constants.mouse_position
             if below_screen:
                 mouse_y = constants.display_height + 10 - height
             if beyond_screen:
@@ -765,6 +779,7 @@ class button(interface_elements.interface_element):
                                 if current_mob.sentry_mode:
                                     current_mob.set_sentry_mode(False)
                                 current_mob.clear_automatic_route()
+                                current_mob.set_movement_destination('none')
 
                             elif current_mob.is_vehicle: # If moving into unreachable land, have each passenger attempt to move
                                 if current_mob.contained_mobs:
@@ -994,15 +1009,12 @@ class button(interface_elements.interface_element):
 
         elif self.button_type == 'save game':
             if main_loop_utility.action_possible():
-                constants.save_load_manager.save_game('save1.pickle')
-                constants.notification_manager.display_notification({
-                    'message': 'Game successfully saved to save1.pickle /n /n',
-                })
+                constants.save_slot_manager.save_current_game()
             else:
                 text_utility.print_to_screen('You are busy and cannot save the game')
 
         elif self.button_type == 'load game':
-            constants.save_load_manager.load_game('save1.pickle')
+            constants.save_slot_manager.display_save_browser()
 
         elif self.button_type == 'fire':
             fired_unit = status.displayed_mob
@@ -1141,9 +1153,22 @@ class button(interface_elements.interface_element):
         Output:
             None
         '''
-        self.showing_outline = False
+        self.set_showing_outline(False)
         self.has_released = True
 
+    def set_showing_outline(self, new_showing_outline):
+        '''
+        Description:
+            Sets whether this button shows an outline, like when it is pressed, and records the outline's region as changed if it starts or stops showing
+        Input:
+            boolean new_showing_outline: Whether this button should show an outline
+        Output:
+            None
+        '''
+        if new_showing_outline != self.showing_outline:
+            self.showing_outline = new_showing_outline
+            drawing_utility.mark_dirty(self.outline)
+
     def remove(self):
         '''
         Description:
@@ -1155,6 +1180,10 @@ class button(interface_elements.interface_element):
         '''
         super().remove()
         status.button_list = utility.remove_from_list(status.button_list, self)
+        constants.hit_test_manager.remove('buttons', self)
+        if self.has_keybind:
+            status.keybind_button_dict[self.keybind_id] = utility.remove_from_list(status.keybind_button_dict[self.keybind_id], self)
+        status.pressed_button_list = utility.remove_from_list(status.pressed_button_list, self)
 
     def can_show(self, skip_parent_collection=False):
         '''
@@ -2322,18 +2351,18 @@ class tab_button(button):
 
         if self.linked_element == self.parent_collection.parent_collection.current_tabbed_member:
             if return_value:
-                self.showing_outline = True
+                self.set_showing_outline(True)
             else:
-                self.showing_outline = False
+                self.set_showing_outline(False)
                 self.parent_collection.parent_collection.current_tabbed_member = None
                 for tabbed_member in self.parent_collection.parent_collection.tabbed_members:
                     if tabbed_member != self.linked_element and tabbed_member.linked_tab_button.can_show():
                         self.parent_collection.parent_collection.current_tabbed_member = tabbed_member
         elif return_value and self.parent_collection.parent_collection.current_tabbed_member == None:
             self.on_click()
-            self.showing_outline = True
+            self.set_showing_outline(True)
         else:
-            self.showing_outline = False
+            self.set_showing_outline(False)
 
         return(return_value)
 
@@ -1,7 +1,7 @@
 #contains functionality for cell icons, which act as hybrid interface element-actors
 
 from ..actor_types.actors import actor
-from ..util import utility
+from ..util import utility, traversal_utility
 from ..constructs import images
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -25,6 +25,7 @@ class cell_icon(actor):
         '''
         super().__init__(from_save, input_dict)
         status.independent_interface_elements.append(self)
+        traversal_utility.invalidate_interface_visibility()
         self.showing = False
         self.image_dict = {'default': input_dict['image']}
         self.images = [images.actor_image(self, current_grid.get_cell_width(), current_grid.get_cell_height(), current_grid, 'default')
@@ -76,6 +77,7 @@ class cell_icon(actor):
         super().remove()
         if self in status.independent_interface_elements:
             status.independent_interface_elements = utility.remove_from_list(status.independent_interface_elements, self)
+        traversal_utility.invalidate_interface_visibility()
 
     def can_show_tooltip(self):
         '''
@@ -1,8 +1,7 @@
 #Contains functionality for grid cells
 
 import pygame
-import random
-from ..util import actor_utility
+from ..util import actor_utility, drawing_utility, text_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -36,15 +35,17 @@ class cell():
         self.Rect = pygame.Rect(self.pixel_x, self.pixel_y - self.height, self.width, self.height) #(left, top, width, height)
         self.corners = [(self.Rect.left, self.Rect.top ), (self.Rect.left + self.Rect.width, self.Rect.top), (self.Rect.left, self.Rect.top - self.Rect.height), (self.Rect.left + self.Rect.width, self.Rect.top - self.Rect.height)]
         self.grid.cell_list[x][y] = self
+        constants.hit_test_manager.invalidate('cells', self)
         self.tile = 'none'
         self.resource = 'none'
         self.village = 'none'
         self.settlement = None
         self.terrain = 'none'
         self.terrain_variant = 0
-        self.set_terrain('savannah')
+        self.visible = False
         self.contained_mobs = []
         self.reset_buildings()
+        self.set_terrain('savannah')
         self.adjacent_cells = {'up': None, 'down': None, 'right': None, 'left': None}        
         if save_dict != 'none': #if from save
             self.save_dict = save_dict
@@ -136,24 +137,24 @@ class cell():
             if attrition_type == 'health':
                 return(False)
             elif attrition_type == 'inventory': #losing inventory in warehouses and such is uncommon but not impossible in Europe, but no health attrition in Europe
-                if random.randrange(1, 7) >= 2 or random.randrange(1, 7) >= 3: #same effect as clear area with port
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 2 or constants.random_manager.get_stream('attrition').randrange(1, 7) >= 3: #same effect as clear area with port
                     return(False)
         else:
             if self.terrain in ['savannah', 'hills']:
-                if random.randrange(1, 7) >= 2: #only attrition on 1's
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 2: #only attrition on 1's
                     return(False)
             elif self.terrain in ['mountain', 'desert', 'water']:
-                if random.randrange(1, 7) >= 3: #attrition on 1's and 2's
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 3: #attrition on 1's and 2's
                     return(False)
             elif self.terrain in ['jungle', 'swamp']:
-                if random.randrange(1, 7) >= 4: #attrition on 1-3
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 4: #attrition on 1-3
                     return(False)
 
             if self.has_building('village') or self.has_building('train_station') or self.has_building('port') or self.has_building('resource') or self.has_building('fort'):
-                if random.randrange(1, 7) >= 3: #removes 2/3 of attrition
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 3: #removes 2/3 of attrition
                     return(False)
             elif self.has_building('road') or self.has_building('railroad'):
-                if random.randrange(1, 7) >= 5: #removes 1/3 of attrition
+                if constants.random_manager.get_stream('attrition').randrange(1, 7) >= 5: #removes 1/3 of attrition
                     return(False)
 
         return(True)
@@ -621,7 +622,7 @@ class cell():
                                 best_combatants = [current_mob]
                             else:
                                 best_combatants.append(current_mob)
-        return(random.choice(best_combatants))
+        return(constants.random_manager.get_stream('combat').choice(best_combatants))
 
     def get_noncombatants(self, mob_type):
         '''
@@ -654,6 +655,8 @@ class cell():
             None
         '''
         self.visible = new_visibility
+        self.grid.update_cell_arrays(self)
+        self.invalidate_terrain()
         if update_image_bundle and self.tile != 'none':
             self.tile.update_image_bundle()
     
@@ -667,6 +670,7 @@ class cell():
             None
         '''
         self.resource = new_resource
+        self.invalidate_terrain()
         self.tile.set_resource(new_resource, update_image_bundle=update_image_bundle)
 
     def set_terrain(self, new_terrain, terrain_variant = 'none', update_image_bundle=True):
@@ -683,16 +687,19 @@ class cell():
         if terrain_variant != 'none':
             self.terrain_variant = terrain_variant
         self.terrain = new_terrain
+        self.grid.update_cell_arrays(self)
+        self.invalidate_terrain()
         if self.tile != 'none':
             self.tile.set_terrain(new_terrain, update_image_bundle)
         self.color = constants.terrain_colors[new_terrain]
 
-    def copy(self, other_cell):
+    def copy(self, other_cell, update_image_bundle=True):
         '''
         Description:
             Changes this cell into a copy of the inputted cell
         Input:
             cell other_cell: Cell to copy
+            boolean update_image_bundle: Whether to update the image bundle - if this cell's tile is given an already generated image afterward, there is no need to generate a new one
         Output:
             None
         '''
@@ -703,14 +710,29 @@ class cell():
         self.set_terrain(other_cell.terrain, other_cell.terrain_variant, update_image_bundle=False)
         self.set_resource(other_cell.resource, update_image_bundle=False)
         #self.tile.update_image_bundle(override_image=other_cell.tile.image) #correctly copies other cell's image bundle but ends up very pixellated due to size difference
-        self.tile.update_image_bundle()
+        if update_image_bundle:
+            self.tile.update_image_bundle()
 
-    def draw(self):
+    def get_copy_signature(self):
         '''
         Description:
-            Draws this cell as a rectangle with a certain color on its grid, depending on this cell's color value, along with actors this cell contains
+            Returns a tuple of the values that a copy of this cell would take, along with its tile's current image. If the signature is unchanged since this cell was last copied, the copy is
+                still accurate
         Input:
-            none
+            None
+        Output:
+            tuple: Returns this cell's visibility, terrain, terrain variant, resource, village, contained mobs, contained buildings, and tile image
+        '''
+        return((self.visible, self.terrain, self.terrain_variant, self.resource, self.village, tuple(self.contained_mobs), tuple(self.contained_buildings.values()), self.tile.image.image))
+
+    def draw_terrain(self, surface, origin):
+        '''
+        Description:
+            Draws this cell as a rectangle with a certain color, depending on this cell's color value, along with its tile's images onto the inputted surface, like its grid's terrain
+                layer
+        Input:
+            pygame.Surface surface: Surface to draw this cell onto
+            int tuple origin: Two values representing the pixel coordinates of the surface's top left corner on the screen
         Output:
             None
         '''
@@ -720,14 +742,36 @@ class cell():
         blue = current_color[2]
         if not self.visible:
             red, green, blue = constants.color_dict['blonde']
-        pygame.draw.rect(constants.game_display, (red, green, blue), self.Rect)
+        pygame.draw.rect(surface, (red, green, blue), self.Rect.move(-origin[0], -origin[1]))
         if self.tile != 'none':
             for current_image in self.tile.images:
+                current_image.draw_to_surface(surface, origin)
+
+    def invalidate_terrain(self):
+        '''
+        Description:
+            Records that this cell's terrain appearance changed, causing it to be redrawn on its grid's terrain layer and on the screen
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.grid.invalidate_terrain(self)
+        drawing_utility.mark_dirty(self.Rect)
+
+    def draw(self):
+        '''
+        Description:
+            Draws the actors this cell contains on top of its grid's terrain layer
+        Input:
+            none
+        Output:
+            None
+        '''
+        if self.tile != 'none' and self.visible and self.contained_mobs:
+            for current_image in self.contained_mobs[0].images:
                 current_image.draw()
-            if self.visible and self.contained_mobs:
-                for current_image in self.contained_mobs[0].images:
-                    current_image.draw()
-                self.show_num_mobs()
+            self.show_num_mobs()
 
     def show_num_mobs(self):
         '''
@@ -744,8 +788,7 @@ class cell():
             font = constants.fonts['max_detail_white']
             font_width = self.width * 0.13 * 1.3
             font_height = self.width * 0.3 * 1.3
-            textsurface = font.pygame_font.render(message, False, font.color)
-            textsurface = pygame.transform.scale(textsurface, (font_width * len(message), font_height))
+            textsurface = text_utility.text(message, font, size=(font_width * len(message), font_height))
             text_x = self.pixel_x + self.width - (font_width * (len(message) + 0.3))
             text_y = self.pixel_y + (-0.8 * self.height) - (0.5 * font_height)
             constants.game_display.blit(textsurface, (text_x, text_y))
@@ -759,11 +802,22 @@ class cell():
         Output:
             boolean: Returns True if this cell is colliding with the mouse, otherwise returns False
         '''
-        if self.Rect.collidepoint(pygame.mouse.get_pos()):
+        if self.Rect.collidepoint(constants.mouse_position):
             return(True)
         else:
             return(False)
 
+    def get_hit_test_rects(self):
+        '''
+        Description:
+            Returns the Rects used to find whether this cell is under a pixel location in the hit test index
+        Input:
+            None
+        Output:
+            pygame.Rect list: Returns this cell's Rect
+        '''
+        return([self.Rect])
+
     def find_adjacent_cells(self):
         '''
         Description:
@@ -190,6 +190,19 @@ class die(button):
             self.image.set_image('misc/dice/' + str(self.roll_result) + '.png')#self.set_label(str(self.roll_result))
             self.rolls_completed += 1
 
+    def finish_rolling(self):
+        '''
+        Description:
+            Immediately completes this die's remaining rolls, landing on its predetermined result. Used to resolve rolls instantly when running headless
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.rolls_completed = max(self.rolls_completed, self.num_rolls - 1)
+        while self.rolling:
+            self.roll()
+
     def draw(self):
         '''
         Description:
@@ -1,6 +1,5 @@
 #Contains functionality for buttons relating to the European headquarters screen
 
-import random
 from .buttons import button
 from ..util import main_loop_utility, text_utility, market_utility, utility, actor_utility, minister_utility
 import modules.constants.constants as constants
@@ -179,7 +178,7 @@ class buy_item_button(button):
                         text_utility.print_to_screen('You spent ' + str(cost) + ' money to buy 1 unit of ' + self.item_type + '.')
                     else:
                         text_utility.print_to_screen('You spent ' + str(cost) + ' money to buy 1 ' + self.item_type + '.')
-                    if random.randrange(1, 7) == 1 and self.item_type in constants.commodity_types: #1/6 chance
+                    if constants.random_manager.get_stream('market').randrange(1, 7) == 1 and self.item_type in constants.commodity_types: #1/6 chance
                         market_utility.change_price(self.item_type, 1)
                         text_utility.print_to_screen('The price of ' + self.item_type + ' has increased from ' + str(cost) + ' to ' + str(cost + 1) + '.')
                     actor_utility.calibrate_actor_info_display(status.tile_inventory_info_display, status.displayed_tile_inventory)
@@ -1,12 +1,12 @@
 #Contains functionality for grids
 
-import random
 import pygame
 import itertools
 import json
+import array
 from typing import Dict
 from . import cells, interface_elements
-from ..util import actor_utility, utility, scaling
+from ..util import actor_utility, utility, scaling, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -49,8 +49,15 @@ class grid(interface_elements.interface_element):
         self.internal_line_color = input_dict.get('internal_line_color', 'black')
         self.external_line_color = input_dict.get('external_line_color', 'black')
         self.mini_grid = 'none'
+        self.terrain_layer = 'none'
+        self.terrain_layer_rect = 'none'
+        self.outdated_terrain_cells = set()
         self.cell_list = [[None] * self.coordinate_height for y in range(self.coordinate_width)]
         #printed list would be inverted - each row corresponds to an x value and each column corresponds to a y value, but can be indexed by cell_list[x][y]
+        num_cells = self.coordinate_width * self.coordinate_height #flat arrays of cell values, indexed by get_cell_index in the same order as get_flat_cell_list
+        self.terrain_ids = array.array('b', [-1]) * num_cells
+        self.visibility = bytearray(num_cells)
+        self.infrastructure_masks = bytearray(num_cells)
         if not from_save: #terrain created after grid initialization by create_strategic_map in game_transitions
             self.create_cells()
         else:
@@ -93,15 +100,15 @@ class grid(interface_elements.interface_element):
         #        self.make_random_terrain_worm(round(area/24), round(area/12), ['water'])
         if not constants.effect_manager.effect_active('enable_oceans'):
             for row in self.cell_list:
-                terrain_variant = random.randrange(0, constants.terrain_variant_dict['ocean_water'])
+                terrain_variant = constants.random_manager.get_stream('terrain').randrange(0, constants.terrain_variant_dict['ocean_water'])
                 row[0].set_terrain('water', terrain_variant)
-            num_rivers = random.randrange(2, 4)
+            num_rivers = constants.random_manager.get_stream('terrain').randrange(2, 4)
             valid = False
             while not valid:
                 valid = True
                 start_x_list = []
                 for i in range(num_rivers):
-                    start_x_list.append(random.randrange(0, self.coordinate_width))
+                    start_x_list.append(constants.random_manager.get_stream('terrain').randrange(0, self.coordinate_width))
                 for index in range(len(start_x_list)):
                     for other_index in range(len(start_x_list)):
                         if index != other_index and abs(start_x_list[index] - start_x_list[other_index]) < 3:
@@ -113,16 +120,56 @@ class grid(interface_elements.interface_element):
     def draw(self):
         '''
         Description:
-            Draws each cell of this grid
+            Draws each cell of this grid, blitting the pre-rendered terrain layer and then drawing each cell's mobs on top of it
         Input:
             None
         Output:
             None
         '''
+        self.update_terrain_layer()
+        drawing_utility.display_image(self.terrain_layer, self.terrain_layer_rect.x, self.terrain_layer_rect.y)
         for cell in self.get_flat_cell_list():
-            cell.draw()
+            if cell.contained_mobs:
+                cell.draw()
         self.draw_grid_lines()
 
+    def invalidate_terrain(self, invalidated_cell):
+        '''
+        Description:
+            Records that the inputted cell's terrain appearance changed, causing it to be redrawn on this grid's terrain layer before the next time this grid is drawn
+        Input:
+            cell invalidated_cell: Cell of this grid whose terrain, visibility, resource, or buildings changed
+        Output:
+            None
+        '''
+        self.outdated_terrain_cells.add(invalidated_cell)
+
+    def update_terrain_layer(self):
+        '''
+        Description:
+            Redraws the terrain of any cells that changed since the last update onto this grid's terrain layer, a surface containing each cell's color and tile images that can be
+                drawn with a single blit. Creates and fully draws the terrain layer if it does not exist yet
+        Input:
+            None
+        Output:
+            None
+        '''
+        if self.terrain_layer == 'none':
+            flat_cell_list = list(self.get_flat_cell_list())
+            self.terrain_layer_rect = flat_cell_list[0].Rect.unionall([current_cell.Rect for current_cell in flat_cell_list])
+            self.terrain_layer = pygame.Surface(self.terrain_layer_rect.size)
+            for current_cell in flat_cell_list:
+                current_cell.draw_terrain(self.terrain_layer, self.terrain_layer_rect.topleft)
+        else:
+            for outdated_cell in self.outdated_terrain_cells:
+                #cells overlap slightly at their edges, so any overlapping cells are redrawn in their usual order within the outdated cell's area
+                self.terrain_layer.set_clip(outdated_cell.Rect.move(-self.terrain_layer_rect.x, -self.terrain_layer_rect.y))
+                for x in range(max(outdated_cell.x - 1, 0), min(outdated_cell.x + 2, self.coordinate_width)):
+                    for y in range(max(outdated_cell.y - 1, 0), min(outdated_cell.y + 2, self.coordinate_height)):
+                        self.cell_list[x][y].draw_terrain(self.terrain_layer, self.terrain_layer_rect.topleft)
+            self.terrain_layer.set_clip(None)
+        self.outdated_terrain_cells = set()
+
     def draw_grid_lines(self):
         '''
         Description:
@@ -132,7 +179,7 @@ class grid(interface_elements.interface_element):
         Output:
             None
         '''
-        if not constants.effect_manager.effect_active('hide_grid_lines'):
+        if not flags.hide_grid_lines:
             for x in range(0, self.coordinate_width+1):
                 pygame.draw.line(constants.game_display, constants.color_dict[self.internal_line_color], self.convert_coordinates((x, 0)), self.convert_coordinates((x, self.coordinate_height)), self.grid_line_width)
             for y in range(0, self.coordinate_height+1):
@@ -243,6 +290,53 @@ class grid(interface_elements.interface_element):
         else:
             return(None)
 
+    def get_cell_index(self, x, y):
+        '''
+        Description:
+            Returns the index of the cell at the inputted coordinates in this grid's flat cell arrays
+        Input:
+            int x: x coordinate of the cell
+            int y: y coordinate of the cell
+        Output:
+            int: Returns the index of the cell in this grid's terrain, visibility, and infrastructure arrays
+        '''
+        return(x * self.coordinate_height + y)
+
+    def update_cell_arrays(self, current_cell):
+        '''
+        Description:
+            Updates the inputted cell's terrain, visibility, and intact infrastructure in this grid's flat cell arrays, used whenever the cell's terrain or visibility changes or
+                a building in it is built, removed, damaged, or repaired
+        Input:
+            cell current_cell: Cell to update
+        Output:
+            None
+        '''
+        index = self.get_cell_index(current_cell.x, current_cell.y)
+        if current_cell.terrain in constants.terrain_id_list:
+            terrain_id = constants.terrain_id_list.index(current_cell.terrain)
+        else:
+            terrain_id = -1
+        infrastructure_mask = 0
+        current_infrastructure = current_cell.get_intact_building('infrastructure')
+        if current_infrastructure != 'none':
+            if current_infrastructure.is_road:
+                infrastructure_mask |= constants.infrastructure_mask_dict['road']
+            if current_infrastructure.is_railroad:
+                infrastructure_mask |= constants.infrastructure_mask_dict['railroad']
+            if current_infrastructure.is_bridge:
+                infrastructure_mask |= constants.infrastructure_mask_dict['bridge']
+                if hasattr(current_infrastructure, 'connected_cells') and current_infrastructure.connected_cells[0] != None and current_infrastructure.connected_cells[0].x == current_cell.x:
+                    infrastructure_mask |= constants.infrastructure_mask_dict['vertical_bridge']
+        for building_type in ['port', 'train_station']:
+            if current_cell.has_intact_building(building_type):
+                infrastructure_mask |= constants.infrastructure_mask_dict[building_type]
+        if (self.terrain_ids[index], self.visibility[index], self.infrastructure_masks[index]) != (terrain_id, int(current_cell.visible), infrastructure_mask):
+            self.terrain_ids[index] = terrain_id
+            self.visibility[index] = int(current_cell.visible)
+            self.infrastructure_masks[index] = infrastructure_mask
+            constants.pathfinding_manager.update_cell(self, index)
+
     def choose_cell(self, requirements_dict):
         '''
         Description:
@@ -252,21 +346,23 @@ class grid(interface_elements.interface_element):
         Output:
             cell: Returns a random cell in this grid that fits the inputted requirements
         '''
-        allowed_terrains = requirements_dict['allowed_terrains']
+        allowed_terrain_ids = [constants.terrain_id_list.index(terrain) for terrain in requirements_dict['allowed_terrains'] if terrain in constants.terrain_id_list]
         ocean_allowed = requirements_dict['ocean_allowed']
         nearby_buildings_allowed = requirements_dict['nearby_buildings_allowed']
         possible_cells = []
-        for current_cell in self.get_flat_cell_list():
-            if not current_cell.terrain in allowed_terrains:
+        for index, terrain_id in enumerate(self.terrain_ids): #checks terrain and coordinates from the flat arrays, only finding cell objects that could be chosen
+            if not terrain_id in allowed_terrain_ids:
                 continue
-            if (not ocean_allowed) and current_cell.y == 0:
+            x, y = divmod(index, self.coordinate_height)
+            if (not ocean_allowed) and y == 0:
                 continue
+            current_cell = self.cell_list[x][y]
             if (not nearby_buildings_allowed) and current_cell.adjacent_to_buildings():
                 continue
             possible_cells.append(current_cell)
         if len(possible_cells) == 0:
             possible_cells.append('none')
-        return(random.choice(possible_cells))
+        return(constants.random_manager.get_stream('ai').choice(possible_cells))
         
             
     def create_cells(self):
@@ -361,7 +457,7 @@ class grid(interface_elements.interface_element):
         else:
             resource_list_dict = self.create_resource_list_dict()
             for cell in self.get_flat_cell_list():
-                terrain_number = random.randrange(resource_list_dict[cell.terrain][-1][1]) #number between 0 and terrain's max frequency
+                terrain_number = constants.random_manager.get_stream('terrain').randrange(resource_list_dict[cell.terrain][-1][1]) #number between 0 and terrain's max frequency
                 set_resource = False
                 for current_resource in resource_list_dict[cell.terrain]: #if random number falls in resource's frequency range for that terrain, set cell to that resource
                     if (not set_resource) and terrain_number < current_resource[1]:
@@ -379,18 +475,18 @@ class grid(interface_elements.interface_element):
         Output:
             None
         '''
-        start_x = random.randrange(0, self.coordinate_width)
-        start_y = random.randrange(0, self.coordinate_height)
+        start_x = constants.random_manager.get_stream('terrain').randrange(0, self.coordinate_width)
+        start_y = constants.random_manager.get_stream('terrain').randrange(0, self.coordinate_height)
         current_x = start_x
         current_y = start_y
-        worm_length = random.randrange(min_len, max_len + 1)
-        terrain = random.choice(possible_terrains)
-        terrain_variant = random.randrange(0, constants.terrain_variant_dict.get(terrain, 1)) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
+        worm_length = constants.random_manager.get_stream('terrain').randrange(min_len, max_len + 1)
+        terrain = constants.random_manager.get_stream('terrain').choice(possible_terrains)
+        terrain_variant = constants.random_manager.get_stream('terrain').randrange(0, constants.terrain_variant_dict.get(terrain, 1)) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
         self.find_cell(current_x, current_y).set_terrain(terrain, terrain_variant)
         counter = 0        
         while not counter == worm_length:           
             counter = counter + 1
-            direction = random.randrange(1, 5) #1 north, 2 east, 3 south, 4 west
+            direction = constants.random_manager.get_stream('terrain').randrange(1, 5) #1 north, 2 east, 3 south, 4 west
             if not (((current_x == self.coordinate_width - 1) and direction == 2) or ((current_x == 0) and direction == 4) or ((current_y == self.coordinate_height - 1) and direction == 3) or ((current_y == 0) and direction == 1)):
                 if direction == 3:
                     current_y = current_y + 1
@@ -400,7 +496,7 @@ class grid(interface_elements.interface_element):
                     current_y = current_y - 1
                 elif direction == 4:
                     current_x = current_x - 1
-                terrain_variant = random.randrange(0, constants.terrain_variant_dict.get(terrain, 1)) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
+                terrain_variant = constants.random_manager.get_stream('terrain').randrange(0, constants.terrain_variant_dict.get(terrain, 1)) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
                 self.find_cell(current_x, current_y).set_terrain(terrain, terrain_variant)
                 
     def make_random_river_worm(self, min_len, max_len, start_x):
@@ -417,7 +513,7 @@ class grid(interface_elements.interface_element):
         start_y = 1
         current_x = start_x
         current_y = start_y
-        worm_length = random.randrange(min_len, max_len + 1)
+        worm_length = constants.random_manager.get_stream('terrain').randrange(min_len, max_len + 1)
         terrain = 'water'
         water_type = 'water'
         if current_y == 0:
@@ -425,13 +521,13 @@ class grid(interface_elements.interface_element):
         else:
             water_type = 'river_water'
         #self.find_cell(current_x, current_y).set_terrain(terrain)
-        terrain_variant = random.randrange(0, constants.terrain_variant_dict[water_type]) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
+        terrain_variant = constants.random_manager.get_stream('terrain').randrange(0, constants.terrain_variant_dict[water_type]) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
         self.find_cell(current_x, current_y).set_terrain(terrain, terrain_variant)
         #self.find_cell(current_x, current_y).set_terrain(terrain)
         counter = 0        
         while not counter == worm_length:           
             counter = counter + 1
-            direction = random.randrange(1, 7) #1 3 5 6 north, 2 east, 4 west
+            direction = constants.random_manager.get_stream('terrain').randrange(1, 7) #1 3 5 6 north, 2 east, 4 west
             if direction == 1 or direction == 5 or direction == 6:
                 direction = 3 #turns extras and south to north
             if not (((current_x == self.coordinate_width - 1) and direction == 2) or ((current_x == 0) and direction == 4) or ((current_y == self.coordinate_height - 1) and direction == 3) or ((current_y == 0) and direction == 1)):
@@ -447,7 +543,7 @@ class grid(interface_elements.interface_element):
                 else:
                     water_type = 'river_water'
                 #self.find_cell(current_x, current_y).set_terrain(terrain)
-                terrain_variant = random.randrange(0, constants.terrain_variant_dict[water_type]) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
+                terrain_variant = constants.random_manager.get_stream('terrain').randrange(0, constants.terrain_variant_dict[water_type]) #randomly choose from number of terrain variants, if 2 variants then pick 0 or 1
                 self.find_cell(current_x, current_y).set_terrain(terrain, terrain_variant)
 
     def touching_mouse(self):
@@ -459,7 +555,7 @@ class grid(interface_elements.interface_element):
         Output:
             boolean: Returns True if this grid is colliding with the mouse, otherwise returns False
         '''
-        if self.Rect.collidepoint(pygame.mouse.get_pos()):
+        if self.Rect.collidepoint(constants.mouse_position):
             return(True)
         else:
             return(False)
@@ -497,6 +593,8 @@ class grid(interface_elements.interface_element):
         '''
         super().remove()
         status.grid_list = utility.remove_from_list(status.grid_list, self)
+        for current_cell in self.get_flat_cell_list():
+            constants.hit_test_manager.remove('cells', current_cell)
         
 class mini_grid(grid):
     '''
@@ -529,38 +627,156 @@ class mini_grid(grid):
         self.attached_grid.mini_grid = self
         self.center_x = 0
         self.center_y = 0
+        self.calibrated_signatures = {} #dictionary of each cell's coordinates and the copy signature of the attached cell it was last calibrated to, or 'empty' if beyond the attached grid
+        self.calibration_batch_depth = 0
+        self.pending_calibration = 'none'
+        self.sampling_attached_terrain = constants.effect_manager.effect_active('minimap_terrain_sampling') #if True, terrain is scaled from the attached grid's terrain layer and tiles of this grid do not generate images
 
     def calibrate(self, center_x, center_y):
         '''
         Description:
-            Centers this mini grid on the cell at the inputted coordinates of the attached grid, moving any displayed actors, terrain, and resources on this grid to their new locations as needed
+            Centers this mini grid on the cell at the inputted coordinates of the attached grid, moving any displayed actors, terrain, and resources on this grid to their new locations as needed. Only cells
+                whose attached cells changed since the last calibration are updated - when the center moves, a cell that now shows a tile previously shown by another cell takes that cell's image
+                rather than generating a new one. During a calibration batch, calibration is deferred until the batch ends
         Input:
             int center_x: x coordinate on the attached grid to center on
             int center_y: y coordinate on the attached grid to center on
         Output:
             None
         '''
+        if self.calibration_batch_depth > 0:
+            self.pending_calibration = (center_x, center_y)
+            return()
         if constants.current_game_mode in self.modes:
+            center_changed = (center_x, center_y) != (self.center_x, self.center_y)
+            reusable_images = {}
+            if center_changed: #record each cell's current image by the attached coordinates it shows, allowing cells to scroll to their new locations
+                for current_cell in self.get_flat_cell_list():
+                    signature = self.calibrated_signatures.get((current_cell.x, current_cell.y), 'none')
+                    if not signature in ['none', 'empty']:
+                        reusable_images[self.get_main_grid_coordinates(current_cell.x, current_cell.y)] = (signature, current_cell.tile.image.image_id, current_cell.tile.image.image)
             self.center_x = center_x
             self.center_y = center_y
-            actor_utility.calibrate_actor_info_display(status.tile_info_display, self.attached_grid.find_cell(self.center_x, self.center_y).tile) #calibrate tile display information to centered tile
+            changed = center_changed
             for current_cell in self.get_flat_cell_list():
                 attached_x, attached_y = self.get_main_grid_coordinates(current_cell.x, current_cell.y)
                 if attached_x >= 0 and attached_y >= 0 and attached_x < self.attached_grid.coordinate_width and attached_y < self.attached_grid.coordinate_height:
                     attached_cell = self.attached_grid.find_cell(attached_x, attached_y)
-                    current_cell.copy(attached_cell)
-                else: #if the current cell is beyond the boundaries of the attached grid, show an empty cell
+                    signature = attached_cell.get_copy_signature()
+                    if signature != self.calibrated_signatures.get((current_cell.x, current_cell.y), 'none'):
+                        if (attached_x, attached_y) in reusable_images and reusable_images[(attached_x, attached_y)][0] == signature: #if attached cell unchanged since shown by another cell, take that cell's image
+                            current_cell.copy(attached_cell, update_image_bundle=False)
+                            current_cell.tile.image.reuse_image(reusable_images[(attached_x, attached_y)][1], reusable_images[(attached_x, attached_y)][2])
+                            current_cell.invalidate_terrain()
+                        else:
+                            current_cell.copy(attached_cell)
+                        self.calibrated_signatures[(current_cell.x, current_cell.y)] = signature
+                        changed = True
+                elif self.calibrated_signatures.get((current_cell.x, current_cell.y), 'none') != 'empty': #if the current cell is beyond the boundaries of the attached grid, show an empty cell
                     current_cell.contained_mobs = []
                     current_cell.set_visibility(True, update_image_bundle=False)
                     current_cell.set_terrain('none', update_image_bundle=False)
                     current_cell.set_resource('none', update_image_bundle=False)
                     current_cell.reset_buildings()
                     current_cell.tile.update_image_bundle()
-            for current_mob in status.mob_list:
-                if current_mob.images[0].current_cell != 'none':
-                    for current_image in current_mob.images:
-                        if current_image.grid == self:
-                            current_image.add_to_cell()
+                    self.calibrated_signatures[(current_cell.x, current_cell.y)] = 'empty'
+                    changed = True
+            center_tile = self.attached_grid.find_cell(self.center_x, self.center_y).tile
+            if changed or status.displayed_tile != center_tile:
+                actor_utility.calibrate_actor_info_display(status.tile_info_display, center_tile) #calibrate tile display information to centered tile
+            if changed:
+                for current_mob in sorted(constants.actor_registry_manager.get_index('grid', self), key=status.mob_list.index):
+                    if current_mob.images[0].current_cell != 'none':
+                        for current_image in current_mob.images:
+                            if current_image.grid == self:
+                                current_image.add_to_cell()
+
+    def update_terrain_layer(self):
+        '''
+        Description:
+            Updates this grid's terrain layer. While the minimap_terrain_sampling effect is active, the terrain layer is sampled from the attached grid's terrain layer whenever any of the
+                shown cells changed, rather than drawing each of this grid's cells
+        Input:
+            None
+        Output:
+            None
+        '''
+        if self.sampling_attached_terrain != constants.effect_manager.effect_active('minimap_terrain_sampling'):
+            self.sampling_attached_terrain = not self.sampling_attached_terrain
+            self.terrain_layer = 'none'
+            for current_cell in self.get_flat_cell_list():
+                if self.sampling_attached_terrain: #tiles do not need images while sampling, so release their image bundles
+                    current_cell.tile.set_image('default')
+                else: #tiles do not keep up-to-date images while sampling, so generate them again
+                    current_cell.tile.update_image_bundle()
+        if not self.sampling_attached_terrain:
+            super().update_terrain_layer()
+            return()
+        attached_terrain_outdated = False
+        for outdated_cell in self.attached_grid.outdated_terrain_cells:
+            if self.is_on_mini_grid(outdated_cell.x, outdated_cell.y):
+                attached_terrain_outdated = True
+                break
+        self.attached_grid.update_terrain_layer()
+        if self.terrain_layer == 'none' or self.outdated_terrain_cells or attached_terrain_outdated:
+            self.sample_attached_terrain()
+        self.outdated_terrain_cells = set()
+
+    def sample_attached_terrain(self):
+        '''
+        Description:
+            Draws this grid's terrain layer by scaling the area of the attached grid's terrain layer covered by this grid up to this grid's size, leaving any area beyond the attached grid's
+                boundaries empty
+        Input:
+            None
+        Output:
+            None
+        '''
+        flat_cell_list = list(self.get_flat_cell_list())
+        if self.terrain_layer == 'none':
+            self.terrain_layer_rect = flat_cell_list[0].Rect.unionall([current_cell.Rect for current_cell in flat_cell_list])
+            self.terrain_layer = pygame.Surface(self.terrain_layer_rect.size)
+        self.terrain_layer.fill(constants.terrain_colors['none'])
+        attached_rects = []
+        shown_rects = []
+        for current_cell in flat_cell_list:
+            attached_x, attached_y = self.get_main_grid_coordinates(current_cell.x, current_cell.y)
+            if attached_x >= 0 and attached_y >= 0 and attached_x < self.attached_grid.coordinate_width and attached_y < self.attached_grid.coordinate_height:
+                attached_rects.append(self.attached_grid.find_cell(attached_x, attached_y).Rect)
+                shown_rects.append(current_cell.Rect)
+        if attached_rects:
+            source_rect = attached_rects[0].unionall(attached_rects).move(-self.attached_grid.terrain_layer_rect.x, -self.attached_grid.terrain_layer_rect.y)
+            destination_rect = shown_rects[0].unionall(shown_rects)
+            self.terrain_layer.blit(pygame.transform.scale(self.attached_grid.terrain_layer.subsurface(source_rect), destination_rect.size),
+                destination_rect.move(-self.terrain_layer_rect.x, -self.terrain_layer_rect.y))
+        drawing_utility.mark_dirty(self.terrain_layer_rect)
+
+    def start_calibration_batch(self):
+        '''
+        Description:
+            Starts deferring calibrations of this mini grid, like during the enemy turn when many units may move at once. Once every started batch is ended, this mini grid is calibrated once to
+                the last requested center
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.calibration_batch_depth += 1
+
+    def end_calibration_batch(self):
+        '''
+        Description:
+            Ends a calibration batch started with start_calibration_batch, calibrating this mini grid to the last center requested during the batch once no batches remain
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.calibration_batch_depth -= 1
+        if self.calibration_batch_depth == 0 and self.pending_calibration != 'none':
+            center_x, center_y = self.pending_calibration
+            self.pending_calibration = 'none'
+            self.calibrate(center_x, center_y)
 
     def get_main_grid_coordinates(self, mini_x, mini_y):
         '''
@@ -634,7 +850,7 @@ class mini_grid(grid):
             up_y = self.coordinate_height
         else:
             up_y = upper_right_corner[1]
-        if not constants.effect_manager.effect_active('hide_grid_lines'):
+        if not flags.hide_grid_lines:
                 
             for x in range(0, self.coordinate_width+1):
                 pygame.draw.line(constants.game_display, constants.color_dict[self.internal_line_color], self.convert_coordinates((x, 0)), self.convert_coordinates((x, self.coordinate_height)),
@@ -2,7 +2,7 @@
 
 import pygame
 from ..constructs import images
-from ..util import scaling, utility, dummy_utility
+from ..util import scaling, utility, dummy_utility, drawing_utility, traversal_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -36,6 +36,7 @@ class interface_element():
         self.has_parent_collection = self.parent_collection != 'none'
         if not self.has_parent_collection:
             status.independent_interface_elements.append(self)
+        traversal_utility.invalidate_interface_visibility()
 
         input_dict['coordinates'] = input_dict.get('coordinates', (0, 0))
         self.x, self.y = input_dict['coordinates']
@@ -92,6 +93,9 @@ class interface_element():
         '''
         if self in status.independent_interface_elements:
             status.independent_interface_elements = utility.remove_from_list(status.independent_interface_elements, self)
+        if self.showing: #removed elements are no longer traversed, so they report their regions here
+            drawing_utility.mark_dirty(self.Rect)
+        traversal_utility.invalidate_interface_visibility()
 
     def draw(self):
         '''
@@ -154,10 +158,12 @@ class interface_element():
         Output:
             None
         '''
+        drawing_utility.mark_dirty(self.Rect)
         self.x = new_x
         self.Rect.x = self.x
         self.y = new_y
         self.Rect.y = constants.display_height - (self.y + self.height)
+        drawing_utility.mark_dirty(self.Rect)
         if self.has_parent_collection:
             self.x_offset = self.x - self.parent_collection.x
             self.y_offset = self.y - self.parent_collection.y
@@ -398,6 +404,7 @@ class interface_collection(interface_element):
             new_member.has_parent_collection = True
             status.independent_interface_elements = utility.remove_from_list(status.independent_interface_elements, new_member)
         new_member.parent_collection = self
+        traversal_utility.invalidate_interface_visibility()
         if not 'index' in member_config:
             self.members.append(new_member)
         else:
@@ -426,6 +433,7 @@ class interface_collection(interface_element):
         removed_member.has_parent_collection = False
         status.independent_interface_elements.append(removed_member)
         self.members.remove(removed_member)
+        traversal_utility.invalidate_interface_visibility()
 
     def remove_recursive(self, complete=False):
         '''
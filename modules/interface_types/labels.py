@@ -1,7 +1,7 @@
 #Contains functionality for labels
 
 from .buttons import button
-from ..util import scaling, text_utility, utility, market_utility
+from ..util import scaling, text_utility, utility, market_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -45,12 +45,15 @@ class label(button):
         Output:
             None
         '''
+        drawing_utility.mark_dirty(self.Rect)
         self.message = new_message
         self.width = max(self.minimum_width, self.font.calculate_size(self.message) + scaling.scale_width(10))
         self.image.width = self.width
         self.Rect.width = self.width
         self.image.set_image(self.image.image_id)
         self.image.Rect = self.Rect
+        constants.hit_test_manager.invalidate('buttons', self)
+        drawing_utility.mark_dirty(self.Rect)
 
     def update_tooltip(self):
         '''
@@ -333,6 +336,7 @@ class commodity_prices_label_template(label):
             None
         '''
         self.message = new_message
+        drawing_utility.mark_dirty(self.Rect)
         for text_line in self.message:
             message_size = self.font.calculate_size(text_line)
             if message_size > self.ideal_width - scaling.scale_width(10) and message_size + scaling.scale_width(10) > self.width:
@@ -341,6 +345,7 @@ class commodity_prices_label_template(label):
                 self.Rect.width = self.width
                 self.image.set_image(self.image.image_id) #update width scaling
                 self.image.Rect = self.Rect
+                constants.hit_test_manager.invalidate('buttons', self)
 
     def draw(self):
         '''
@@ -467,7 +472,9 @@ class multi_line_label(label):
             None
         '''
         self.message = new_message
+        drawing_utility.mark_dirty(self.Rect)
         self.format_message()
         for text_line in self.message:
             self.width = max(self.ideal_width, self.font.calculate_size(text_line))
         self.image.update_state(self.x, self.y, self.width, self.height)
+        drawing_utility.mark_dirty((self.x, constants.display_height - (self.y + self.height), self.width, self.height))
@@ -2,7 +2,7 @@
 
 import time
 import pygame
-from .util import main_loop_utility, utility, text_utility, turn_management_utility, actor_utility
+from .util import main_loop_utility, utility, text_utility, turn_management_utility, actor_utility, drawing_utility, traversal_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
@@ -17,30 +17,28 @@ def main_loop():
         None
     '''
     while not flags.crashed:
+        constants.mouse_position = pygame.mouse.get_pos()
         if not flags.loading:
             main_loop_utility.update_display()
         else:
             main_loop_utility.draw_loading_screen()
         constants.input_manager.update_input()
+        input_state = main_loop_utility.get_input_state()
+        received_input = False
         for event in pygame.event.get():
             flags.capital = flags.r_shift or flags.l_shift
             flags.ctrl = flags.r_ctrl or flags.l_ctrl
+            if event.type != pygame.MOUSEMOTION: #moving the mouse only changes tooltips, which update_display handles
+                received_input = True
+                if event.type in [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED]: #window contents may have been lost
+                    drawing_utility.mark_full_redraw()
+                if flags.typing and event.type in [pygame.KEYDOWN, pygame.KEYUP]: #typed text is shown in the text box
+                    text_utility.mark_text_box_dirty()
             match event.type:
                 case pygame.QUIT:
                     flags.crashed = True
                 case pygame.KEYDOWN:
-                    for current_button in status.button_list:
-                        if (current_button.showing or (current_button.has_button_press_override and current_button.button_press_override())) and \
-                            event.key == current_button.keybind_id and not flags.typing:
-                            if current_button.has_released: #if stuck on loading, don't want multiple 'key down' events to repeat on_click - shouldn't on_click again until released
-                                current_button.has_released = False
-                                current_button.being_pressed = True
-                                current_button.on_click()
-                                current_button.showing_outline = True
-                            break
-                        else:
-                            current_button.confirming = False
-                            current_button.being_pressed = False
+                    main_loop_utility.manage_keybind_press(event.key)
                     match event.key:
                         case pygame.K_RSHIFT:
                             flags.r_shift = True
@@ -65,13 +63,7 @@ def main_loop():
                             constants.message += constants.lowercase_key_values[constants.key_codes.index(event.key)]
 
                 case pygame.KEYUP:
-                    for current_button in status.button_list:
-                        if not flags.typing or current_button.keybind_id == pygame.K_TAB or current_button.keybind_id == pygame.K_e:
-                            if current_button.has_keybind:
-                                if event.key == current_button.keybind_id:
-                                    current_button.on_release()
-                                    current_button.has_released = True
-                                    current_button.being_pressed = False
+                    main_loop_utility.manage_keybind_release(event.key)
                     match event.key:
                         case pygame.K_RSHIFT:
                             flags.r_shift = False
@@ -102,7 +94,7 @@ def main_loop():
                 clicked_button = False
                 stopping = False
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:#here
+                    for current_button in constants.hit_test_manager.find('buttons', constants.mouse_position):
                         if current_button.touching_mouse() and current_button.showing and (current_button.in_notification) and not stopping: #if notification, click before other buttons
                             current_button.on_rmb_click()
                             current_button.on_rmb_release()
@@ -115,7 +107,7 @@ def main_loop():
                         clicked_button = True
                         stopping = True
                 if not stopping:
-                    for current_button in status.button_list:
+                    for current_button in constants.hit_test_manager.find('buttons', constants.mouse_position):
                         if current_button.touching_mouse() and current_button.showing:
                             current_button.on_rmb_click()
                             current_button.on_rmb_release()
@@ -128,7 +120,7 @@ def main_loop():
                 allow_on_click = True #certain buttons, like panels, allow clicking on another button at the same time
                 stopping = False
                 if status.current_instructions_page == None:
-                    for current_button in status.button_list:#here
+                    for current_button in constants.hit_test_manager.find('buttons', constants.mouse_position):
                         if current_button.touching_mouse() and current_button.showing and (current_button.in_notification) and not stopping: #if notification, click before other buttons
                             current_button.on_click()
                             current_button.on_release()
@@ -145,7 +137,7 @@ def main_loop():
                         break
 
                 if not stopping:
-                    for current_button in status.button_list:
+                    for current_button in constants.hit_test_manager.find('buttons', constants.mouse_position):
                         if current_button.touching_mouse() and current_button.showing and allow_on_click: #only click 1 button at a time
                             if current_button.on_click(): #if on_click has return value, nothing happened - allow other buttons to click but do not deselect units
                                 allow_on_click = True
@@ -159,108 +151,28 @@ def main_loop():
         if (flags.lmb_down or flags.rmb_down):
             for current_button in status.button_list:
                 if current_button.touching_mouse() and current_button.showing:
-                    current_button.showing_outline = True
+                    current_button.set_showing_outline(True)
                 elif not current_button.being_pressed:
-                    current_button.showing_outline = False
+                    current_button.set_showing_outline(False)
         else:
             for current_button in status.button_list:
                 if current_button.has_released:
-                    current_button.showing_outline = False
+                    current_button.set_showing_outline(False)
+        if received_input:
+            main_loop_utility.update_input_regions(input_state)
 
         constants.current_time = time.time()
         if constants.current_time - constants.last_selection_outline_switch > 1:
             flags.show_selection_outlines = not flags.show_selection_outlines
             constants.last_selection_outline_switch = constants.current_time
+            if status.displayed_mob:
+                for current_image in status.displayed_mob.images:
+                    drawing_utility.mark_dirty(current_image.outline)
         constants.event_manager.update(constants.current_time)
+        constants.save_load_manager.update_autosave()
         if not flags.player_turn and constants.previous_turn_time + constants.end_turn_wait_time <= constants.current_time: #if enough time has passed based on delay from previous movement
-            enemy_turn_done = True
-            for enemy in status.npmob_list:
-                if not enemy.turn_done:
-                    enemy_turn_done = False
-                    break
-            if enemy_turn_done:
-                flags.player_turn = True
-                flags.enemy_combat_phase = True
-                turn_management_utility.manage_combat()
-            else:
-                current_enemy = status.enemy_turn_queue[0]
-                removed = False
-                spawning = False
-                did_nothing = False
-                moving = False
-                if current_enemy.npmob_type == 'native_warriors' and current_enemy.despawning:
-                    if current_enemy == status.displayed_mob or not current_enemy.visible():
-                        current_enemy.remove_complete()
-                        removed = True
-                        
-                elif current_enemy.npmob_type == 'native_warriors' and current_enemy.creation_turn == constants.turn: #if unit just created
-                    spawn_cell = current_enemy.grids[0].find_cell(current_enemy.x, current_enemy.y)
-                    if (status.minimap_grid.center_x, status.minimap_grid.center_y) == (current_enemy.x, current_enemy.y) and spawn_cell.visible: #if camera just moved to spawn location to show spawning
-                        spawning = True
-                        current_enemy.show_images()
-                        current_enemy.select()
-                        current_enemy.attack_on_spawn()
-                        current_enemy.turn_done = True
-                    else: #if camera did not move to spawn location
-                        spawning = True
-                        if spawn_cell.visible: #if spawn location visible but camera hasn't moved there yet, move camera there
-                            status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
-                        else: #if spawn location not visible, end turn
-                            current_enemy.show_images()
-                            current_enemy.turn_done = True 
-            
-                elif not current_enemy.visible(): #if not just spawned and hidden, do action without displaying
-                    current_enemy.end_turn_move()
-                    moving = True
-                    
-                elif current_enemy == status.displayed_mob: #if enemy is selected and did not just spawn, move it while minimap follows
-                    if not current_enemy.creation_turn == constants.turn: #don't do anything on first turn, but still move camera to spawn location if visible
-                        current_enemy.end_turn_move() #do_turn()
-                        moving = True
-                        if current_enemy.visible():
-                            if current_enemy != status.displayed_mob:
-                                current_enemy.select()
-                            else:
-                                status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
-                    else:
-                        current_enemy.turn_done = True
-                    
-                if (not (removed or spawning)) and (not current_enemy.creation_turn == constants.turn) and current_enemy.visible(): #if unit visible and not selected, start its turn
-                    if current_enemy.npmob_type == 'native_warriors' and current_enemy.find_closest_target() == 'none' and not current_enemy.despawning: #if native warriors have no target, they stand still and no movement is shown
-                        did_nothing = True
-                        current_enemy.turn_done = True
-                    
-                    elif current_enemy.npmob_type == 'beast' and current_enemy.find_closest_target == current_enemy.images[0].current_cell and not current_enemy.images[0].current_cell.has_pmob():
-                        #if beasts stand still and don't attack anything, no movement is shown
-                        did_nothing = True
-                        current_enemy.turn_done = True
-                    elif current_enemy.visible(): #if unit will do an action, move the camera to it and select it
-                        current_enemy.select()
-                                                                     
-                elif current_enemy.creation_turn == constants.turn and not spawning: #if enemy visible but just spawned, end turn
-                    did_nothing = True
-                    current_enemy.turn_done = True
-
-                if removed: #show unit despawning if visible
-                    current_enemy.turn_done = True
-                    if not current_enemy.visible():
-                        constants.end_turn_wait_time = 0
-                    else:
-                        constants.end_turn_wait_time = 1
-                    status.enemy_turn_queue.pop(0)
-                    
-                else: #If unit visible, have short delay depending on action taken to let user see it
-                    if (not spawning) and (did_nothing or not current_enemy.visible()): #do not wait if not visible or nothing to show, exception for spawning units, which may not be visible as user watches them spawn
-                        constants.end_turn_wait_time = 0
-                    elif spawning and not current_enemy.grids[0].find_cell(current_enemy.x, current_enemy.y).visible: #do not wait if spawning unit won't be visible even after it spawns
-                        constants.end_turn_wait_time = 0
-                    elif moving and not enemy.turn_done:#if will move again after this
-                        constants.end_turn_wait_time = 0.25
-                    else: #if done with turn
-                        constants.end_turn_wait_time = 0.5
-
-                    if current_enemy.turn_done:
-                        status.enemy_turn_queue.pop(0)
+            traversal_utility.invalidate_interface_visibility()
+            turn_management_utility.manage_enemy_turn()
             if constants.effect_manager.effect_active('fast_turn'):
                 constants.end_turn_wait_time = 0
             constants.previous_turn_time = time.time()
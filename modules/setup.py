@@ -10,6 +10,8 @@ import modules.constants.flags as flags
 import modules.util.scaling as scaling
 import modules.util.actor_utility as actor_utility
 import modules.util.game_transitions as game_transitions
+import modules.util.drawing_utility as drawing_utility
+import modules.util.main_loop_utility as main_loop_utility
 import modules.constructs.fonts as fonts
 import modules.constructs.countries as countries
 import modules.constructs.worker_types as worker_types
@@ -1991,6 +1993,8 @@ def debug_tools():
             constants.effect_manager.set_effect(current_effect, True)
         else:
             print('Invalid effect: ' + current_effect)
+    constants.effect_manager.subscribe('hide_grid_lines', drawing_utility.set_hide_grid_lines) #checked every frame, so saved when changed instead
+    constants.effect_manager.subscribe('track_fps', main_loop_utility.set_track_fps)
 
 def manage_crash(exception):
     '''
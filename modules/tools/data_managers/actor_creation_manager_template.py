@@ -1,6 +1,5 @@
 #Contains functionality for creating new instances of mobs, buildings, dice, and ministers
 
-import random
 from ...actor_types import mobs, buildings
 from ...actor_types.mob_types import vehicles, officers, dummy, workers
 from ...actor_types.mob_types.group_types import battalions, caravans, construction_gangs, expeditions, missionaries, porters, work_crews
@@ -341,6 +340,8 @@ class actor_creation_manager_template(): #can get instance from anywhere and cre
                 new_element = images.warning_image(input_dict)
             elif base == 'loading image template':
                 new_element = images.loading_image_template(input_dict)
+            elif base == 'save thumbnail':
+                new_element = images.save_thumbnail_image(input_dict)
             elif base == 'mouse follower':
                 new_element = mouse_followers.mouse_follower_template(input_dict)
 
@@ -442,7 +443,7 @@ class actor_creation_manager_template(): #can get instance from anywhere and cre
         Output:
             None
         '''
-        for i in range(0, constants.minister_limit - 2 + random.randrange(-2, 3)):
+        for i in range(0, constants.minister_limit - 2 + constants.random_manager.get_stream('corruption').randrange(-2, 3)):
             self.create_minister(False, {})
 
     def create_minister(self, from_save, input_dict):
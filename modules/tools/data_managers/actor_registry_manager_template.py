@@ -0,0 +1,244 @@
+#Contains functionality for ordered collections of actors that can be added to and removed from without copying, and for indexes of actors by grid, building type, and available workers
+
+class actor_registry():
+    '''
+    Ordered collection of unique objects that can be added to, removed from, and searched in constant time, used in place of lists of actors. Can be iterated over, indexed, and
+        measured like a list. Iterating goes through the contents at the time iteration started, so objects can be added or removed while iterating
+    '''
+    def __init__(self):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.contents = {} #dictionaries keep insertion order, allowing the keys to be used as an ordered set
+        self.content_list = None
+        self.content_indexes = None
+
+    def add(self, item):
+        '''
+        Description:
+            Adds the inputted object to the end of this collection if it is not already included
+        Input:
+            any type item: Object to add
+        Output:
+            None
+        '''
+        if not item in self.contents:
+            self.contents[item] = None
+            self.content_list = None
+            self.content_indexes = None
+
+    def remove(self, item):
+        '''
+        Description:
+            Removes the inputted object from this collection if it is included
+        Input:
+            any type item: Object to remove
+        Output:
+            None
+        '''
+        if item in self.contents:
+            del self.contents[item]
+            self.content_list = None
+            self.content_indexes = None
+
+    def sort(self, key):
+        '''
+        Description:
+            Reorders this collection's contents based on the inputted key function, like list.sort. Contents with equal keys keep their previous order
+        Input:
+            function key: Function that returns the value to sort each object by
+        Output:
+            None
+        '''
+        self.contents = dict.fromkeys(sorted(self.contents, key=key))
+        self.content_list = None
+        self.content_indexes = None
+
+    def get_list(self):
+        '''
+        Description:
+            Returns a list of this collection's contents in the order they were added. The same list is returned until the contents change, and is never changed afterward
+        Input:
+            None
+        Output:
+            any type list: Returns a list of this collection's contents
+        '''
+        if self.content_list == None:
+            self.content_list = list(self.contents)
+        return(self.content_list)
+
+    def index(self, item):
+        '''
+        Description:
+            Returns the position of the inputted object in this collection, like list.index
+        Input:
+            any type item: Object to find the position of
+        Output:
+            int: Returns the position of the inputted object in this collection
+        '''
+        if self.content_indexes == None:
+            self.content_indexes = {}
+            for current_index, current_item in enumerate(self.get_list()):
+                self.content_indexes[current_item] = current_index
+        if not item in self.content_indexes:
+            raise ValueError(str(item) + ' is not in registry')
+        return(self.content_indexes[item])
+
+    def copy(self):
+        '''
+        Description:
+            Returns a new list of this collection's contents, like list.copy
+        Input:
+            None
+        Output:
+            any type list: Returns a new list of this collection's contents
+        '''
+        return(list(self.get_list()))
+
+    def __iter__(self):
+        '''
+        Description:
+            Returns an iterator over this collection's contents at the time iteration started
+        Input:
+            None
+        Output:
+            iterator: Returns an iterator over this collection's contents
+        '''
+        return(iter(self.get_list()))
+
+    def __len__(self):
+        '''
+        Description:
+            Returns the number of objects in this collection
+        Input:
+            None
+        Output:
+            int: Returns the number of objects in this collection
+        '''
+        return(len(self.contents))
+
+    def __getitem__(self, index):
+        '''
+        Description:
+            Returns the object at the inputted position in this collection, like indexing a list
+        Input:
+            int/slice index: Position or positions to return
+        Output:
+            any type: Returns the object or list of objects at the inputted position
+        '''
+        return(self.get_list()[index])
+
+    def __contains__(self, item):
+        '''
+        Description:
+            Returns whether the inputted object is in this collection
+        Input:
+            any type item: Object to search for
+        Output:
+            boolean: Returns whether the inputted object is in this collection
+        '''
+        return(item in self.contents)
+
+    def __add__(self, other):
+        '''
+        Description:
+            Returns a new list of this collection's contents followed by the inputted collection's contents, like adding lists
+        Input:
+            any type list other: Collection to add to the end
+        Output:
+            any type list: Returns a new list of both collections' contents
+        '''
+        return(self.get_list() + list(other))
+
+class actor_registry_manager_template():
+    '''
+    Object that keeps secondary indexes of actors, like the mobs on each grid or the buildings of each type, allowing them to be found without searching every actor. Each index
+        is an actor registry, and each index is kept up to date as actors are created, moved between grids, changed, and removed
+    '''
+    def __init__(self):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.indexes = {}
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        index_sizes = {}
+        for index_type, key in self.indexes:
+            index_sizes[index_type] = index_sizes.get(index_type, 0) + len(self.indexes[(index_type, key)])
+        return('Actor registries: ' + ', '.join([index_type + ' ' + str(index_sizes[index_type]) for index_type in index_sizes]))
+
+    def get_index(self, index_type, key):
+        '''
+        Description:
+            Returns the actors in the inputted index with the inputted key, like the buildings with the building type 'port'
+        Input:
+            string index_type: Type of index, like 'grid', 'building_type', or 'available_workers'
+            any type key: Value the actors are indexed by, like a grid or building type
+        Output:
+            actor_registry: Returns the actors with the inputted key, in the order they were added
+        '''
+        if not (index_type, key) in self.indexes:
+            self.indexes[(index_type, key)] = actor_registry()
+        return(self.indexes[(index_type, key)])
+
+    def add_to_index(self, index_type, key, item):
+        '''
+        Description:
+            Adds the inputted actor to the inputted index with the inputted key
+        Input:
+            string index_type: Type of index, like 'grid', 'building_type', or 'available_workers'
+            any type key: Value the actor is indexed by, like a grid or building type
+            actor item: Actor to add
+        Output:
+            None
+        '''
+        self.get_index(index_type, key).add(item)
+
+    def remove_from_index(self, index_type, key, item):
+        '''
+        Description:
+            Removes the inputted actor from the inputted index with the inputted key
+        Input:
+            string index_type: Type of index, like 'grid', 'building_type', or 'available_workers'
+            any type key: Value the actor is indexed by, like a grid or building type
+            actor item: Actor to remove
+        Output:
+            None
+        '''
+        if (index_type, key) in self.indexes:
+            self.indexes[(index_type, key)].remove(item)
+
+    def update_index(self, index_type, key, item, included):
+        '''
+        Description:
+            Adds the inputted actor to or removes it from the inputted index with the inputted key, based on whether it currently meets the index's condition
+        Input:
+            string index_type: Type of index, like 'available_workers'
+            any type key: Value the actor is indexed by
+            actor item: Actor to add or remove
+            boolean included: Whether the actor should be included in the index
+        Output:
+            None
+        '''
+        if included:
+            self.add_to_index(index_type, key, item)
+        else:
+            self.remove_from_index(index_type, key, item)
@@ -2,7 +2,8 @@ import modules.constants.constants as constants
 
 class effect_manager_template():
     '''
-    Object that controls global effects
+    Object that controls global effects. Keeps the number of active effects of each type, allowing effects to be checked without searching every effect, and notifies
+        subscribed functions whenever a type of effect becomes active or inactive
     '''
     def __init__(self):
         '''
@@ -14,7 +15,10 @@ class effect_manager_template():
             None
         '''
         self.possible_effects = []
-        self.active_effects = []
+        self.possible_effect_types = {} #effects of each type
+        self.active_effects = {} #active effects, in the order they were activated
+        self.active_effect_types = {} #number of active effects of each type with at least 1 active effect
+        self.subscribers = {} #functions to call when each type of effect becomes active or inactive
 
     def __str__(self):
         '''
@@ -30,6 +34,18 @@ class effect_manager_template():
             text += '\n    ' + current_effect.__str__()
         return(text)
 
+    def add_possible_effect(self, new_effect):
+        '''
+        Description:
+            Records that the inputted effect exists and can be activated
+        Input:
+            effect new_effect: Effect to record
+        Output:
+            None
+        '''
+        self.possible_effects.append(new_effect)
+        self.possible_effect_types.setdefault(new_effect.effect_type, []).append(new_effect)
+
     def effect_active(self, effect_type):
         '''
         Description:
@@ -39,10 +55,7 @@ class effect_manager_template():
         Output:
             boolean: Returns whether any effect of the inputted type is active
         '''
-        for current_effect in self.active_effects:
-            if current_effect.effect_type == effect_type:
-                return(True)
-        return(False)
+        return(effect_type in self.active_effect_types)
 
     def set_effect(self, effect_type, new_status):
         '''
@@ -54,12 +67,11 @@ class effect_manager_template():
         Output:
             None
         '''
-        for current_effect in self.possible_effects:
-            if current_effect.effect_type == effect_type:
-                if new_status == True:
-                    current_effect.apply()
-                else:
-                    current_effect.remove()
+        for current_effect in self.possible_effect_types.get(effect_type, []):
+            if new_status == True:
+                current_effect.apply()
+            else:
+                current_effect.remove()
 
     def effect_exists(self, effect_type):
         '''
@@ -70,7 +82,61 @@ class effect_manager_template():
         Output:
             boolean: Returns whether any effects of the inputted type exist
         '''
-        for current_effect in self.possible_effects:
-            if current_effect.effect_type == effect_type:
-                return(True)
-        return(False)
\ No newline at end of file
+        return(effect_type in self.possible_effect_types)
+
+    def activate(self, current_effect):
+        '''
+        Description:
+            Records that the inputted effect is active, notifying subscribers if it is the first active effect of its type
+        Input:
+            effect current_effect: Effect that became active
+        Output:
+            None
+        '''
+        if not current_effect in self.active_effects:
+            self.active_effects[current_effect] = None
+            self.active_effect_types[current_effect.effect_type] = self.active_effect_types.get(current_effect.effect_type, 0) + 1
+            if self.active_effect_types[current_effect.effect_type] == 1:
+                self.notify_subscribers(current_effect.effect_type)
+
+    def deactivate(self, current_effect):
+        '''
+        Description:
+            Records that the inputted effect is inactive, notifying subscribers if no other effects of its type are active
+        Input:
+            effect current_effect: Effect that became inactive
+        Output:
+            None
+        '''
+        if current_effect in self.active_effects:
+            del self.active_effects[current_effect]
+            self.active_effect_types[current_effect.effect_type] -= 1
+            if self.active_effect_types[current_effect.effect_type] == 0:
+                del self.active_effect_types[current_effect.effect_type]
+                self.notify_subscribers(current_effect.effect_type)
+
+    def subscribe(self, effect_type, function):
+        '''
+        Description:
+            Calls the inputted function with whether the inputted type of effect is active, both immediately and whenever that type of effect becomes active or inactive. Allows
+                frequently checked effects to be saved by the code that uses them
+        Input:
+            string effect_type: Type of effect to subscribe to
+            function function: Function to call with a boolean input of whether the inputted type of effect is active
+        Output:
+            None
+        '''
+        self.subscribers.setdefault(effect_type, []).append(function)
+        function(self.effect_active(effect_type))
+
+    def notify_subscribers(self, effect_type):
+        '''
+        Description:
+            Calls each function subscribed to the inputted type of effect with whether it is active
+        Input:
+            string effect_type: Type of effect that became active or inactive
+        Output:
+            None
+        '''
+        for current_function in self.subscribers.get(effect_type, []):
+            current_function(self.effect_active(effect_type))
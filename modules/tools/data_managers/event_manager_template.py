@@ -1,9 +1,12 @@
+import heapq
 from ...constructs import events
+from ...util import drawing_utility, traversal_utility
 import modules.constants.constants as constants
 
 class event_manager_template():
     '''
-    Object that tracks a list of events and calls the relevant functions once an inputted amount of time has passed
+    Object that tracks a list of events and calls the relevant functions once an inputted amount of time has passed. Events are kept in a heap sorted by the time they activate,
+        so each update only needs to check the events that are ready to activate
     '''
     def __init__(self):
         '''
@@ -14,10 +17,57 @@ class event_manager_template():
         Output:
             None
         '''
-        self.event_list = []
-        self.event_time_list = []
+        self.event_heap = [] #(activation deadline, order added, event) for each event, including removed events not yet reached
+        self.event_list = {} #events that have not been activated or removed, in the order they were added
+        self.num_events_added = 0
+        self.num_events_activated = 0
+        self.num_events_removed = 0
         self.previous_time = 0.0
 
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        text = 'Events: ' + str(len(self.event_list)) + ' scheduled, ' + str(self.num_events_activated) + ' activated, ' + str(self.num_events_removed) + ' removed'
+        scheduled_event_counts = self.get_scheduled_event_counts()
+        for function_name in scheduled_event_counts:
+            text += '\n    ' + function_name + ': ' + str(scheduled_event_counts[function_name])
+        return(text)
+
+    def get_scheduled_event_counts(self):
+        '''
+        Description:
+            Returns the number of scheduled events that will call each function
+        Input:
+            None
+        Output:
+            dictionary: Returns a dictionary with function name keys and number of scheduled events values
+        '''
+        scheduled_event_counts = {}
+        for current_event in self.event_list:
+            function_name = getattr(current_event.function, '__qualname__', str(current_event.function))
+            scheduled_event_counts[function_name] = scheduled_event_counts.get(function_name, 0) + 1
+        return(scheduled_event_counts)
+
+    def schedule(self, new_event):
+        '''
+        Description:
+            Schedules the inputted event to activate once its activation time has passed since the most recent update
+        Input:
+            event new_event: Event to schedule
+        Output:
+            None
+        '''
+        new_event.deadline = self.previous_time + new_event.activation_time
+        self.event_list[new_event] = None
+        heapq.heappush(self.event_heap, (new_event.deadline, self.num_events_added, new_event))
+        self.num_events_added += 1
+
     def add_event(self, function, inputs, activation_time):
         '''
         Description:
@@ -29,7 +79,7 @@ class event_manager_template():
         Output:
             None
         '''
-        self.event_list.append(events.event(function, inputs, activation_time, self))
+        self.schedule(events.event(function, inputs, activation_time, self))
 
     def add_repeating_event(self, function, inputs, activation_time, num_repeats = -1):
         '''
@@ -42,8 +92,24 @@ class event_manager_template():
         Output:
             None
         '''
-        self.event_list.append(events.repeating_event(function, inputs, activation_time, self, num_repeats))
-        
+        self.schedule(events.repeating_event(function, inputs, activation_time, self, num_repeats))
+
+    def cancel(self, removed_event):
+        '''
+        Description:
+            Stops the inputted event from activating. The event stays in the heap until its deadline is reached or the heap is compacted, but is ignored
+        Input:
+            event removed_event: Event to stop
+        Output:
+            None
+        '''
+        if removed_event in self.event_list:
+            del self.event_list[removed_event]
+            self.num_events_removed += 1
+            if len(self.event_heap) > 2 * len(self.event_list) + 16: #rebuild heap if mostly made of removed events
+                self.event_heap = [current_entry for current_entry in self.event_heap if current_entry[2] in self.event_list]
+                heapq.heapify(self.event_heap)
+
     def update(self, new_time):
         '''
         Description:
@@ -53,17 +119,20 @@ class event_manager_template():
         Output:
             None
         '''
-        time_difference = new_time - self.previous_time
+        self.previous_time = new_time #events added while activating are timed from this update
         activated_events = []
-        for current_event in self.event_list:
-            current_event.activation_time -= time_difference #updates event times with new time
-            if current_event.activation_time <= 0: #if any event runs out of time, activate it
-                activated_events.append(current_event)
+        while len(self.event_heap) > 0 and self.event_heap[0][0] <= new_time: #if any event runs out of time, activate it
+            deadline, order_added, current_event = heapq.heappop(self.event_heap)
+            if current_event in self.event_list:
+                del self.event_list[current_event]
+                activated_events.append((order_added, current_event))
         if len(activated_events) > 0: #when an event activates, call its stored function 
-            for current_event in activated_events:
+            drawing_utility.mark_full_redraw()
+            traversal_utility.invalidate_interface_visibility()
+            activated_events.sort(key=lambda current_entry: current_entry[0]) #events activated in the same update are called in the order they were added
+            for order_added, current_event in activated_events:
                 current_event.activate()
-                current_event.remove()
-        self.previous_time = new_time
+                self.num_events_activated += 1
 
     def clear(self):
         '''
@@ -74,11 +143,9 @@ class event_manager_template():
         Output:
             None
         '''
-        existing_events = []
-        for current_event in self.event_list:
-            existing_events.append(current_event)
-        for current_event in existing_events:
-            current_event.remove()
+        self.num_events_removed += len(self.event_list)
+        self.event_list = {}
+        self.event_heap = []
 
     def go(self):
         '''
@@ -0,0 +1,150 @@
+#Contains functionality for finding which objects are under a pixel location without checking every object
+
+class hit_test_manager_template():
+    '''
+    Object that sorts objects into layers of uniform grids of square buckets based on their Rects, allowing the objects touching a pixel location, like the mouse, to be found by only
+        checking the objects in that location's bucket
+    '''
+    def __init__(self, bucket_size):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            int bucket_size: Pixel width and height of each bucket
+        Output:
+            None
+        '''
+        self.bucket_size = bucket_size
+        self.layers = {}
+        self.order_count = 0
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        text = 'Hit test layers: '
+        for layer_name in self.layers:
+            text += '\n    ' + layer_name + ': ' + str(len(self.layers[layer_name]['orders'])) + ' objects, ' + str(len(self.layers[layer_name]['buckets'])) + ' buckets'
+        return(text)
+
+    def get_layer(self, layer_name):
+        '''
+        Description:
+            Returns the layer with the inputted name, creating it if it does not exist yet
+        Input:
+            string layer_name: Name of the layer, like 'buttons'
+        Output:
+            dictionary: Returns the layer's dictionary
+                'buckets': dictionary value - Set of the objects overlapping each bucket, with int tuple keys of bucket coordinates
+                'object_buckets': dictionary value - List of the coordinates of each bucket each object is sorted into
+                'orders': dictionary value - Order in which each object was first added, used to return objects in the order they were added
+                'outdated_objects': set value - Objects whose Rects may have changed since they were sorted into buckets
+        '''
+        if not layer_name in self.layers:
+            self.layers[layer_name] = {
+                'buckets': {},
+                'object_buckets': {},
+                'orders': {},
+                'outdated_objects': set()
+            }
+        return(self.layers[layer_name])
+
+    def invalidate(self, layer_name, target):
+        '''
+        Description:
+            Records that the inputted object was created, moved, or resized, adding it to the inputted layer if it is not already present. The object is sorted into buckets based on
+                its get_hit_test_rects function the next time the layer is searched
+        Input:
+            string layer_name: Name of the layer to add the object to
+            object target: Object with a get_hit_test_rects function
+        Output:
+            None
+        '''
+        layer = self.get_layer(layer_name)
+        if not target in layer['orders']:
+            layer['orders'][target] = self.order_count
+            self.order_count += 1
+        layer['outdated_objects'].add(target)
+
+    def remove(self, layer_name, target):
+        '''
+        Description:
+            Removes the inputted object from the inputted layer, if present
+        Input:
+            string layer_name: Name of the layer to remove the object from
+            object target: Object to remove
+        Output:
+            None
+        '''
+        layer = self.get_layer(layer_name)
+        if target in layer['orders']:
+            self.remove_from_buckets(layer, target)
+            del layer['orders'][target]
+            layer['outdated_objects'].discard(target)
+
+    def remove_from_buckets(self, layer, target):
+        '''
+        Description:
+            Removes the inputted object from each bucket of the inputted layer that it is sorted into
+        Input:
+            dictionary layer: Layer to remove the object from
+            object target: Object to remove
+        Output:
+            None
+        '''
+        for bucket_coordinates in layer['object_buckets'].pop(target, []):
+            bucket = layer['buckets'][bucket_coordinates]
+            bucket.discard(target)
+            if not bucket:
+                del layer['buckets'][bucket_coordinates]
+
+    def update_layer(self, layer):
+        '''
+        Description:
+            Sorts each outdated object of the inputted layer into the buckets its Rects currently overlap
+        Input:
+            dictionary layer: Layer to update
+        Output:
+            None
+        '''
+        for outdated_object in layer['outdated_objects']:
+            self.remove_from_buckets(layer, outdated_object)
+            bucket_coordinates_list = []
+            for current_rect in outdated_object.get_hit_test_rects():
+                if current_rect.width > 0 and current_rect.height > 0:
+                    for bucket_x in range(current_rect.left // self.bucket_size, ((current_rect.right - 1) // self.bucket_size) + 1):
+                        for bucket_y in range(current_rect.top // self.bucket_size, ((current_rect.bottom - 1) // self.bucket_size) + 1):
+                            if not (bucket_x, bucket_y) in bucket_coordinates_list:
+                                bucket_coordinates_list.append((bucket_x, bucket_y))
+            for bucket_coordinates in bucket_coordinates_list:
+                layer['buckets'].setdefault(bucket_coordinates, set()).add(outdated_object)
+            layer['object_buckets'][outdated_object] = bucket_coordinates_list
+        layer['outdated_objects'] = set()
+
+    def find(self, layer_name, position):
+        '''
+        Description:
+            Returns the objects of the inputted layer with a Rect containing the inputted pixel location, in the order they were added
+        Input:
+            string layer_name: Name of the layer to search
+            int tuple position: Two values representing x and y pixel coordinates, like the mouse position
+        Output:
+            object list: Returns the objects with a Rect containing the inputted location
+        '''
+        layer = self.get_layer(layer_name)
+        if layer['outdated_objects']:
+            self.update_layer(layer)
+        bucket = layer['buckets'].get((position[0] // self.bucket_size, position[1] // self.bucket_size), ())
+        found_objects = []
+        for current_object in bucket:
+            for current_rect in current_object.get_hit_test_rects():
+                if current_rect.collidepoint(position):
+                    found_objects.append(current_object)
+                    break
+        found_objects.sort(key=layer['orders'].get)
+        return(found_objects)
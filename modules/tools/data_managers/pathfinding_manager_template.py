@@ -0,0 +1,310 @@
+#Contains functionality for finding the least costly routes for units to move between cells
+
+import heapq
+import array
+import weakref
+import modules.constants.constants as constants
+
+class pathfinding_manager_template():
+    '''
+    Object that finds the routes with the lowest total movement cost between cells with A* search, following the same movement rules and costs as moving one cell at a time. The cost
+        of moving in each direction from each cell is saved in flat arrays for each grid and class of unit, as units with the same movement capabilities always have the same costs.
+        The arrays are calculated from the grid's terrain, visibility, and infrastructure arrays, and only the costs to and from a cell are recalculated when that cell changes
+    '''
+    def __init__(self):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.cost_arrays = weakref.WeakKeyDictionary() #grids from previous games are not kept by their cost arrays
+        self.directions = [(-1, 0), (1, 0), (0, -1), (0, 1)] #left, right, down, and up, in the order of each grid's cost arrays
+        self.num_searches = 0
+        self.num_cost_array_creations = 0
+        self.num_cell_updates = 0
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        num_cost_arrays = 0
+        for current_grid in self.cost_arrays:
+            num_cost_arrays += len(self.cost_arrays[current_grid])
+        return('Pathfinding: ' + str(num_cost_arrays) + ' unit class cost arrays, ' + str(self.num_cost_array_creations) + ' cost array creations, ' +
+            str(self.num_cell_updates) + ' cell updates, ' + str(self.num_searches) + ' searches')
+
+    def get_movement_rules(self, unit):
+        '''
+        Description:
+            Returns the values that determine where the inputted unit can move and how much each movement costs, which are shared by all units of the same class
+        Input:
+            pmob unit: Unit to find the movement rules of
+        Output:
+            dictionary: Returns a dictionary of the unit's movement values, like 'movement_cost' and 'can_swim_river'
+        '''
+        return({
+            'movement_cost': unit.movement_cost,
+            'max_movement_points': unit.max_movement_points,
+            'can_walk': unit.can_walk,
+            'can_swim': unit.can_swim,
+            'can_swim_river': unit.can_swim_river,
+            'can_swim_ocean': unit.can_swim_ocean,
+            'railroad_only': unit.is_vehicle and unit.vehicle_type == 'train',
+            'uniform_movement_cost': unit.uniform_movement_cost
+        })
+
+    def get_unit_class(self, unit):
+        '''
+        Description:
+            Returns a value shared by all units that have the same movement capabilities and costs as the inputted unit
+        Input:
+            pmob unit: Unit to find the class of
+        Output:
+            tuple: Returns a value shared by all units with the same movement capabilities and costs
+        '''
+        return(tuple(self.get_movement_rules(unit).values()))
+
+    def can_enter(self, movement_rules, grid, origin_index, destination_index):
+        '''
+        Description:
+            Returns whether a unit with the inputted movement rules could ever move from the inputted cell to the inputted adjacent cell, based on the terrain, visibility, and
+                infrastructure arrays of the inputted grid. Unlike can_move, does not depend on the unit's current location, movement points, or enemy units
+        Input:
+            dictionary movement_rules: Movement rules of the unit that would move, as returned by get_movement_rules
+            grid grid: Grid containing the cells
+            int origin_index: Index of the cell the unit would move from in the grid's cell arrays
+            int destination_index: Index of the cell the unit would move to in the grid's cell arrays
+        Output:
+            boolean: Returns whether the unit could move from the origin cell to the destination cell
+        '''
+        if not grid.visibility[destination_index]: #routes are only planned through explored cells
+            return(False)
+        destination_mask = grid.infrastructure_masks[destination_index]
+        if movement_rules['railroad_only']:
+            railroad_mask = constants.infrastructure_mask_dict['railroad']
+            return(bool(grid.infrastructure_masks[origin_index] & railroad_mask and destination_mask & railroad_mask))
+        destination_y = destination_index % grid.coordinate_height
+        if grid.terrain_ids[destination_index] != constants.terrain_id_list.index('water'):
+            return(movement_rules['can_walk'] or bool(destination_mask & constants.infrastructure_mask_dict['port'] and (movement_rules['can_swim_river'] or destination_y <= 1)))
+        if destination_y == 0:
+            return(movement_rules['can_swim'] and movement_rules['can_swim_ocean'])
+        return((movement_rules['can_swim'] and movement_rules['can_swim_river']) or movement_rules['can_walk']) #units that can walk can move slowly through rivers without canoes
+
+    def has_walking_connection(self, grid, origin_index, destination_index, direction_index):
+        '''
+        Description:
+            Returns whether a walking-only unit could move between the inputted adjacent cells, based on their terrains and whether a bridge connects them, like
+                cell.has_walking_connection
+        Input:
+            grid grid: Grid containing the cells
+            int origin_index: Index of the cell moved from in the grid's cell arrays
+            int destination_index: Index of the cell moved to in the grid's cell arrays
+            int direction_index: Index of the direction moved in, with 0 and 1 for left and right and 2 and 3 for down and up
+        Output:
+            boolean: Returns whether the cells have a walking connection
+        '''
+        water_id = constants.terrain_id_list.index('water')
+        origin_water = grid.terrain_ids[origin_index] == water_id
+        destination_water = grid.terrain_ids[destination_index] == water_id
+        if not (origin_water or destination_water):
+            return(True)
+        if origin_water and destination_water:
+            return(False)
+        if origin_water:
+            water_mask = grid.infrastructure_masks[origin_index]
+        else:
+            water_mask = grid.infrastructure_masks[destination_index]
+        if not water_mask & constants.infrastructure_mask_dict['bridge']:
+            return(False)
+        return(bool(water_mask & constants.infrastructure_mask_dict['vertical_bridge']) == (direction_index >= 2)) #bridges connect the land on either side of them
+
+    def get_array_step_cost(self, movement_rules, grid, origin_index, direction_index):
+        '''
+        Description:
+            Returns the movement point cost for a unit with the inputted movement rules to move from the inputted cell in the inputted direction, calculated from the grid's
+                terrain, visibility, and infrastructure arrays with the same rules as get_movement_cost
+        Input:
+            dictionary movement_rules: Movement rules of the unit that would move, as returned by get_movement_rules
+            grid grid: Grid containing the cell
+            int origin_index: Index of the cell moved from in the grid's cell arrays
+            int direction_index: Index of the direction moved in, with 0 and 1 for left and right and 2 and 3 for down and up
+        Output:
+            double: Returns the cost in movement points, or -1 if the unit can not make the movement
+        '''
+        x_change, y_change = self.directions[direction_index]
+        destination_x = origin_index // grid.coordinate_height + x_change
+        destination_y = origin_index % grid.coordinate_height + y_change
+        if not (0 <= destination_x < grid.coordinate_width and 0 <= destination_y < grid.coordinate_height):
+            return(-1)
+        destination_index = grid.get_cell_index(destination_x, destination_y)
+        if not self.can_enter(movement_rules, grid, origin_index, destination_index):
+            return(-1)
+        if movement_rules['uniform_movement_cost'] or movement_rules['railroad_only']:
+            return(movement_rules['movement_cost'])
+        destination_terrain = constants.terrain_id_list[grid.terrain_ids[destination_index]]
+        cost = movement_rules['movement_cost'] * constants.terrain_movement_cost_dict[destination_terrain]
+        if self.has_walking_connection(grid, origin_index, destination_index, direction_index):
+            infrastructure_mask = constants.infrastructure_mask_dict['road'] | constants.infrastructure_mask_dict['railroad']
+            if grid.infrastructure_masks[origin_index] & infrastructure_mask and grid.infrastructure_masks[destination_index] & infrastructure_mask:
+                cost = cost / 2
+        elif destination_terrain == 'water' and destination_y > 0 and movement_rules['can_walk'] and not movement_rules['can_swim_river']: #rivers without canoes
+            cost = movement_rules['max_movement_points']
+        return(cost)
+
+    def get_cost_arrays(self, unit, grid):
+        '''
+        Description:
+            Returns the inputted unit's class' movement costs on the inputted grid, calculating them from the grid's cell arrays the first time they are needed
+        Input:
+            pmob unit: Unit to find the movement costs of
+            grid grid: Grid to find the movement costs on
+        Output:
+            array list: Returns a list of 4 arrays of movement costs, for moving left, right, down, and up from each cell in the grid's cell arrays, with -1 for impossible
+                movements
+        '''
+        return(self.get_unit_class_costs(unit, grid)['cost_arrays'])
+
+    def get_unit_class_costs(self, unit, grid):
+        '''
+        Description:
+            Returns the saved movement costs of the inputted unit's class on the inputted grid, calculating them from the grid's cell arrays the first time they are needed
+        Input:
+            pmob unit: Unit to find the movement costs of
+            grid grid: Grid to find the movement costs on
+        Output:
+            dictionary: Returns a dictionary with the class' 'movement_rules', 'cost_arrays' for moving in each direction from each cell, and 'min_step_cost', which is never more
+                than the lowest cost of any possible step on the grid
+        '''
+        grid_cost_arrays = self.cost_arrays.setdefault(grid, {})
+        unit_class = self.get_unit_class(unit)
+        if not unit_class in grid_cost_arrays:
+            movement_rules = self.get_movement_rules(unit)
+            num_cells = grid.coordinate_width * grid.coordinate_height
+            cost_arrays = [array.array('d', [-1.0]) * num_cells for direction in self.directions]
+            for direction_index in range(len(self.directions)):
+                current_cost_array = cost_arrays[direction_index]
+                for origin_index in range(num_cells):
+                    current_cost_array[origin_index] = self.get_array_step_cost(movement_rules, grid, origin_index, direction_index)
+            possible_costs = [cost for current_cost_array in cost_arrays for cost in current_cost_array if cost != -1]
+            if len(possible_costs) > 0:
+                min_step_cost = min(possible_costs)
+            else:
+                min_step_cost = movement_rules['movement_cost'] * min(constants.terrain_movement_cost_dict.values()) / 2 #cheapest step possible with a road or railroad
+            grid_cost_arrays[unit_class] = {'movement_rules': movement_rules, 'cost_arrays': cost_arrays, 'min_step_cost': min_step_cost}
+            self.num_cost_array_creations += 1
+        return(grid_cost_arrays[unit_class])
+
+    def update_cell(self, grid, cell_index):
+        '''
+        Description:
+            Recalculates the costs of moving to and from the inputted cell for each class of unit with cost arrays on the inputted grid, used whenever the cell's terrain,
+                visibility, or infrastructure arrays change
+        Input:
+            grid grid: Grid containing the cell
+            int cell_index: Index of the changed cell in the grid's cell arrays
+        Output:
+            None
+        '''
+        if not grid in self.cost_arrays:
+            return()
+        x = cell_index // grid.coordinate_height
+        y = cell_index % grid.coordinate_height
+        updated_indexes = [cell_index]
+        for x_change, y_change in self.directions:
+            if 0 <= x + x_change < grid.coordinate_width and 0 <= y + y_change < grid.coordinate_height:
+                updated_indexes.append(grid.get_cell_index(x + x_change, y + y_change))
+        for unit_class_costs in self.cost_arrays[grid].values():
+            for origin_index in updated_indexes:
+                for direction_index in range(len(self.directions)):
+                    cost = self.get_array_step_cost(unit_class_costs['movement_rules'], grid, origin_index, direction_index)
+                    unit_class_costs['cost_arrays'][direction_index][origin_index] = cost
+                    if cost != -1 and cost < unit_class_costs['min_step_cost']: #only lowered, so it stays a lower bound if the cheapest step is later removed
+                        unit_class_costs['min_step_cost'] = cost
+        self.num_cell_updates += 1
+
+    def get_step_cost(self, unit, origin_coordinates, destination_coordinates):
+        '''
+        Description:
+            Returns the movement point cost for the inputted unit to move from the inputted coordinates to the inputted adjacent coordinates on its grid
+        Input:
+            pmob unit: Unit that would move
+            int tuple origin_coordinates: Two values representing the x and y coordinates to move from
+            int tuple destination_coordinates: Two values representing the x and y coordinates to move to
+        Output:
+            double: Returns the cost in movement points, or -1 if the unit can not make the movement
+        '''
+        grid = unit.grids[0]
+        direction_index = self.directions.index((destination_coordinates[0] - origin_coordinates[0], destination_coordinates[1] - origin_coordinates[1]))
+        return(self.get_cost_arrays(unit, grid)[direction_index][grid.get_cell_index(origin_coordinates[0], origin_coordinates[1])])
+
+    def find_path(self, unit, destination_coordinates, origin_coordinates = 'default'):
+        '''
+        Description:
+            Finds the route with the lowest total movement cost for the inputted unit between the inputted coordinates on its grid, avoiding cells with enemy units. The distance
+                on each axis multiplied by the lowest possible cost of a single step is used to estimate the remaining cost, which never overestimates and so always finds the least
+                costly route
+        Input:
+            pmob unit: Unit to find a route for
+            int tuple destination_coordinates: Two values representing the x and y coordinates to find a route to
+            int tuple origin_coordinates = 'default': Two values representing the x and y coordinates to find a route from, or 'default' to use the unit's current location
+        Output:
+            string/int tuple list: Returns a list of the coordinates of each step of the route, not including the origin, or 'none' if no route exists
+        '''
+        grid = unit.grids[0]
+        if grid.is_abstract_grid:
+            return('none')
+        if origin_coordinates == 'default':
+            origin_coordinates = (unit.x, unit.y)
+        destination_x, destination_y = destination_coordinates
+        if not (0 <= destination_x < grid.coordinate_width and 0 <= destination_y < grid.coordinate_height):
+            return('none')
+        self.num_searches += 1
+        unit_class_costs = self.get_unit_class_costs(unit, grid)
+        cost_arrays = unit_class_costs['cost_arrays']
+        height = grid.coordinate_height
+        index_changes = [-1 * height, height, -1, 1] #change in cell index when moving left, right, down, and up
+        min_step_cost = unit_class_costs['min_step_cost'] #lowest cost of any step on the grid, using a road or railroad on the cheapest terrain if there are any
+        origin_index = grid.get_cell_index(origin_coordinates[0], origin_coordinates[1])
+        destination_index = grid.get_cell_index(destination_x, destination_y)
+
+        blocked = {} #whether each cell reached has enemy units, checked when first reached as enemies move each turn
+        previous_indexes = {origin_index: -1}
+        total_costs = {origin_index: 0}
+        num_queued = 0
+        frontier = [(0, num_queued, origin_index)] #sorted by estimated total cost, then by the order queued to keep routes consistent between searches
+        while len(frontier) > 0:
+            estimated_cost, queue_order, current_index = heapq.heappop(frontier)
+            if current_index == destination_index:
+                path = []
+                while current_index != origin_index:
+                    path.append((current_index // height, current_index % height))
+                    current_index = previous_indexes[current_index]
+                path.reverse()
+                return(path)
+            current_cost = total_costs[current_index]
+            if estimated_cost > current_cost + min_step_cost * (abs(destination_x - current_index // height) + abs(destination_y - current_index % height)):
+                continue #skip if a cheaper route to this cell was already found
+            for direction_index in range(4):
+                step_cost = cost_arrays[direction_index][current_index]
+                if step_cost == -1:
+                    continue
+                adjacent_index = current_index + index_changes[direction_index]
+                if not adjacent_index in blocked:
+                    blocked[adjacent_index] = grid.cell_list[adjacent_index // height][adjacent_index % height].has_npmob()
+                if blocked[adjacent_index]:
+                    continue
+                new_cost = current_cost + step_cost
+                if (not adjacent_index in total_costs) or new_cost < total_costs[adjacent_index]:
+                    total_costs[adjacent_index] = new_cost
+                    previous_indexes[adjacent_index] = current_index
+                    num_queued += 1
+                    heapq.heappush(frontier, (new_cost + min_step_cost * (abs(destination_x - adjacent_index // height) + abs(destination_y - adjacent_index % height)), num_queued, adjacent_index))
+        return('none')
@@ -0,0 +1,159 @@
+#Contains functionality for seeded random number streams that are independent for each game subsystem
+
+import random
+import math
+
+class random_manager_template():
+    '''
+    Object that controls a separate seeded random number generator for each game subsystem, like terrain generation or combat, allowing a game to be replayed identically from
+        the same seed and inputs. Randomness that only affects appearance, like portraits, names, and rolling dice animations, uses the global random module instead so that it
+        does not change the results of any subsystem, except for variants chosen as units are created, like worker images, which use the 'appearance' stream so that a replayed
+        game creates identical units
+    '''
+    def __init__(self, stream_names):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            string list stream_names: Names of the subsystems that each have their own stream, like 'terrain'
+        Output:
+            None
+        '''
+        self.stream_names = stream_names
+        self.seed = 0
+        self.streams = {}
+        for stream_name in self.stream_names:
+            self.streams[stream_name] = random.Random()
+        self.set_seed(self.seed)
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        return('Random streams: seed ' + str(self.seed) + ', ' + ', '.join(self.stream_names))
+
+    def set_seed(self, new_seed):
+        '''
+        Description:
+            Reseeds each stream from the inputted game seed, with each stream's seed also depending on its name so that streams are independent of each other
+        Input:
+            int new_seed: New game seed
+        Output:
+            None
+        '''
+        self.seed = new_seed
+        for stream_name in self.stream_names:
+            self.streams[stream_name].seed(str(new_seed) + ' ' + stream_name) #string seeds are hashed the same way on every run and platform
+
+    def get_stream(self, stream_name):
+        '''
+        Description:
+            Returns the random number generator for the inputted subsystem
+        Input:
+            string stream_name: Name of the subsystem, like 'combat'
+        Output:
+            random.Random: Returns the subsystem's random number generator
+        '''
+        return(self.streams[stream_name])
+
+    def binomial(self, stream_name, num_trials, success_chance):
+        '''
+        Description:
+            Returns how many of the inputted number of independent trials succeed, each with the inputted chance, using a single value from the inputted subsystem's stream. The
+                value is compared to the chance of each number of successes in order of closeness to the most likely number, so the time taken depends on the spread of the
+                possible results rather than the number of trials
+        Input:
+            string stream_name: Name of the subsystem, like 'migration'
+            int num_trials: Number of trials
+            double success_chance: Chance of each trial succeeding, from 0 to 1
+        Output:
+            int: Returns the number of successful trials
+        '''
+        if num_trials <= 0 or success_chance <= 0:
+            return(0)
+        elif success_chance >= 1:
+            return(num_trials)
+        odds = success_chance / (1 - success_chance)
+        mode = min(num_trials, int((num_trials + 1) * success_chance)) #most likely number of successes
+        mode_chance = math.exp(math.lgamma(num_trials + 1) - math.lgamma(mode + 1) - math.lgamma(num_trials - mode + 1) +
+            mode * math.log(success_chance) + (num_trials - mode) * math.log(1 - success_chance))
+        remaining_value = self.get_stream(stream_name).random() - mode_chance
+        if remaining_value < 0:
+            return(mode)
+        lower, lower_chance = (mode, mode_chance)
+        upper, upper_chance = (mode, mode_chance)
+        while lower > 0 or upper < num_trials:
+            if upper < num_trials:
+                upper_chance *= odds * (num_trials - upper) / (upper + 1)
+                upper += 1
+                remaining_value -= upper_chance
+                if remaining_value < 0:
+                    return(upper)
+            if lower > 0:
+                lower_chance *= lower / (odds * (num_trials - lower + 1))
+                lower -= 1
+                remaining_value -= lower_chance
+                if remaining_value < 0:
+                    return(lower)
+        return(mode) #only reached if the chances add to slightly less than 1 due to rounding
+
+    def multinomial(self, stream_name, num_trials, weights):
+        '''
+        Description:
+            Returns how many of the inputted number of independent trials choose each option, with each trial choosing an option with chance proportional to its weight. Found
+                one option at a time as the number of remaining trials that choose it over the options after it, so that the time taken depends on the number of options rather
+                than the number of trials
+        Input:
+            string stream_name: Name of the subsystem, like 'migration'
+            int num_trials: Number of trials
+            double list weights: Weight of each option, with at least 1 positive weight if there are any trials
+        Output:
+            int list: Returns the number of trials that chose each option
+        '''
+        counts = [0] * len(weights)
+        remaining_trials = num_trials
+        remaining_weight = sum(weights)
+        for option_index in range(len(weights)):
+            if remaining_trials == 0 or remaining_weight <= 0:
+                break
+            counts[option_index] = self.binomial(stream_name, remaining_trials, weights[option_index] / remaining_weight)
+            remaining_trials -= counts[option_index]
+            remaining_weight -= weights[option_index]
+        return(counts)
+
+    def to_save_dict(self):
+        '''
+        Description:
+            Uses this object's values to create a dictionary that can be saved and used as input to recreate it on loading
+        Input:
+            None
+        Output:
+            dictionary: Returns dictionary that can be saved and used as input to recreate it on loading
+                'seed': int value - Game seed the streams were created from
+                'stream_states': dictionary value - Internal state of each stream, allowing a loaded game to continue each stream from where it was saved
+        '''
+        save_dict = {}
+        save_dict['seed'] = self.seed
+        save_dict['stream_states'] = {}
+        for stream_name in self.stream_names:
+            save_dict['stream_states'][stream_name] = self.streams[stream_name].getstate()
+        return(save_dict)
+
+    def load(self, save_dict):
+        '''
+        Description:
+            Restores the seed and stream states from the inputted save dictionary. Streams added since the game was saved are seeded from the saved seed
+        Input:
+            dictionary save_dict: Dictionary created by to_save_dict
+        Output:
+            None
+        '''
+        self.set_seed(save_dict['seed'])
+        for stream_name in save_dict['stream_states']:
+            if stream_name in self.streams:
+                self.streams[stream_name].setstate(save_dict['stream_states'][stream_name])
@@ -2,7 +2,9 @@
 
 import random
 import pickle
-from ...util import scaling, game_transitions, turn_management_utility, text_utility, market_utility, minister_utility, actor_utility, tutorial_utility
+import time
+import threading
+from ...util import save_file_utility, scaling, game_transitions, turn_management_utility, text_utility, market_utility, minister_utility, actor_utility, tutorial_utility
 from ...interface_types import grids
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -25,6 +27,10 @@ class save_load_manager_template():
         self.copied_constants = []
         self.copied_statuses = []
         self.copied_flags = []
+        self.ordered_registries = []
+        self.autosave_thread = 'none'
+        self.autosave_error = 'none'
+        self.autosave_requested = False
         self.set_copied_elements()
 
     def set_copied_elements(self):
@@ -63,16 +69,33 @@ class save_load_manager_template():
 
         self.copied_flags = []
         self.copied_flags.append('prosecution_bribed_judge')
+
+        self.ordered_registries = [] #loading creates objects in a different order than they were created in, like native warriors being loaded with their villages
+        self.ordered_registries.append('actor_list')
+        self.ordered_registries.append('mob_list')
+        self.ordered_registries.append('pmob_list')
+        self.ordered_registries.append('npmob_list')
+        self.ordered_registries.append('beast_list')
+        self.ordered_registries.append('settlement_list')
+        self.ordered_registries.append('building_list')
+        self.ordered_registries.append('slums_list')
+        self.ordered_registries.append('resource_building_list')
         
-    def new_game(self, country):
+    def new_game(self, country, seed = 'none'):
         '''
         Description:
             Creates a new game and leaves the main menu
         Input:
             country country: Country being played in the new game
+            int/string seed = 'none': Seed for the new game's random number streams, or 'none' to choose a random seed
         Output:
             None
         '''
+        if seed == 'none':
+            seed = random.randrange(0, 2 ** 32)
+        constants.random_manager.set_seed(seed)
+        constants.save_slot_manager.set_current_slot('none')
+        self.autosave_requested = False
         flags.creating_new_game = True
         country.select()
 
@@ -87,12 +110,12 @@ class save_load_manager_template():
 
         for current_commodity in constants.commodity_types:
             if current_commodity != 'consumer goods':
-                price = round((random.randrange(1, 7) + random.randrange(1, 7))/2)
+                price = round((constants.random_manager.get_stream('market').randrange(1, 7) + constants.random_manager.get_stream('market').randrange(1, 7))/2)
                 increase = 0
                 if current_commodity == 'gold':
-                    increase = random.randrange(1, 7)
+                    increase = constants.random_manager.get_stream('market').randrange(1, 7)
                 elif current_commodity == 'diamond':
-                    increase = random.randrange(1, 7) + random.randrange(1, 7)
+                    increase = constants.random_manager.get_stream('market').randrange(1, 7) + constants.random_manager.get_stream('market').randrange(1, 7)
                 price += increase    
                 market_utility.set_price(current_commodity, price) #2-5
             else:
@@ -125,7 +148,7 @@ class save_load_manager_template():
         constants.evil_tracker.set(0)
         constants.fear_tracker.set(1)
 
-        for i in range(1, random.randrange(5, 8)):
+        for i in range(1, constants.random_manager.get_stream('ai').randrange(5, 8)):
             turn_management_utility.manage_villages(verbose=False)
             turn_management_utility.manage_warriors()
             actor_utility.spawn_beast()
@@ -154,11 +177,109 @@ class save_load_manager_template():
         Output:
             None
         '''
+        self.finish_autosave()
+        file_name = file_path
         file_path = 'save_games/' + file_path
+        save_sections, saved_metadata = self.create_save_sections()
+        save_file_utility.write_save_file(file_path, save_file_utility.pickle_sections(save_sections))
+        constants.save_slot_manager.record_save(file_name, constants.save_slot_manager.create_summary(saved_metadata))
+        text_utility.print_to_screen('Game successfully saved to ' + file_path)
+
+    def autosave(self):
+        '''
+        Description:
+            Saves the game to the next autosave slot. The game is pickled on the main thread as a snapshot, then compressed and written on another thread so that the game can
+                continue while the file is written. Pickling is the fastest way to copy the game's state, so the snapshot is not copied for another thread to pickle
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.finish_autosave() #only 1 autosave is written at a time, keeping autosave slots in order
+        file_name = constants.save_slot_manager.choose_autosave_slot()
+        save_sections, saved_metadata = self.create_save_sections()
+        pickled_sections = save_file_utility.pickle_sections(save_sections)
+        summary = constants.save_slot_manager.create_summary(saved_metadata)
+        self.autosave_thread = threading.Thread(target=self.write_autosave, args=(file_name, pickled_sections, summary))
+        self.autosave_thread.start()
+
+    def request_autosave(self):
+        '''
+        Description:
+            Autosaves the game once every notification has been closed, as notifications are not saved and choices made in them can change the game
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.autosave_requested = True
+
+    def update_autosave(self):
+        '''
+        Description:
+            Starts the requested autosave, if any, once every notification has been closed, and reports if the last autosave failed once it is finished. Called each frame by
+                the main loop
+        Input:
+            None
+        Output:
+            None
+        '''
+        if self.autosave_thread != 'none' and not self.autosave_thread.is_alive():
+            self.finish_autosave()
+        if self.autosave_requested and flags.player_turn and not (status.displayed_notification or constants.notification_manager.notification_queue or
+            constants.current_game_mode in ['main_menu', 'new_game_setup']):
+            self.autosave_requested = False
+            self.autosave()
+
+    def write_autosave(self, file_name, pickled_sections, summary):
+        '''
+        Description:
+            Writes the inputted autosave snapshot to the inputted file and records it in the save index, run on the autosave thread
+        Input:
+            string file_name: File name of the autosave slot
+            tuple list pickled_sections: Snapshot of the game, as returned by save_file_utility.pickle_sections
+            dictionary summary: Summary of the saved game for the save index
+        Output:
+            None
+        '''
+        try:
+            save_file_utility.write_save_file('save_games/' + file_name, pickled_sections)
+            constants.save_slot_manager.record_save(file_name, summary)
+        except Exception as error: #reported on the main thread once the autosave is finished, rather than ending this thread without a message
+            self.autosave_error = type(error).__name__ + ': ' + str(error)
+
+    def finish_autosave(self):
+        '''
+        Description:
+            Waits for the autosave being written, if any, to finish, reporting if it failed. Used before saving or loading so that files are not written while being read, and
+                once an autosave is finished
+        Input:
+            None
+        Output:
+            None
+        '''
+        if self.autosave_thread != 'none':
+            self.autosave_thread.join()
+            self.autosave_thread = 'none'
+        if self.autosave_error != 'none':
+            text_utility.print_to_screen('Autosave failed: ' + self.autosave_error)
+            self.autosave_error = 'none'
+
+    def create_save_sections(self):
+        '''
+        Description:
+            Collects the saved values of the current game's variables, grids, worker types, actors, ministers, and lore missions
+        Input:
+            None
+        Output:
+            tuple list, dictionary: Returns a list of (name, value, compression) tuples for each section of the save file, in the order they are loaded in, and the metadata
+                dictionary saved in the first section
+        '''
         status.transaction_history = constants.money_tracker.transaction_history
         saved_constants = {}
         for current_element in self.copied_constants:
             saved_constants[current_element] = getattr(constants, current_element)
+        saved_constants['random_manager'] = constants.random_manager.to_save_dict()
 
         saved_statuses = {}
         for current_element in self.copied_statuses:
@@ -204,17 +325,24 @@ class save_load_manager_template():
         for current_lore_mission in status.lore_mission_list:
             saved_lore_mission_dicts.append(current_lore_mission.to_save_dict())
 
-        with open(file_path, 'wb') as handle: #write wb, read rb
-            pickle.dump(saved_constants, handle)
-            pickle.dump(saved_statuses, handle)
-            pickle.dump(saved_flags, handle)
-            pickle.dump(saved_grid_dicts, handle)
-            pickle.dump(saved_worker_types, handle)
-            pickle.dump(saved_actor_dicts, handle)
-            pickle.dump(saved_minister_dicts, handle)
-            pickle.dump(saved_lore_mission_dicts, handle)
-            handle.close()
-        text_utility.print_to_screen('Game successfully saved to ' + file_path)
+        saved_metadata = { #saved separately at the start of the file, allowing it to be read without reading the rest of the save
+            'country_name': status.current_country_name,
+            'turn': constants.turn,
+            'money': constants.money,
+            'public_opinion': constants.public_opinion,
+            'saved_time': time.time()
+        }
+
+        save_sections = [ #sections are saved in the order they are loaded in
+            ('metadata', saved_metadata, 'none'),
+            ('variables', {'constants': saved_constants, 'statuses': saved_statuses, 'flags': saved_flags}, 'zlib'),
+            ('grids', saved_grid_dicts, 'zlib'),
+            ('worker_types', saved_worker_types, 'zlib'),
+            ('actors', saved_actor_dicts, 'zlib'),
+            ('ministers', saved_minister_dicts, 'zlib'),
+            ('lore_missions', saved_lore_mission_dicts, 'zlib')
+        ]
+        return(save_sections, saved_metadata)
 
     def load_game(self, file_path):
         '''
@@ -225,27 +353,51 @@ class save_load_manager_template():
         Output:
             None
         '''
+        self.finish_autosave()
+        self.autosave_requested = False
         flags.loading_save = True
         
         text_utility.print_to_screen('')
         text_utility.print_to_screen('Loading ' + file_path)
         game_transitions.start_loading()
         # Load file
+        handle = 'none'
         try:
+            file_name = file_path
             file_path = 'save_games/' + file_path
-            with open(file_path, 'rb') as handle:
-                saved_constants = pickle.load(handle)
-                saved_statuses = pickle.load(handle)
-                saved_flags = pickle.load(handle)
-                saved_grid_dicts = pickle.load(handle)
-                saved_worker_types = pickle.load(handle)
-                saved_actor_dicts = pickle.load(handle)
-                saved_minister_dicts = pickle.load(handle)
-                saved_lore_mission_dicts = pickle.load(handle)
-                handle.close()
+            handle = open(file_path, 'rb')
+            if save_file_utility.is_save_file(handle): #every section is checked before any is used, so a damaged save does not leave a partly loaded game
+                table_of_contents = save_file_utility.verify_sections(handle, ['variables', 'grids', 'worker_types', 'actors', 'ministers', 'lore_missions'])
+                read_section = lambda section_name: save_file_utility.read_section(handle, table_of_contents, section_name) #each section is read again when it is needed
+            else: #saves from before the save file format was added
+                read_section = self.read_legacy_sections(handle).get
+            saved_variables = read_section('variables')
         except:
-            text_utility.print_to_screen('The ' + file_path + ' file does not exist.')
+            if handle != 'none':
+                handle.close()
+            text_utility.print_to_screen('The ' + file_path + ' file does not exist or is damaged.')
+            flags.loading_save = False
             return()
+        try:
+            self.load_sections(file_name, saved_variables, read_section)
+        finally: #the file stays open until every section has been read
+            handle.close()
+
+    def load_sections(self, file_name, saved_variables, read_section):
+        '''
+        Description:
+            Replaces the current game with the saved game's variables, grids, worker types, actors, ministers, and lore missions
+        Input:
+            string file_name: Name of the save file being loaded
+            dictionary saved_variables: Saved dictionary with 'constants', 'statuses', and 'flags' keys, each with a dictionary of the saved values
+            function read_section: Function that takes the name of a section and returns the value saved in that section
+        Output:
+            None
+        '''
+        saved_constants = saved_variables['constants']
+        saved_statuses = saved_variables['statuses']
+        saved_flags = saved_variables['flags']
+        constants.save_slot_manager.set_current_slot(file_name)
 
         # Load variables
         for current_element in self.copied_constants:
@@ -267,7 +419,7 @@ class save_load_manager_template():
         text_utility.print_to_screen('Turn ' + str(constants.turn))
 
         # Load grids
-        for current_grid_dict in saved_grid_dicts:
+        for current_grid_dict in read_section('grids'):
             grids.create(from_save=True, grid_type=current_grid_dict['grid_type'], input_dict=current_grid_dict)
         grids.create(from_save=False, grid_type='minimap_grid')
         
@@ -278,15 +430,16 @@ class save_load_manager_template():
         else:
             actor_utility.set_slave_traders_strength(constants.slave_traders_strength)
 
-        for current_worker_type in saved_worker_types:
+        for current_worker_type in read_section('worker_types'):
             worker_types.worker_type(True, current_worker_type)
 
         # Load actors
-        for current_actor_dict in saved_actor_dicts:
+        for current_actor_dict in read_section('actors'):
             constants.actor_creation_manager.create(True, current_actor_dict)
-        for current_minister_dict in saved_minister_dicts:
+        self.restore_registry_orders()
+        for current_minister_dict in read_section('ministers'):
             constants.actor_creation_manager.create_minister(True, current_minister_dict)
-        for current_lore_mission_dict in saved_lore_mission_dicts:
+        for current_lore_mission_dict in read_section('lore_missions'):
             constants.actor_creation_manager.create_lore_mission(True, current_lore_mission_dict)
         constants.available_minister_left_index = -2
         minister_utility.update_available_minister_display()
@@ -301,4 +454,58 @@ class save_load_manager_template():
 
         tutorial_utility.show_tutorial_notifications()
 
+        if 'random_manager' in saved_constants: #restore streams after loading, as creating the loaded objects can use them
+            constants.random_manager.load(saved_constants['random_manager'])
+        else: #saves from before random streams were added
+            constants.random_manager.set_seed(random.randrange(0, 2 ** 32))
+
         flags.loading_save = False
+
+    def get_registry_orders(self, saved_object):
+        '''
+        Description:
+            Returns the position of the inputted object in each saved registry that contains it, allowing the registries to be put back in the same order after loading. Each
+                turn's random events are drawn in registry order, so a loaded game only continues the same way if its registries are in the same order
+        Input:
+            actor/settlement saved_object: Object being saved
+        Output:
+            dictionary: Returns a dictionary of the object's position in each registry containing it, with the registry names as keys
+        '''
+        registry_orders = {}
+        for registry_name in self.ordered_registries:
+            current_registry = getattr(status, registry_name)
+            if saved_object in current_registry:
+                registry_orders[registry_name] = current_registry.index(saved_object)
+        return(registry_orders)
+
+    def restore_registry_orders(self):
+        '''
+        Description:
+            Puts each saved registry back in the order it was in when the game was saved, based on the positions recorded by each loaded object. Objects without a recorded position,
+                like those loaded from saves from before positions were recorded, keep their loading order after any objects with recorded positions
+        Input:
+            None
+        Output:
+            None
+        '''
+        for registry_name in self.ordered_registries:
+            current_registry = getattr(status, registry_name)
+            current_registry.sort(key=lambda current_object: getattr(current_object, 'saved_registry_orders', {}).get(registry_name, len(current_registry)))
+
+    def read_legacy_sections(self, handle):
+        '''
+        Description:
+            Reads each section of a save from before the save file format was added, which were saved one after another without a table of contents
+        Input:
+            file handle: Binary file to read from
+        Output:
+            dictionary: Returns a dictionary with the name of each section as keys and the value saved in the section as values
+        '''
+        saved_variables = {}
+        saved_variables['constants'] = pickle.load(handle)
+        saved_variables['statuses'] = pickle.load(handle)
+        saved_variables['flags'] = pickle.load(handle)
+        sections = {'variables': saved_variables}
+        for section_name in ['grids', 'worker_types', 'actors', 'ministers', 'lore_missions']:
+            sections[section_name] = pickle.load(handle)
+        return(sections)
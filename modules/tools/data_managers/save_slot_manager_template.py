@@ -0,0 +1,374 @@
+#Contains functionality for choosing save slots and keeping an index of summaries of each saved game
+
+import os
+import time
+import pickle
+import threading
+import pygame
+from ...util import save_file_utility, text_utility, action_utility, utility, scaling
+import modules.constants.constants as constants
+import modules.constants.status as status
+
+class save_slot_manager_template():
+    '''
+    Object that chooses which save slot each game is saved to and keeps a small index file with a summary of each saved game, like its country, turn, money, public opinion, and
+        a thumbnail of the map. The index is updated whenever a game is saved, allowing saved games to be listed without reading the save files
+    '''
+    def __init__(self, num_slots, num_autosave_slots):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            int num_slots: Number of save slots that games can be saved to
+            int num_autosave_slots: Number of autosave slots, which are reused starting with the least recently autosaved
+        Output:
+            None
+        '''
+        self.save_folder = 'save_games/'
+        self.index_file_name = 'save_index.pickle'
+        self.slot_names = ['save' + str(slot_number) + '.pickle' for slot_number in range(1, num_slots + 1)]
+        self.autosave_slot_names = ['autosave' + str(slot_number) + '.pickle' for slot_number in range(1, num_autosave_slots + 1)]
+        self.current_slot = 'none'
+        self.summaries = 'none' #read from the index file the first time it is needed, and replaced rather than changed so that it can be read while autosaves are recorded
+        self.index_lock = threading.Lock() #autosaves are recorded from another thread
+        self.thumbnail_surfaces = {}
+        self.saves_per_page = 8 #number of saved games in each page of the save browser
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        return('Save slots: ' + str(len(self.get_summaries())) + ' indexed saves, current slot ' + self.current_slot)
+
+    def get_summaries(self):
+        '''
+        Description:
+            Returns the summary of each saved game, reading the index file if it has not been read yet
+        Input:
+            None
+        Output:
+            dictionary: Returns a dictionary with the file name of each saved game as keys and its summary dictionary as values
+        '''
+        with self.index_lock:
+            if self.summaries == 'none':
+                self.load_index()
+            return(self.summaries)
+
+    def load_index(self):
+        '''
+        Description:
+            Reads the summaries of saved games from the index file, leaving out saves whose files were deleted. Rebuilds the index from the save files if the index file is missing
+                or damaged
+        Input:
+            None
+        Output:
+            None
+        '''
+        try:
+            with open(self.save_folder + self.index_file_name, 'rb') as handle:
+                saved_summaries = pickle.load(handle)
+        except:
+            self.rebuild_index()
+            return()
+        self.summaries = {}
+        for file_name in saved_summaries:
+            if os.path.exists(self.save_folder + file_name):
+                self.summaries[file_name] = saved_summaries[file_name]
+
+    def rebuild_index(self):
+        '''
+        Description:
+            Creates the index file from the metadata of each save file in the save folder, used if the index file is missing or damaged. Saves found this way have no thumbnail
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.summaries = {}
+        if os.path.isdir(self.save_folder):
+            for file_name in sorted(os.listdir(self.save_folder)):
+                if file_name != self.index_file_name and not file_name.endswith('.tmp'):
+                    try:
+                        summary = save_file_utility.read_save_metadata(self.save_folder + file_name)
+                    except: #files from before the save file format was added have no metadata to read
+                        continue
+                    summary['thumbnail'] = 'none'
+                    self.summaries[file_name] = summary
+            self.write_index()
+
+    def write_index(self):
+        '''
+        Description:
+            Writes the summaries of saved games to the index file
+        Input:
+            None
+        Output:
+            None
+        '''
+        save_file_utility.write_file_atomically(self.save_folder + self.index_file_name, [pickle.dumps(self.summaries)])
+
+    def create_thumbnail(self):
+        '''
+        Description:
+            Returns a small image of the current strategic map, with 1 pixel of each explored cell's terrain color and black for unexplored cells
+        Input:
+            None
+        Output:
+            dictionary: Returns a dictionary with the thumbnail's 'width' and 'height' in pixels and 'pixels' bytes with 3 RGB values for each pixel, from the top row down
+        '''
+        grid = status.strategic_map_grid
+        terrain_colors = [constants.terrain_colors[terrain] for terrain in constants.terrain_id_list]
+        pixels = bytearray()
+        for y in range(grid.coordinate_height - 1, -1, -1): #rows are saved from top to bottom, while y coordinates increase upward
+            for x in range(grid.coordinate_width):
+                index = grid.get_cell_index(x, y)
+                if grid.visibility[index] and grid.terrain_ids[index] != -1:
+                    pixels += bytes(terrain_colors[grid.terrain_ids[index]])
+                else:
+                    pixels += bytes(constants.terrain_colors['none'])
+        return({'width': grid.coordinate_width, 'height': grid.coordinate_height, 'pixels': bytes(pixels)})
+
+    def create_summary(self, saved_metadata):
+        '''
+        Description:
+            Returns a summary of the current game for the index, based on its saved metadata and the current strategic map
+        Input:
+            dictionary saved_metadata: Metadata saved at the start of the save file, like its country, turn, money, public opinion, and when it was saved
+        Output:
+            dictionary: Returns a copy of the metadata with an added 'thumbnail' of the strategic map
+        '''
+        summary = saved_metadata.copy()
+        summary['thumbnail'] = self.create_thumbnail()
+        return(summary)
+
+    def record_save(self, file_name, summary):
+        '''
+        Description:
+            Adds or replaces the summary of the inputted saved game in the index and writes the index file. Can be used from the autosave thread
+        Input:
+            string file_name: File name the game was saved to
+            dictionary summary: Summary of the saved game, as returned by create_summary
+        Output:
+            None
+        '''
+        with self.index_lock:
+            if self.summaries == 'none':
+                self.load_index()
+            summaries = self.summaries.copy()
+            summaries[file_name] = summary
+            self.summaries = summaries
+            self.write_index()
+            for key in list(self.thumbnail_surfaces):
+                if key[0] == file_name:
+                    del self.thumbnail_surfaces[key]
+
+    def get_sorted_saves(self):
+        '''
+        Description:
+            Returns the file names of each indexed saved game, from most to least recently saved
+        Input:
+            None
+        Output:
+            string list: Returns the file names of each saved game
+        '''
+        summaries = self.get_summaries()
+        return(sorted(summaries, key=lambda file_name: summaries[file_name]['saved_time'], reverse=True))
+
+    def choose_save_slot(self):
+        '''
+        Description:
+            Returns the save slot the current game should be saved to - the slot it was last saved to or loaded from, or otherwise an empty slot or the least recently saved slot,
+                which would replace another game's save
+        Input:
+            None
+        Output:
+            string: Returns the file name of the chosen save slot
+        '''
+        if self.current_slot != 'none':
+            return(self.current_slot)
+        summaries = self.get_summaries()
+        empty_slots = [slot_name for slot_name in self.slot_names if not os.path.exists(self.save_folder + slot_name)]
+        if len(empty_slots) > 0:
+            return(empty_slots[0])
+        return(min(self.slot_names, key=lambda slot_name: summaries.get(slot_name, {}).get('saved_time', 0))) #saves without summaries are from before the index was added and are replaced first
+
+    def save_current_game(self, replace_confirmed=False):
+        '''
+        Description:
+            Saves the current game to its save slot and displays a notification that it was saved. If every slot is in use by other games, first displays a notification asking
+                whether to replace the least recently saved one
+        Input:
+            boolean replace_confirmed = False: Whether the player already chose to replace another game's save slot
+        Output:
+            None
+        '''
+        save_slot = self.choose_save_slot()
+        if save_slot != self.current_slot and os.path.exists(self.save_folder + save_slot) and not replace_confirmed:
+            message = 'All ' + str(len(self.slot_names)) + ' save slots are in use. Saving will replace ' + save_slot
+            summary = self.get_summaries().get(save_slot, 'none')
+            if summary != 'none':
+                message += ', a ' + utility.capitalize(str(summary['country_name'])) + ' game on turn ' + str(summary['turn']) + ' saved ' + time.strftime('%Y-%m-%d %H:%M',
+                    time.localtime(summary['saved_time']))
+            message += '. /n /n'
+            constants.notification_manager.display_notification({
+                'message': message,
+                'choices': [{
+                    'on_click': (self.save_current_game, [True]),
+                    'tooltip': ['Replaces ' + save_slot + ' with this game'],
+                    'message': 'Replace'
+                }, 'none']
+            })
+            return()
+        constants.save_load_manager.save_game(save_slot)
+        self.set_current_slot(save_slot)
+        constants.notification_manager.display_notification({
+            'message': 'Game successfully saved to ' + save_slot + ' /n /n',
+        })
+
+    def choose_autosave_slot(self):
+        '''
+        Description:
+            Returns the autosave slot the current game should be autosaved to - an empty autosave slot, or otherwise the least recently saved autosave slot
+        Input:
+            None
+        Output:
+            string: Returns the file name of the chosen autosave slot
+        '''
+        summaries = self.get_summaries()
+        empty_slots = [slot_name for slot_name in self.autosave_slot_names if not os.path.exists(self.save_folder + slot_name)]
+        if len(empty_slots) > 0:
+            return(empty_slots[0])
+        return(min(self.autosave_slot_names, key=lambda slot_name: summaries.get(slot_name, {}).get('saved_time', 0)))
+
+    def set_current_slot(self, file_name):
+        '''
+        Description:
+            Records that the current game was loaded from or saved to the inputted file, causing it to be saved to the same slot if the file is a save slot
+        Input:
+            string file_name: File name the game was loaded from or saved to, or 'none' for a new game
+        Output:
+            None
+        '''
+        if file_name in self.slot_names:
+            self.current_slot = file_name
+        else:
+            self.current_slot = 'none'
+
+    def get_thumbnail_surface(self, file_name, width, height):
+        '''
+        Description:
+            Returns an image of the inputted saved game's thumbnail scaled to the inputted size
+        Input:
+            string file_name: File name of the saved game
+            int width: Width of the image in pixels
+            int height: Height of the image in pixels
+        Output:
+            pygame.Surface/string: Returns the thumbnail image, or 'none' if the saved game has no thumbnail
+        '''
+        thumbnail = self.get_summaries().get(file_name, {}).get('thumbnail', 'none')
+        if thumbnail == 'none':
+            return('none')
+        key = (file_name, width, height)
+        thumbnail_surface = self.thumbnail_surfaces.get(key, 'none')
+        if thumbnail_surface == 'none':
+            thumbnail_surface = pygame.transform.scale(pygame.image.frombuffer(thumbnail['pixels'], (thumbnail['width'], thumbnail['height']), 'RGB'), (width, height))
+            self.thumbnail_surfaces[key] = thumbnail_surface
+        return(thumbnail_surface)
+
+    def display_save_browser(self, page_index=0):
+        '''
+        Description:
+            Displays a notification with a page of saved games from the index, each in a row with a thumbnail of its map, its name, turn, and when it was saved, and a button
+                to load it. Also has choices to see the next more or less recent page of saved games, or cancel
+        Input:
+            int page_index = 0: Index of the page to display, with the first page having the most recently saved games
+        Output:
+            None
+        '''
+        sorted_saves = self.get_sorted_saves()
+        if len(sorted_saves) == 0:
+            text_utility.print_to_screen('There are no saved games to load.')
+            return()
+        num_pages = (len(sorted_saves) + self.saves_per_page - 1) // self.saves_per_page
+        page_index = max(0, min(page_index, num_pages - 1))
+        page_saves = sorted_saves[page_index * self.saves_per_page:(page_index + 1) * self.saves_per_page]
+        summaries = self.get_summaries()
+        message = 'Saved games ' + str(page_index * self.saves_per_page + 1) + '-' + str(page_index * self.saves_per_page + len(page_saves)) + ' of ' + str(len(sorted_saves))
+        message += ', from most to least recently saved. /n /nChoose a saved game to load. /n /n'
+
+        row_height = scaling.scale_height(40)
+        load_button_width = scaling.scale_width(80)
+        separation = scaling.scale_width(5)
+        row_texts = []
+        for file_name in page_saves:
+            summary = summaries[file_name]
+            row_texts.append(os.path.splitext(file_name)[0] + ', turn ' + str(summary['turn']) + ', ' + time.strftime('%Y-%m-%d %H:%M', time.localtime(summary['saved_time'])))
+        font = constants.fonts['default_notification']
+        label_width = max([font.calculate_size(row_text) for row_text in row_texts]) + scaling.scale_width(10) #each row's label has the same width, aligning the rows
+        row_elements = []
+        for file_name, row_text in reversed(list(zip(page_saves, row_texts))): #attached elements are ordered from the bottom up
+            thumbnail = summaries[file_name].get('thumbnail', 'none')
+            if thumbnail == 'none':
+                thumbnail_width = row_height
+            else: #keeps the map's proportions
+                thumbnail_width = round(row_height * thumbnail['width'] / thumbnail['height'])
+            label_x_offset = -1 * (load_button_width / 2 + separation + label_width)
+            row_elements.append(action_utility.generate_free_image_input_dict('misc/empty.png', 0, override_input_dict={ #each row's thumbnail and label overlap its load button in order
+                'init_type': 'save thumbnail image',
+                'file_name': file_name,
+                'width': thumbnail_width,
+                'height': row_height,
+                'member_config': {'order_overlap': True, 'order_x_offset': label_x_offset - separation - thumbnail_width}
+            }))
+            row_elements.append({
+                'coordinates': (0, 0),
+                'minimum_width': label_width,
+                'height': row_height,
+                'modes': [constants.current_game_mode],
+                'image_id': 'misc/default_label.png',
+                'message': row_text,
+                'init_type': 'label',
+                'member_config': {'order_overlap': True, 'order_x_offset': label_x_offset}
+            })
+            row_elements.append({
+                'coordinates': (0, 0),
+                'width': load_button_width,
+                'height': row_height,
+                'modes': [constants.current_game_mode],
+                'image_id': 'misc/paper_label.png',
+                'button_type': {
+                    'on_click': (constants.save_load_manager.load_game, [file_name]),
+                    'tooltip': ['Loads ' + file_name],
+                    'message': 'Load'
+                },
+                'init_type': 'anonymous button',
+                'member_config': {'centered': True}
+            })
+
+        choices = []
+        if page_index > 0:
+            choices.append({
+                'on_click': (self.display_save_browser, [page_index - 1]),
+                'tooltip': ['Shows the next more recently saved games'],
+                'message': 'Newer'
+            })
+        if page_index < num_pages - 1:
+            choices.append({
+                'on_click': (self.display_save_browser, [page_index + 1]),
+                'tooltip': ['Shows the next less recently saved games'],
+                'message': 'Older'
+            })
+        choices.append({ #removes the attached rows along with the notification, unlike a 'none' choice
+            'tooltip': ['Cancel'],
+            'message': 'Cancel'
+        })
+        constants.notification_manager.display_notification({
+            'message': message,
+            'choices': choices,
+            'attached_interface_elements': row_elements
+        })
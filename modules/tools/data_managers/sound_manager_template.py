@@ -62,8 +62,10 @@ class sound_manager_template():
             string file_name: Name of .wav file to play sound of
             double volume = 0.3: Volume from 0.0 to 1.0 to play sound at - mixer usually uses a default of 1.0
         Output:
-            Channel: Returns the pygame mixer Channel object that the sound was played on
+            Channel: Returns the pygame mixer Channel object that the sound was played on, or None if running headless
         '''
+        if flags.headless:
+            return(None)
         current_sound = pygame.mixer.Sound('sounds/' + file_name + '.wav')
         current_sound.set_volume(volume)
         channel = pygame.mixer.find_channel(force=True)
@@ -81,6 +83,8 @@ class sound_manager_template():
         Output:
             None
         '''   
+        if flags.headless:
+            return
         current_sound = pygame.mixer.Sound('sounds/' + file_name + '.wav')
         current_sound.set_volume(volume)
         channel.queue(current_sound)
@@ -95,6 +99,8 @@ class sound_manager_template():
         Output:
             None
         '''
+        if flags.headless:
+            return
         if volume < 0: #negative volume value -> use default
             volume = constants.default_music_volume
         pygame.mixer.music.load('sounds/music/' + file_name + '.wav')
@@ -111,6 +117,8 @@ class sound_manager_template():
         Output:
             None
         '''
+        if flags.headless:
+            return
         original_volume = constants.default_music_volume
         pygame.mixer.music.set_volume(original_volume)
         time_passed = 0
@@ -139,6 +147,8 @@ class sound_manager_template():
         Output:
             None
         '''
+        if flags.headless:
+            return
         constants.event_manager.clear()
         original_volume = constants.default_music_volume
         pygame.mixer.music.set_volume(0)
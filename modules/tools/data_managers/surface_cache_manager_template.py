@@ -0,0 +1,117 @@
+#Contains functionality for caching rendered surfaces under a memory budget
+
+from collections import OrderedDict
+
+class surface_cache_manager_template():
+    '''
+    Object that stores rendered surfaces by a hashable key, evicting the least recently used surfaces once the total size of stored surfaces exceeds a memory budget
+    '''
+    def __init__(self, memory_budget):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            int memory_budget: Maximum number of bytes of surface pixel data to store before evicting the least recently used surfaces
+        Output:
+            None
+        '''
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self.surfaces = OrderedDict()
+        self.surface_sizes = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        return('Surface cache: ' + str(len(self.surfaces)) + ' surfaces, ' + str(round(self.memory_used / 1024)) + '/' + str(round(self.memory_budget / 1024)) + ' KB, ' +
+            str(self.hits) + ' hits, ' + str(self.misses) + ' misses, ' + str(self.evictions) + ' evictions')
+
+    def get(self, key):
+        '''
+        Description:
+            Returns the surface stored with the inputted key, marking it as recently used
+        Input:
+            hashable key: Key the surface was stored with
+        Output:
+            pygame.Surface/string: Returns the stored surface, or 'none' if no surface is stored with the inputted key
+        '''
+        if key in self.surfaces:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return(self.surfaces[key])
+        self.misses += 1
+        return('none')
+
+    def set(self, key, surface):
+        '''
+        Description:
+            Stores the inputted surface with the inputted key, evicting the least recently used surfaces if the memory budget is exceeded. Surfaces larger than the entire memory
+                budget are not stored
+        Input:
+            hashable key: Key to store the surface with
+            pygame.Surface surface: Surface to store
+        Output:
+            None
+        '''
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.memory_budget:
+            return()
+        if key in self.surfaces:
+            self.remove(key)
+        self.surfaces[key] = surface
+        self.surface_sizes[key] = size
+        self.memory_used += size
+        while self.memory_used > self.memory_budget:
+            self.remove(next(iter(self.surfaces)))
+            self.evictions += 1
+
+    def remove(self, key):
+        '''
+        Description:
+            Removes the surface stored with the inputted key
+        Input:
+            hashable key: Key the surface was stored with
+        Output:
+            None
+        '''
+        del self.surfaces[key]
+        self.memory_used -= self.surface_sizes.pop(key)
+
+    def set_memory_budget(self, new_memory_budget):
+        '''
+        Description:
+            Changes this cache's memory budget, evicting the least recently used surfaces until the new budget is met
+        Input:
+            int new_memory_budget: New maximum number of bytes of surface pixel data to store
+        Output:
+            None
+        '''
+        self.memory_budget = new_memory_budget
+        while self.memory_used > self.memory_budget:
+            self.remove(next(iter(self.surfaces)))
+            self.evictions += 1
+
+    def clear(self):
+        '''
+        Description:
+            Removes all stored surfaces and resets this cache's hit and miss counters
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.surfaces = OrderedDict()
+        self.surface_sizes = {}
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,155 @@
+#Contains functionality for moving npmobs towards the closest pmobs and buildings without checking every possible target
+
+from collections import deque
+import modules.constants.status as status
+
+class target_index_manager_template():
+    '''
+    Object that sorts the pmobs and damageable buildings that npmobs can target into buckets by grid and coordinates. Keeps a distance field for each grid, built outward from
+        the occupied coordinates, recording each land coordinate's distance to its closest target, which npmobs follow to move towards targets. The buckets and
+        distance fields are rebuilt the next time they are searched after any target is created, moved, removed, damaged, or repaired
+    '''
+    def __init__(self):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.outdated = True
+        self.grid_buckets = {}
+        self.distance_fields = {}
+        self.num_rebuilds = 0
+
+    def __str__(self):
+        '''
+        Description:
+            Returns text for a description of this object when printed
+        Input:
+            None
+        Output:
+            string: Returns text to print
+        '''
+        num_buckets = 0
+        for current_grid in self.grid_buckets:
+            num_buckets += len(self.grid_buckets[current_grid])
+        return('Target index: ' + str(num_buckets) + ' occupied coordinates, ' + str(self.num_rebuilds) + ' rebuilds')
+
+    def invalidate(self):
+        '''
+        Description:
+            Records that a possible target was created, moved, removed, damaged, or repaired, causing the buckets to be rebuilt the next time they are searched
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.outdated = True
+
+    def update(self):
+        '''
+        Description:
+            Sorts each building that can be damaged and is not damaged, along with each pmob not in a vehicle, group, or building, into a bucket for each of its grids based on its
+                coordinates. Targets in the ocean are not included, as npmobs can not enter the ocean
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.grid_buckets = {}
+        self.distance_fields = {}
+        for current_building in status.building_list:
+            if current_building.y != 0 and current_building.can_damage() and not current_building.damaged:
+                self.add_target(current_building)
+        for current_pmob in status.pmob_list:
+            if current_pmob.y != 0 and not (current_pmob.in_vehicle or current_pmob.in_group or current_pmob.in_building):
+                self.add_target(current_pmob)
+        self.outdated = False
+        self.num_rebuilds += 1
+
+    def add_target(self, target):
+        '''
+        Description:
+            Adds the inputted target to its coordinates' bucket on each of its grids
+        Input:
+            actor target: pmob or building to add
+        Output:
+            None
+        '''
+        for current_grid in target.grids:
+            self.grid_buckets.setdefault(current_grid, {}).setdefault((target.x, target.y), []).append(target)
+
+    def update_distance_field(self, grid, max_distance):
+        '''
+        Description:
+            Records the distance from each land coordinate on the inputted grid to its closest target, up to the inputted maximum distance, by searching outward from every target
+                at once. As npmobs can not enter the ocean, paths through the ocean are not considered
+        Input:
+            grid grid: Grid to create the distance field for
+            int max_distance: Maximum distance to record
+        Output:
+            None
+        '''
+        distance_field = {}
+        frontier = deque()
+        for current_coordinates in self.grid_buckets.get(grid, {}):
+            distance_field[current_coordinates] = 0
+            frontier.append(current_coordinates)
+        while len(frontier) > 0:
+            current_x, current_y = frontier.popleft()
+            new_distance = distance_field[(current_x, current_y)] + 1
+            if new_distance > max_distance:
+                continue
+            for adjacent_coordinates in [(current_x - 1, current_y), (current_x + 1, current_y), (current_x, current_y - 1), (current_x, current_y + 1)]:
+                if 0 <= adjacent_coordinates[0] < grid.coordinate_width and 0 < adjacent_coordinates[1] < grid.coordinate_height and not adjacent_coordinates in distance_field:
+                    distance_field[adjacent_coordinates] = new_distance
+                    frontier.append(adjacent_coordinates)
+        self.distance_fields[grid] = (max_distance, distance_field)
+
+    def find_distance(self, grid, x, y, max_distance):
+        '''
+        Description:
+            Returns the distance from the inputted coordinates to the closest target on the inputted grid
+        Input:
+            grid grid: Grid to search
+            int x: x coordinate to search from
+            int y: y coordinate to search from
+            int max_distance: Maximum horizontal plus vertical distance of targets to consider
+        Output:
+            int: Returns the distance to the closest target, or -1 if there are no targets within the maximum distance
+        '''
+        if self.outdated:
+            self.update()
+        if (not grid in self.distance_fields) or self.distance_fields[grid][0] < max_distance: #distance field only extends as far as the largest distance requested
+            self.update_distance_field(grid, max_distance)
+        distance = self.distance_fields[grid][1].get((x, y), -1)
+        if distance > max_distance:
+            return(-1)
+        return(distance)
+
+    def find_steps(self, grid, x, y, max_distance):
+        '''
+        Description:
+            Returns each movement from the inputted coordinates that would reach a coordinate one step closer to the closest target on the inputted grid
+        Input:
+            grid grid: Grid to search
+            int x: x coordinate to search from
+            int y: y coordinate to search from
+            int max_distance: Maximum horizontal plus vertical distance of targets to consider
+        Output:
+            int tuple list: Returns a list of (x_change, y_change) tuples, which is [(0, 0)] if a target is at the inputted coordinates or empty if there are no targets within the
+                maximum distance
+        '''
+        distance = self.find_distance(grid, x, y, max_distance)
+        if distance == -1:
+            return([])
+        elif distance == 0:
+            return([(0, 0)])
+        distance_field = self.distance_fields[grid][1]
+        steps = []
+        for x_change, y_change in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            if distance_field.get((x + x_change, y + y_change), -1) == distance - 1:
+                steps.append((x_change, y_change))
+        return(steps)
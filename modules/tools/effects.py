@@ -1,6 +1,5 @@
 #Contains functionality for global effects
 
-from ..util import utility
 import modules.constants.constants as constants
 
 class effect():
@@ -15,10 +14,9 @@ class effect():
             None
         '''
         self.effect_manager = constants.effect_manager
-        self.effect_manager.possible_effects.append(self)
-        
         self.effect_id = effect_id
         self.effect_type = effect_type
+        self.effect_manager.add_possible_effect(self)
         #eventually add int/string duration: Duration of effect in turns, or 'none' if infinite/conditional
 
     def __str__(self):
@@ -42,8 +40,7 @@ class effect():
         Output:
             None
         '''
-        if not self in self.effect_manager.active_effects:
-            self.effect_manager.active_effects.append(self)
+        self.effect_manager.activate(self)
 
     def remove(self):
         '''
@@ -54,5 +51,4 @@ class effect():
         Output:
             None
         '''
-        if self in self.effect_manager.active_effects:
-            self.effect_manager.active_effects = utility.remove_from_list(self.effect_manager.active_effects, self)
+        self.effect_manager.deactivate(self)
@@ -1,10 +1,9 @@
 #Contains miscellaneous functions relating to actor functionality
 
-import random
 import os
 import pygame
 import math
-from . import utility, text_utility
+from . import utility, text_utility, traversal_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
@@ -233,14 +232,14 @@ def spawn_beast():
     if spawn_cell.adjacent_to_buildings():
         return() #cancel spawn if beast would spawn near buildings, become less common as colony develops
     terrain_type = spawn_cell.terrain
-    animal_type = random.choice(constants.terrain_animal_dict[terrain_type])
+    animal_type = constants.random_manager.get_stream('ai').choice(constants.terrain_animal_dict[terrain_type])
 
     constants.actor_creation_manager.create(False, {
         'coordinates': (spawn_cell.x, spawn_cell.y),
         'grids': [status.strategic_map_grid, status.strategic_map_grid.mini_grid],
         'modes': status.strategic_map_grid.modes,
         'animal_type': animal_type,
-        'adjective': random.choice(constants.animal_adjectives),
+        'adjective': constants.random_manager.get_stream('appearance').choice(constants.animal_adjectives),
         'image': 'mobs/beasts/' + animal_type + '.png',
         'init_type': 'beast'
     })  
@@ -254,10 +253,7 @@ def find_closest_available_worker(destination):
     Output:
         slums/village: Returns the slums or village at which the chosen closest worker is located
     '''
-    possible_sources = []
-    for current_village in status.village_list:
-        if current_village.available_workers > 0:
-            possible_sources.append(current_village)
+    possible_sources = get_migration_sources() #villages with available workers
     possible_sources += status.slums_list
     
     min_distance = -1 #makes a list of closest sources
@@ -279,7 +275,7 @@ def find_closest_available_worker(destination):
             max_workers = current_workers
         elif max_workers == current_workers:
             max_workers_sources.append(possible_source)
-    return(random.choice(max_workers_sources)) #randomly choose from ['none'] or the list of tied closest sources w/ most workers
+    return(constants.random_manager.get_stream('actions').choice(max_workers_sources)) #randomly choose from ['none'] or the list of tied closest sources w/ most workers
 
 def create_image_dict(stem):
     '''
@@ -307,9 +303,8 @@ def update_roads():
     Output:
         None
     '''
-    for current_building in status.building_list:
-        if current_building.building_type == 'infrastructure':
-            current_building.cell.tile.update_image_bundle()
+    for current_building in constants.actor_registry_manager.get_index('building_type', 'infrastructure'):
+        current_building.cell.tile.update_image_bundle()
 
 def get_random_ocean_coordinates():
     '''
@@ -320,7 +315,7 @@ def get_random_ocean_coordinates():
     Output:
         int tuple: Two values representing x and y coordinates
     '''
-    start_x = random.randrange(0, status.strategic_map_grid.coordinate_width)
+    start_x = constants.random_manager.get_stream('ai').randrange(0, status.strategic_map_grid.coordinate_width)
     start_y = 0
     return(start_x, start_y)
 
@@ -337,6 +332,7 @@ def calibrate_actor_info_display(info_display, new_actor, override_exempt=False)
     '''
     if new_actor == 'none':
         print(0/0)
+    traversal_utility.invalidate_interface_visibility()
     if info_display == status.tile_info_display:
         for current_same_tile_icon in status.same_tile_icon_list:
             current_same_tile_icon.reset()
@@ -372,11 +368,14 @@ def get_migration_destinations():
         cell list: Returns list of all cells to which migration could occur
     '''
     return_list = []
-    for current_building in status.building_list:
-        if current_building.building_type in ['port', 'train_station', 'resource']:
-            if not current_building.cell in return_list:
-                if not current_building.damaged:
-                    return_list.append(current_building.cell)
+    employment_buildings = []
+    for building_type in ['port', 'train_station', 'resource']:
+        employment_buildings += constants.actor_registry_manager.get_index('building_type', building_type)
+    employment_buildings.sort(key=status.building_list.index) #keep destinations in the order their buildings were created
+    for current_building in employment_buildings:
+        if not current_building.cell in return_list:
+            if not current_building.damaged:
+                return_list.append(current_building.cell)
     return(return_list)
 
 def get_migration_sources():
@@ -388,10 +387,7 @@ def get_migration_sources():
     Output:
         village list: Returns list of all villages from which migration could occur
     '''
-    return_list = []
-    for current_village in status.village_list:
-        if current_village.available_workers > 0:
-            return_list.append(current_village)
+    return_list = sorted(constants.actor_registry_manager.get_index('available_workers', 'village'), key=status.village_list.index)
     return(return_list)
 
 def get_num_available_workers(location_types):
@@ -409,7 +405,7 @@ def get_num_available_workers(location_types):
             #if current_building.building_type == 'slums':
             num_available_workers += current_slums.available_workers
     if not location_types == 'slums': #village or all
-        for current_village in status.village_list:
+        for current_village in constants.actor_registry_manager.get_index('available_workers', 'village'):
             num_available_workers += current_village.available_workers
     return(num_available_workers)
 
@@ -444,7 +440,8 @@ def generate_resource_icon(tile):
 def get_image_variants(base_path, keyword = 'default'):
     '''
     Description:
-        Finds and returns a list of all images with the same name format in the same folder, like 'folder/default.png' and 'folder/default1.png'
+        Finds and returns a list of all images with the same name format in the same folder, like 'folder/default.png' and 'folder/default1.png'. The images are sorted by name,
+            as the base image is saved as the first variant and chosen variants are saved as positions in the list, which must not depend on the order the folder is read in
     Input:
         string base_path: File path of base image, like 'folder/default.png'
         string keyword = 'default': Name format to look for
@@ -454,7 +451,7 @@ def get_image_variants(base_path, keyword = 'default'):
     variants = []
     if base_path.endswith('default.png'):
         folder_path = base_path.removesuffix('default.png')
-        for file_name in os.listdir('graphics/' + folder_path):
+        for file_name in sorted(os.listdir('graphics/' + folder_path)):
             if file_name.startswith(keyword):
                 variants.append(folder_path + file_name)
                 continue
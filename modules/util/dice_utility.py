@@ -1,6 +1,5 @@
 #Contains functions that control the results and messages of dice rolls
 
-import random
 from . import text_utility
 import modules.constants.constants as constants
 
@@ -19,7 +18,7 @@ def roll(num_sides, roll_type, requirement, min_crit_success, max_crit_fail, res
         int: Returns the random value rolled
     '''
     if result == 'none':
-        result = random.randrange(1, num_sides + 1)
+        result = constants.random_manager.get_stream('actions').randrange(1, num_sides + 1)
     text_utility.print_to_screen(roll_type + ': ' + str(requirement) + '+ required to succeed')
     if result >= requirement:
         if result >= min_crit_success:
@@ -48,7 +47,7 @@ def roll_to_list(num_sides, roll_type, requirement, min_crit_success, max_crit_f
         int/string list: List representing the roll's outcome, with the first item being the roll's int result and the second item being a string description of the roll
     '''
     if result == 'none':
-        result = random.randrange(1, num_sides + 1)
+        result = constants.random_manager.get_stream('actions').randrange(1, num_sides + 1)
     text = ''
     
     if not roll_type == 'second': #do not show again for 2nd die rolled by veteran
@@ -77,7 +76,7 @@ def combat_roll_to_list(num_sides, roll_type, result, modifier):
         int modifier: Value added to the dice roll and shown in the description of the calculation
     '''
     if result == 'none':
-        result = random.randrange(1, num_sides + 1)
+        result = constants.random_manager.get_stream('combat').randrange(1, num_sides + 1)
     text = ''
     if roll_type == 'second':
         text += 'Second roll: /n'
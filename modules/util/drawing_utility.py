@@ -2,6 +2,8 @@
 
 import pygame
 import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
 
 def rect_to_surface(rect):
     '''
@@ -43,3 +45,113 @@ def display_image_angle(image, x, y, angle):
     rotated_image = pygame.transform.rotate(image, angle)
     new_rect = rotated_image.get_rect(center = image.get_rect(topleft = topleft).center)
     constants.game_display.blit(rotated_image, new_rect.topleft)
+
+def replace_color(surface, old_color, new_color):
+    '''
+    Description:
+        Replaces the red, green, and blue values of each pixel of the inputted surface that matches the inputted old color with those of the inputted new color, preserving each
+            pixel's alpha value. Uses whole-surface mask and blend operations rather than checking each pixel individually
+    Input:
+        pygame.Surface surface: Surface to recolor in place
+        int tuple old_color: Three values representing the red, green, and blue values of the color to replace
+        int tuple new_color: Three values representing the red, green, and blue values to replace the old color with
+    Output:
+        None
+    '''
+    #threshold of 255 on alpha with a midpoint alpha of 128 matches pixels of any transparency
+    color_mask = pygame.mask.from_threshold(surface, (old_color[0], old_color[1], old_color[2], 128), (1, 1, 1, 255))
+    if color_mask.count() > 0:
+        #multiplying by black clears matching pixels' colors without changing their alpha, after which the new color is added
+        surface.blit(color_mask.to_surface(setcolor=(0, 0, 0, 255), unsetcolor=(255, 255, 255, 255)), (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        surface.blit(color_mask.to_surface(setcolor=(new_color[0], new_color[1], new_color[2], 0), unsetcolor=(0, 0, 0, 0)), (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+def mark_dirty(rect):
+    '''
+    Description:
+        Records that the inputted screen region has changed and should be redrawn and updated on the next frame when using dirty rect rendering
+    Input:
+        pygame.Rect/tuple rect: Screen region that was invalidated, with top-left pixel coordinates
+    Output:
+        None
+    '''
+    if not flags.full_redraw: #individual regions don't matter if everything will be redrawn
+        status.dirty_rects.append(pygame.Rect(rect))
+
+def mark_image_dirty(invalidated_image):
+    '''
+    Description:
+        Records that the screen region covered by the inputted image has changed - images without a known location invalidate the entire screen
+    Input:
+        image invalidated_image: Image whose appearance or location changed
+    Output:
+        None
+    '''
+    if hasattr(invalidated_image, 'Rect') and invalidated_image.Rect != 'none':
+        mark_dirty(invalidated_image.Rect)
+    elif all(hasattr(invalidated_image, attribute) for attribute in ['x', 'y', 'width', 'height']):
+        mark_dirty((invalidated_image.x, invalidated_image.y - invalidated_image.height, invalidated_image.width, invalidated_image.height))
+    else:
+        mark_full_redraw()
+
+def set_hide_grid_lines(hide_grid_lines):
+    '''
+    Description:
+        Records whether grid lines are hidden, called by the effect manager whenever the hide_grid_lines effect is activated or deactivated. Redraws the screen to show the change
+    Input:
+        boolean hide_grid_lines: Whether grid lines are hidden
+    Output:
+        None
+    '''
+    flags.hide_grid_lines = hide_grid_lines
+    mark_full_redraw()
+
+def mark_full_redraw():
+    '''
+    Description:
+        Records that the entire screen should be redrawn and updated on the next frame, used for changes that can not easily be tracked to particular regions
+    Input:
+        None
+    Output:
+        None
+    '''
+    flags.full_redraw = True
+
+def get_dirty_rects():
+    '''
+    Description:
+        Merges the recorded dirty rects into a list of non-overlapping rects, clipped to the screen
+    Input:
+        None
+    Output:
+        pygame.Rect list: Returns the merged dirty rects, or 'none' if the entire screen should be redrawn
+    '''
+    if flags.full_redraw:
+        return('none')
+    screen_rect = constants.game_display.get_rect()
+    merged_rects = []
+    total_area = 0
+    for current_rect in status.dirty_rects:
+        current_rect = current_rect.clip(screen_rect)
+        if current_rect.width > 0 and current_rect.height > 0:
+            overlap_index = current_rect.collidelist(merged_rects)
+            while overlap_index != -1: #combine with any overlapping rects until there is no more overlap
+                current_rect.union_ip(merged_rects.pop(overlap_index))
+                overlap_index = current_rect.collidelist(merged_rects)
+            merged_rects.append(current_rect)
+    for current_rect in merged_rects:
+        total_area += current_rect.width * current_rect.height
+    if total_area * 2 > screen_rect.width * screen_rect.height: #redrawing most of the screen in pieces is slower than redrawing it at once
+        return('none')
+    return(merged_rects)
+
+def clear_dirty_rects():
+    '''
+    Description:
+        Clears the recorded dirty rects after they have been redrawn
+    Input:
+        None
+    Output:
+        None
+    '''
+    status.dirty_rects = []
+    flags.full_redraw = False
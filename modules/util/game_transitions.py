@@ -1,7 +1,7 @@
 #Contains functions used when switching between parts of the game, like loading screen display
 
 import time
-from . import main_loop_utility, text_utility, actor_utility, minister_utility, scaling
+from . import main_loop_utility, text_utility, actor_utility, minister_utility, scaling, drawing_utility, traversal_utility
 from ..actor_types import tiles
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -49,6 +49,8 @@ def set_game_mode(new_game_mode):
     if new_game_mode == previous_game_mode:
         return()
     else:
+        drawing_utility.mark_full_redraw()
+        traversal_utility.invalidate_interface_visibility()
         if previous_game_mode in ['main_menu', 'new_game_setup'] and not new_game_mode in ['main_menu', 'new_game_setup']: #new_game_mode in ['strategic', 'ministers', 'europe']:
             constants.event_manager.clear()
             constants.sound_manager.play_random_music('europe')
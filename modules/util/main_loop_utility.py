@@ -2,15 +2,27 @@
 
 import pygame
 import time
-from . import scaling, text_utility, actor_utility, minister_utility, utility, traversal_utility
+from . import scaling, text_utility, actor_utility, minister_utility, utility, traversal_utility, drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.constants.flags as flags
 
+def set_track_fps(track_fps):
+    '''
+    Description:
+        Records whether frames per second are tracked, called by the effect manager whenever the track_fps effect is activated or deactivated
+    Input:
+        boolean track_fps: Whether frames per second are tracked
+    Output:
+        None
+    '''
+    flags.track_fps = track_fps
+
 def update_display():
     '''
     Description:
-        Draws all images and shapes and calls the functions to draw tooltips and the text box
+        Draws all images and shapes and calls the functions to draw tooltips and the text box. If dirty rect rendering is active, only redraws and updates the screen regions that
+            changed since the previous frame, doing nothing if no regions changed
     Input:
         None
     Output:
@@ -19,67 +31,55 @@ def update_display():
     if flags.loading:
         flags.loading_start_time -= 1 #end load timer faster once program starts repeating this part
         draw_loading_screen()
+        drawing_utility.mark_full_redraw() #loading screen covers everything, so the first frame afterward must be fully redrawn
+        traversal_utility.invalidate_interface_visibility()
+        pygame.display.update()
     else:
-        possible_tooltip_drawers = []
-
-        traversal_utility.draw_interface_elements(status.independent_interface_elements)
-        #could modify with a layer dictionary to display elements on different layers - currently, drawing elements in order of collection creation is working w/o overlap
-        # issues
-
-        displayed_tile = status.displayed_tile
-        if displayed_tile:
-            displayed_tile.draw_actor_match_outline(False)
+        dirty_rect_rendering = constants.effect_manager.effect_active('dirty_rect_rendering')
+        if dirty_rect_rendering:
+            find_continuous_changes()
+        else:
+            drawing_utility.mark_full_redraw()
 
-        if status.displayed_mob:
-            status.displayed_mob.draw_outline()
+        if (constants.old_mouse_x, constants.old_mouse_y) != constants.mouse_position:
+            constants.mouse_moved_time = constants.current_time
+            constants.old_mouse_x, constants.old_mouse_y = constants.mouse_position
+            for current_rect in status.tooltip_rects: #tooltips are hidden while the mouse is moving
+                drawing_utility.mark_dirty(current_rect)
+            status.tooltip_rects = []
+            flags.tooltips_checked = False
+        showing_tooltips = time.time() > constants.mouse_moved_time + 0.15 #show tooltip when mouse is still
 
-        for current_mob in status.mob_list:
-            if current_mob.can_show_tooltip():
-                for same_tile_mob in current_mob.images[0].current_cell.contained_mobs:
-                    if same_tile_mob.can_show_tooltip() and not same_tile_mob in possible_tooltip_drawers: #if multiple mobs are in the same tile, draw their tooltips in order
-                        possible_tooltip_drawers.append(same_tile_mob)
+        if flags.interface_visibility_outdated:
+            traversal_utility.update_interface_elements(status.independent_interface_elements) #elements that start or stop showing report their regions before drawing
+        redrawing = flags.full_redraw or len(status.dirty_rects) > 0
+        update_rects = []
+        if redrawing:
+            for current_rect in status.tooltip_rects: #tooltips are redrawn on top of anything redrawn below them
+                drawing_utility.mark_dirty(current_rect)
+            update_rects = drawing_utility.get_dirty_rects()
+            if update_rects == 'none':
+                draw_interface()
+            elif update_rects: #regions that are entirely off the screen do not need to be redrawn
+                constants.game_display.set_clip(update_rects[0].unionall(update_rects[1:]))
+                draw_interface()
+                constants.game_display.set_clip(None)
 
-        for current_building in status.building_list:
-            if current_building.can_show_tooltip():
-                possible_tooltip_drawers.append(current_building)
-            
-        for current_actor in status.actor_list:
-            if current_actor.can_show_tooltip() and not current_actor in possible_tooltip_drawers:
-                possible_tooltip_drawers.append(current_actor) #only one of these will be drawn to prevent overlapping tooltips
-
-        notification_tooltip_button = None
-        for current_button in status.button_list:
-            if current_button.can_show_tooltip(): #while multiple actor tooltips can be shown at once, if a button tooltip is showing no other tooltips should be showing
-                if current_button.in_notification and current_button != status.current_instructions_page:
-                    notification_tooltip_button = current_button
-                else:
-                    possible_tooltip_drawers = [current_button]
-        
-        if notification_tooltip_button:
-            possible_tooltip_drawers = [notification_tooltip_button]
-        else:
-            for current_free_image in status.free_image_list:
-                if current_free_image.can_show_tooltip():
-                    possible_tooltip_drawers = [current_free_image]
-                
-        if flags.show_text_box:
-            draw_text_box()
+        if showing_tooltips and (redrawing or not flags.tooltips_checked): #tooltips only need to be found again if the mouse moved or something changed
+            status.tooltip_rects = manage_tooltip_drawing(find_possible_tooltip_drawers())
+            flags.tooltips_checked = True
+            if update_rects != 'none':
+                update_rects += status.tooltip_rects
 
-        constants.mouse_follower.draw()
-            
-        if status.current_instructions_page:
-            status.current_instructions_page.draw()
-            if status.current_instructions_page.can_show_tooltip(): #while multiple actor tooltips can be shown at once, if a button tooltip is showing no other tooltips should be showing
-                possible_tooltip_drawers = [status.current_instructions_page] #instructions have priority over everything
-        if (constants.old_mouse_x, constants.old_mouse_y) != pygame.mouse.get_pos():
-            constants.mouse_moved_time = constants.current_time
-            constants.old_mouse_x, constants.old_mouse_y = pygame.mouse.get_pos()
-        if time.time() > constants.mouse_moved_time + 0.15: #show tooltip when mouse is still
-            manage_tooltip_drawing(possible_tooltip_drawers)
-        
-    pygame.display.update()
+        if not dirty_rect_rendering:
+            pygame.display.update()
+        elif update_rects == 'none':
+            pygame.display.update()
+        elif update_rects:
+            pygame.display.update(update_rects)
+        drawing_utility.clear_dirty_rects()
 
-    if constants.effect_manager.effect_active('track_fps'):
+    if flags.track_fps:
         current_time = time.time()
         constants.frames_this_second += 1
         if current_time > constants.last_fps_update + 1 and flags.startup_complete:
@@ -87,6 +87,153 @@ def update_display():
             constants.frames_this_second = 0
             constants.last_fps_update = current_time
 
+def draw_interface():
+    '''
+    Description:
+        Draws all showing interface elements, outlines, the text box, and the mouse follower, in order from back to front. Tooltips are drawn separately on top
+    Input:
+        None
+    Output:
+        None
+    '''
+    for current_interface_element in status.draw_list: #draw list is rebuilt by update_interface_elements whenever the interface's visibility is invalidated
+        current_interface_element.draw()
+    #could modify with a layer dictionary to display elements on different layers - currently, drawing elements in order of collection creation is working w/o overlap
+    # issues
+
+    displayed_tile = status.displayed_tile
+    if displayed_tile:
+        displayed_tile.draw_actor_match_outline(False)
+
+    if status.displayed_mob:
+        status.displayed_mob.draw_outline()
+
+    if flags.show_text_box:
+        draw_text_box()
+
+    constants.mouse_follower.draw()
+
+    if status.current_instructions_page:
+        status.current_instructions_page.draw()
+
+def find_possible_tooltip_drawers():
+    '''
+    Description:
+        Finds the objects that are touching the mouse and able to show tooltips, prioritizing instructions, notifications, and buttons over other objects
+    Input:
+        None
+    Output:
+        object list: Returns all objects whose tooltips should be considered for drawing
+    '''
+    possible_tooltip_drawers = []
+    actors_under_mouse = constants.hit_test_manager.find('actors', constants.mouse_position)
+    mobs_under_mouse = [current_actor for current_actor in actors_under_mouse if current_actor in status.mob_list]
+    mobs_under_mouse.sort(key=status.mob_list.index)
+    for current_mob in mobs_under_mouse:
+        if current_mob.can_show_tooltip():
+            for same_tile_mob in current_mob.images[0].current_cell.contained_mobs:
+                if same_tile_mob.can_show_tooltip() and not same_tile_mob in possible_tooltip_drawers: #if multiple mobs are in the same tile, draw their tooltips in order
+                    possible_tooltip_drawers.append(same_tile_mob)
+
+    buildings_under_mouse = [] #buildings have no images and are under the mouse when their tile or its equivalent minimap tile is
+    for current_actor in actors_under_mouse:
+        if getattr(current_actor, 'actor_type', 'none') == 'tile':
+            if current_actor.grid.is_mini_grid: #minimap cells only hold copies of their equivalent cells' buildings
+                searched_cells = []
+            else:
+                searched_cells = [current_actor.cell]
+            equivalent_tile = current_actor.get_equivalent_tile()
+            if equivalent_tile != 'none' and not equivalent_tile.grid.is_mini_grid:
+                searched_cells.append(equivalent_tile.cell)
+            for current_cell in searched_cells:
+                for current_building in current_cell.get_buildings():
+                    if not current_building in buildings_under_mouse:
+                        buildings_under_mouse.append(current_building)
+    buildings_under_mouse.sort(key=status.building_list.index)
+    for current_building in buildings_under_mouse:
+        if current_building.can_show_tooltip():
+            possible_tooltip_drawers.append(current_building)
+
+    actors_under_mouse += buildings_under_mouse
+    actors_under_mouse.sort(key=status.actor_list.index)
+    for current_actor in actors_under_mouse:
+        if current_actor.can_show_tooltip() and not current_actor in possible_tooltip_drawers:
+            possible_tooltip_drawers.append(current_actor) #only one of these will be drawn to prevent overlapping tooltips
+
+    notification_tooltip_button = None
+    for current_button in constants.hit_test_manager.find('buttons', constants.mouse_position):
+        if current_button.can_show_tooltip(): #while multiple actor tooltips can be shown at once, if a button tooltip is showing no other tooltips should be showing
+            if current_button.in_notification and current_button != status.current_instructions_page:
+                notification_tooltip_button = current_button
+            else:
+                possible_tooltip_drawers = [current_button]
+    
+    if notification_tooltip_button:
+        possible_tooltip_drawers = [notification_tooltip_button]
+    else:
+        for current_free_image in constants.hit_test_manager.find('free images', constants.mouse_position):
+            if current_free_image.can_show_tooltip():
+                possible_tooltip_drawers = [current_free_image]
+
+    if status.current_instructions_page and status.current_instructions_page.can_show_tooltip():
+        possible_tooltip_drawers = [status.current_instructions_page] #instructions have priority over everything
+    return(possible_tooltip_drawers)
+
+def find_continuous_changes():
+    '''
+    Description:
+        Marks the screen regions changed by ongoing processes that are not reported by any particular element, like rolling dice, enemy turns, and the mouse follower, for dirty
+            rect rendering
+    Input:
+        None
+    Output:
+        None
+    '''
+    if not flags.player_turn: #enemy movement can change anything
+        drawing_utility.mark_full_redraw()
+        traversal_utility.invalidate_interface_visibility()
+    elif (flags.choosing_destination or flags.choosing_advertised_commodity or flags.drawing_automatic_route) and \
+        (constants.old_mouse_x, constants.old_mouse_y) != constants.mouse_position: #mouse follower moved
+        drawing_utility.mark_full_redraw()
+    else:
+        for current_die in status.dice_list:
+            if current_die.rolling:
+                drawing_utility.mark_full_redraw()
+                traversal_utility.invalidate_interface_visibility() #dice resolve their actions while drawing once they finish rolling
+                break
+
+def get_input_state():
+    '''
+    Description:
+        Returns the values that decide what is drawn across large parts of the screen, like the game mode, selections, and the minimap's location, allowing input that changes
+            any of them to redraw the entire screen while other input only redraws the regions reported by the elements it changed
+    Input:
+        None
+    Output:
+        tuple: Returns the current values
+    '''
+    if status.minimap_grid:
+        minimap_center = (status.minimap_grid.center_x, status.minimap_grid.center_y)
+    else:
+        minimap_center = 'none'
+    return((constants.current_game_mode, status.displayed_mob, status.displayed_tile, status.displayed_minister, status.displayed_country, status.displayed_notification,
+        status.current_instructions_page, flags.choosing_destination, flags.choosing_advertised_commodity, flags.drawing_automatic_route, constants.text_box_height,
+        minimap_center))
+
+def update_input_regions(previous_input_state):
+    '''
+    Description:
+        Records which screen regions were changed by this frame's input. Pressed and released buttons, typed text, and elements that were changed by the input report their
+            own regions, so the entire screen is only redrawn if the input changed the game mode, a selection, or another value from get_input_state
+    Input:
+        tuple previous_input_state: Values returned by get_input_state before this frame's input was handled
+    Output:
+        None
+    '''
+    traversal_utility.invalidate_interface_visibility() #elements that start or stop showing report their regions
+    if get_input_state() != previous_input_state:
+        drawing_utility.mark_full_redraw()
+
 def action_possible():
     '''
     Description:
@@ -118,19 +265,19 @@ def manage_tooltip_drawing(possible_tooltip_drawers):
     Input:
         object list possible_tooltip_drawers: All objects that possess tooltips and are currently touching the mouse and being drawn
     Output:
-        None
+        pygame.Rect list: Returns the screen regions covered by the drawn tooltips
     '''
     possible_tooltip_drawers_length = len(possible_tooltip_drawers)
     font = constants.fonts['default']
     y_displacement = scaling.scale_width(30) #estimated mouse size
     if possible_tooltip_drawers_length == 0:
-        return()
+        return([])
     elif possible_tooltip_drawers_length == 1:
         height = y_displacement
         height += font.size * (len(possible_tooltip_drawers[0].tooltip_text) + 1)
         possible_tooltip_drawers[0].update_tooltip()
         width = possible_tooltip_drawers[0].tooltip_box.width
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = constants.mouse_position
         below_screen = False
         beyond_screen = False
         if (constants.display_height + 10 - mouse_y) - height < 0:
@@ -157,7 +304,7 @@ def manage_tooltip_drawing(possible_tooltip_drawers):
                 height += font.size * (len(possible_tooltip_drawer.tooltip_text) + 1)
                 if possible_tooltip_drawer.tooltip_box.width > width:
                         width = possible_tooltip_drawer.tooltip_box.width
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = constants.mouse_position
         below_screen = False #if goes below bottom side
         beyond_screen = False #if goes beyond right side
         if (constants.display_height + 10 - mouse_y) - height < 0:
@@ -178,6 +325,11 @@ def manage_tooltip_drawing(possible_tooltip_drawers):
             for possible_tooltip_drawer in possible_tooltip_drawers:
                 possible_tooltip_drawer.draw_tooltip(below_screen, beyond_screen, height, width, y_displacement)
                 y_displacement += scaling.unscale_width(font.size * (len(possible_tooltip_drawer.tooltip_text) + 1))
+    tooltip_rects = []
+    for possible_tooltip_drawer in possible_tooltip_drawers:
+        if hasattr(possible_tooltip_drawer, 'tooltip_outline'):
+            tooltip_rects.append(possible_tooltip_drawer.tooltip_outline.copy())
+    return(tooltip_rects)
 
 def draw_text_box():
     '''
@@ -214,18 +366,66 @@ def draw_text_box():
 
     for text_index in range(len(status.text_list)):
         if text_index < max_text_box_lines:
-            textsurface = constants.myfont.pygame_font.render(status.text_list[(-1 * text_index) - 1], False, (0, 0, 0))
+            textsurface = text_utility.text(status.text_list[(-1 * text_index) - 1], constants.myfont, color=(0, 0, 0))
             constants.game_display.blit(textsurface,(scaling.scale_width(10), (-1 * font.size * text_index) + constants.display_height - ((2 * font.size) + scaling.scale_height(5))))
     if constants.input_manager.taking_input:
-        textsurface = constants.myfont.pygame_font.render('Response: ' + constants.message, False, (0, 0, 0))
+        textsurface = text_utility.text('Response: ' + constants.message, constants.myfont, color=(0, 0, 0))
     else:
-        textsurface = constants.myfont.pygame_font.render(constants.message, False, (0, 0, 0))
+        textsurface = text_utility.text(constants.message, constants.myfont, color=(0, 0, 0))
     constants.game_display.blit(textsurface,(scaling.scale_width(10), constants.display_height - (font.size + scaling.scale_height(5))))
 
+def manage_keybind_press(key):
+    '''
+    Description:
+        Clicks the first button bound to the inputted key that is showing or has its button press override active, unless the user is typing. Only buttons bound to the inputted key are
+            checked. Any other buttons being pressed that are earlier in the button list than the clicked button, or all of them if no button was clicked, stop being pressed
+    Input:
+        int key: pygame key code of the key that was pressed, like pygame.K_n
+    Output:
+        None
+    '''
+    pressed_button = 'none'
+    if not flags.typing:
+        for current_button in status.keybind_button_dict.get(key, []):
+            if current_button.showing or (current_button.has_button_press_override and current_button.button_press_override()):
+                pressed_button = current_button
+                break
+    if status.pressed_button_list:
+        if pressed_button != 'none':
+            pressed_button_index = status.button_list.index(pressed_button)
+        for current_button in status.pressed_button_list.copy():
+            if pressed_button == 'none' or (current_button != pressed_button and status.button_list.index(current_button) < pressed_button_index):
+                current_button.confirming = False
+                current_button.being_pressed = False
+                status.pressed_button_list.remove(current_button)
+    if pressed_button != 'none' and pressed_button.has_released: #if stuck on loading, don't want multiple 'key down' events to repeat on_click - shouldn't on_click again until released
+        pressed_button.has_released = False
+        pressed_button.being_pressed = True
+        status.pressed_button_list.append(pressed_button)
+        pressed_button.on_click()
+        pressed_button.set_showing_outline(True)
+
+def manage_keybind_release(key):
+    '''
+    Description:
+        Releases each button bound to the inputted key. While the user is typing, only buttons bound to tab or e are released
+    Input:
+        int key: pygame key code of the key that was released, like pygame.K_n
+    Output:
+        None
+    '''
+    if not flags.typing or key == pygame.K_TAB or key == pygame.K_e:
+        for current_button in status.keybind_button_dict.get(key, []).copy():
+            current_button.on_release()
+            current_button.has_released = True
+            current_button.being_pressed = False
+            status.pressed_button_list = utility.remove_from_list(status.pressed_button_list, current_button)
+
 def manage_rmb_down(clicked_button):
     '''
     Description:
-        If the player is right clicking on a grid cell, cycles the order of the units in the cell. Otherwise, has same functionality as manage_lmb_down
+        If the player is right clicking on a grid cell, cycles the order of the units in the cell. If the cell has no other units to cycle through, instead orders the selected
+            unit to go to the cell over as many turns as needed. Otherwise, has same functionality as manage_lmb_down
     Input:
         boolean clicked_button: True if this click clicked a button, otherwise False
     Output:
@@ -233,24 +433,24 @@ def manage_rmb_down(clicked_button):
     '''
     stopping = False
     if (not clicked_button) and action_possible():
-        for current_grid in status.grid_list:
-            if current_grid.showing: #if constants.current_game_mode in current_grid.modes:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        stopping = True #if doesn't reach this point, do same as lmb
-                        if len(current_cell.contained_mobs) > 1:
-                            moved_mob = current_cell.contained_mobs[1]
-                            for current_image in moved_mob.images:
-                                if not current_image.current_cell == 'none':
-                                    while not moved_mob == current_image.current_cell.contained_mobs[0]:
-                                        current_image.current_cell.contained_mobs.append(current_image.current_cell.contained_mobs.pop(0))
-                            flags.show_selection_outlines = True
-                            constants.last_selection_outline_switch = constants.current_time
-                            if status.minimap_grid in moved_mob.grids:
-                                status.minimap_grid.calibrate(moved_mob.x, moved_mob.y)
-                            moved_mob.select()
-                            if moved_mob.is_pmob:
-                                moved_mob.selection_sound()
+        for current_cell in constants.hit_test_manager.find('cells', constants.mouse_position):
+            if current_cell.grid.showing: #if constants.current_game_mode in current_grid.modes:
+                stopping = True #if doesn't reach this point, do same as lmb
+                if len(current_cell.contained_mobs) > 1:
+                    moved_mob = current_cell.contained_mobs[1]
+                    for current_image in moved_mob.images:
+                        if not current_image.current_cell == 'none':
+                            while not moved_mob == current_image.current_cell.contained_mobs[0]:
+                                current_image.current_cell.contained_mobs.append(current_image.current_cell.contained_mobs.pop(0))
+                    flags.show_selection_outlines = True
+                    constants.last_selection_outline_switch = constants.current_time
+                    if status.minimap_grid in moved_mob.grids:
+                        status.minimap_grid.calibrate(moved_mob.x, moved_mob.y)
+                    moved_mob.select()
+                    if moved_mob.is_pmob:
+                        moved_mob.selection_sound()
+                else:
+                    choose_movement_destination(current_cell)
     elif flags.drawing_automatic_route:
         stopping = True
         flags.drawing_automatic_route = False
@@ -270,6 +470,40 @@ def manage_rmb_down(clicked_button):
     if not stopping:
         manage_lmb_down(clicked_button)
     
+def choose_movement_destination(target_cell):
+    '''
+    Description:
+        Orders the selected unit to go to the inputted cell over as many turns as needed, if it is a pmob in Africa and a route to the cell exists, and starts moving it immediately
+    Input:
+        cell target_cell: Cell on the strategic map or minimap that was clicked
+    Output:
+        None
+    '''
+    displayed_mob = status.displayed_mob
+    if (not displayed_mob) or (not displayed_mob.is_pmob) or (not status.strategic_map_grid in displayed_mob.grids):
+        return()
+    if target_cell.grid.is_mini_grid:
+        target_tile = target_cell.tile.get_equivalent_tile()
+        if target_tile == 'none':
+            return()
+        target_cell = target_tile.cell
+    elif target_cell.grid != status.strategic_map_grid:
+        return()
+    if (target_cell.x, target_cell.y) == (displayed_mob.x, displayed_mob.y):
+        return()
+    if not minister_utility.positions_filled():
+        return()
+    if constants.pathfinding_manager.find_path(displayed_mob, (target_cell.x, target_cell.y)) == 'none':
+        text_utility.print_to_screen('This unit cannot find a route to that tile.')
+        return()
+    displayed_mob.clear_automatic_route()
+    displayed_mob.set_movement_destination((target_cell.x, target_cell.y))
+    displayed_mob.follow_movement_destination()
+    flags.show_selection_outlines = True
+    constants.last_selection_outline_switch = constants.current_time
+    if displayed_mob.movement_destination != 'none':
+        text_utility.print_to_screen('The ' + displayed_mob.name + ' will continue moving to (' + str(target_cell.x) + ', ' + str(target_cell.y) + ') over the next turns.')
+
 def manage_lmb_down(clicked_button):
     '''
     Description:
@@ -284,18 +518,16 @@ def manage_lmb_down(clicked_button):
     if action_possible() or flags.choosing_destination or flags.choosing_advertised_commodity or flags.drawing_automatic_route:
         if (not clicked_button and (not (flags.choosing_destination or flags.choosing_advertised_commodity or flags.drawing_automatic_route))):#do not do selecting operations if user was trying to click a button #and action_possible()
             selected_mob = False
-            for current_grid in status.grid_list:
-                if current_grid.showing: #if constants.current_game_mode in current_grid.modes:
-                    for current_cell in current_grid.get_flat_cell_list():
-                        if current_cell.touching_mouse():
-                            if current_cell.visible:
-                                if len(current_cell.contained_mobs) > 0:
-                                    selected_mob = True
-                                    current_mob = current_cell.contained_mobs[0]
-                                    actor_utility.calibrate_actor_info_display(status.mob_info_display, None, override_exempt=True)
-                                    current_mob.select()
-                                    if current_mob.is_pmob:
-                                        current_mob.selection_sound()
+            for current_cell in constants.hit_test_manager.find('cells', constants.mouse_position):
+                if current_cell.grid.showing: #if constants.current_game_mode in current_grid.modes:
+                    if current_cell.visible:
+                        if len(current_cell.contained_mobs) > 0:
+                            selected_mob = True
+                            current_mob = current_cell.contained_mobs[0]
+                            actor_utility.calibrate_actor_info_display(status.mob_info_display, None, override_exempt=True)
+                            current_mob.select()
+                            if current_mob.is_pmob:
+                                current_mob.selection_sound()
             if selected_mob:
                 unit = status.displayed_mob
                 if unit and unit.grids[0] == status.minimap_grid.attached_grid:
@@ -311,86 +543,87 @@ def manage_lmb_down(clicked_button):
                 click_move_minimap()
                 
         elif (not clicked_button) and flags.choosing_destination: #if clicking to move somewhere
-            for current_grid in status.grid_list: #destination_grids:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        click_move_minimap()
-                        target_cell = 'none'
-                        if current_cell.grid.is_abstract_grid:
-                            target_cell = current_cell
-                        else:
-                            target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y) #center
-                        if not current_grid in status.displayed_mob.grids:
-                            stopping = False
-                            if not current_grid.is_abstract_grid: #if grid has more than 1 cell, check if correct part of grid
-                                destination_x, destination_y = target_cell.tile.get_main_grid_coordinates()
-                                if (not (destination_y == 0 or (destination_y == 1 and target_cell.has_intact_building('port')))) and destination_x >= 0 and destination_x < status.strategic_map_grid.coordinate_width: #or is harbor
-                                    text_utility.print_to_screen('You can only send ships to coastal waters and coastal ports.')
-                                    stopping = True
-                            if not stopping:
-                                status.displayed_mob.end_turn_destination = target_cell.tile
-                                status.displayed_mob.movement_sound()
-                                flags.show_selection_outlines = True
-                                constants.last_selection_outline_switch = constants.current_time #outlines should be shown immediately once destination is chosen
-                                status.displayed_mob.remove_from_turn_queue()
-                                actor_utility.calibrate_actor_info_display(status.mob_info_display, status.displayed_mob)
-                                actor_utility.calibrate_actor_info_display(status.tile_info_display, status.displayed_mob.images[0].current_cell.tile)
-                        else: #cannot move to same continent
-                            actor_utility.calibrate_actor_info_display(status.mob_info_display, None)
-                            text_utility.print_to_screen('You can only send ships to other theatres.')
+            for current_cell in constants.hit_test_manager.find('cells', constants.mouse_position): #destination_grids:
+                current_grid = current_cell.grid
+                click_move_minimap()
+                target_cell = 'none'
+                if current_cell.grid.is_abstract_grid:
+                    target_cell = current_cell
+                else:
+                    target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y) #center
+                if not current_grid in status.displayed_mob.grids:
+                    stopping = False
+                    if not current_grid.is_abstract_grid: #if grid has more than 1 cell, check if correct part of grid
+                        destination_x, destination_y = target_cell.tile.get_main_grid_coordinates()
+                        if (not (destination_y == 0 or (destination_y == 1 and target_cell.has_intact_building('port')))) and destination_x >= 0 and destination_x < status.strategic_map_grid.coordinate_width: #or is harbor
+                            text_utility.print_to_screen('You can only send ships to coastal waters and coastal ports.')
+                            stopping = True
+                    if not stopping:
+                        status.displayed_mob.end_turn_destination = target_cell.tile
+                        status.displayed_mob.movement_sound()
+                        flags.show_selection_outlines = True
+                        constants.last_selection_outline_switch = constants.current_time #outlines should be shown immediately once destination is chosen
+                        status.displayed_mob.remove_from_turn_queue()
+                        actor_utility.calibrate_actor_info_display(status.mob_info_display, status.displayed_mob)
+                        actor_utility.calibrate_actor_info_display(status.tile_info_display, status.displayed_mob.images[0].current_cell.tile)
+                else: #cannot move to same continent
+                    actor_utility.calibrate_actor_info_display(status.mob_info_display, None)
+                    text_utility.print_to_screen('You can only send ships to other theatres.')
             flags.choosing_destination = False
             
         elif (not clicked_button) and flags.choosing_advertised_commodity:
             flags.choosing_advertised_commodity = False
             
         elif (not clicked_button) and flags.drawing_automatic_route:
-            for current_grid in status.grid_list: #destination_grids:
-                for current_cell in current_grid.get_flat_cell_list():
-                    if current_cell.touching_mouse():
-                        if current_cell.grid.is_abstract_grid:
-                            text_utility.print_to_screen('Only tiles adjacent to the most recently chosen destination can be added to the movement route.')
-                        else:
-                            displayed_mob = status.displayed_mob
-                            if current_cell.grid.is_mini_grid:
-                                target_tile = current_cell.tile.get_equivalent_tile()
-                                if target_tile == 'none':
-                                    return()
-                                target_cell = target_tile.cell
-                            else:
-                                target_cell = current_cell
-                            #target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y)
-                            destination_x, destination_y = (target_cell.x, target_cell.y)#target_cell.tile.get_main_grid_coordinates()
-                            previous_destination_x, previous_destination_y = displayed_mob.base_automatic_route[-1]
-                            if utility.find_coordinate_distance((destination_x, destination_y), (previous_destination_x, previous_destination_y)) == 1:
-                                destination_infrastructure = target_cell.get_building('infrastructure')
-                                if not target_cell.visible:
-                                    text_utility.print_to_screen('Movement routes cannot be created through unexplored tiles.')
-                                    return()
-                                elif displayed_mob.is_vehicle and displayed_mob.vehicle_type == 'train' and not target_cell.has_building('railroad'):
-                                    text_utility.print_to_screen('Trains can only create movement routes along railroads.')
-                                    return()
-                                elif (target_cell.terrain == 'water' and not displayed_mob.can_swim) and (displayed_mob.is_vehicle and destination_infrastructure == 'none'): 
-                                    #non-train units can still move slowly through water, even w/o canoes or a bridge
-                                    #railroad bridge allows anything to move through
-                                    text_utility.print_to_screen('This unit cannot create movement routes through water.')
-                                    return()
-                                elif target_cell.terrain == 'water' and displayed_mob.can_swim and (not displayed_mob.can_swim_ocean) and destination_y == 0:
-                                    text_utility.print_to_screen('This unit cannot create movement routes through ocean water.')
-                                    return()
-                                elif target_cell.terrain == 'water' and displayed_mob.can_swim and (not displayed_mob.can_swim_river) and destination_y > 0:
-                                    text_utility.print_to_screen('This unit cannot create movement routes through river water.')
-                                    return()
-                                elif (not target_cell.terrain == 'water') and (not displayed_mob.can_walk) and not target_cell.has_intact_building('port'):
-                                    text_utility.print_to_screen('This unit cannot create movement routes on land, except through ports.')
-                                    return()
-                                                                     
-                                displayed_mob.add_to_automatic_route((destination_x, destination_y))
-                                click_move_minimap()
-                                flags.show_selection_outlines = True
-                                constants.last_selection_outline_switch = constants.current_time
-                            else:
-                                text_utility.print_to_screen('Only tiles adjacent to the most recently chosen destination can be added to the movement route.')
-                                
+            for current_cell in constants.hit_test_manager.find('cells', constants.mouse_position): #destination_grids:
+                if current_cell.grid.is_abstract_grid:
+                    text_utility.print_to_screen('Only tiles adjacent to the most recently chosen destination can be added to the movement route.')
+                else:
+                    displayed_mob = status.displayed_mob
+                    if current_cell.grid.is_mini_grid:
+                        target_tile = current_cell.tile.get_equivalent_tile()
+                        if target_tile == 'none':
+                            return()
+                        target_cell = target_tile.cell
+                    else:
+                        target_cell = current_cell
+                    #target_cell = status.strategic_map_grid.find_cell(status.minimap_grid.center_x, status.minimap_grid.center_y)
+                    destination_x, destination_y = (target_cell.x, target_cell.y)#target_cell.tile.get_main_grid_coordinates()
+                    previous_destination_x, previous_destination_y = displayed_mob.base_automatic_route[-1]
+                    if utility.find_coordinate_distance((destination_x, destination_y), (previous_destination_x, previous_destination_y)) == 1:
+                        destination_infrastructure = target_cell.get_building('infrastructure')
+                        if not target_cell.visible:
+                            text_utility.print_to_screen('Movement routes cannot be created through unexplored tiles.')
+                            return()
+                        elif displayed_mob.is_vehicle and displayed_mob.vehicle_type == 'train' and not target_cell.has_building('railroad'):
+                            text_utility.print_to_screen('Trains can only create movement routes along railroads.')
+                            return()
+                        elif (target_cell.terrain == 'water' and not displayed_mob.can_swim) and (displayed_mob.is_vehicle and destination_infrastructure == 'none'): 
+                            #non-train units can still move slowly through water, even w/o canoes or a bridge
+                            #railroad bridge allows anything to move through
+                            text_utility.print_to_screen('This unit cannot create movement routes through water.')
+                            return()
+                        elif target_cell.terrain == 'water' and displayed_mob.can_swim and (not displayed_mob.can_swim_ocean) and destination_y == 0:
+                            text_utility.print_to_screen('This unit cannot create movement routes through ocean water.')
+                            return()
+                        elif target_cell.terrain == 'water' and displayed_mob.can_swim and (not displayed_mob.can_swim_river) and destination_y > 0:
+                            text_utility.print_to_screen('This unit cannot create movement routes through river water.')
+                            return()
+                        elif (not target_cell.terrain == 'water') and (not displayed_mob.can_walk) and not target_cell.has_intact_building('port'):
+                            text_utility.print_to_screen('This unit cannot create movement routes on land, except through ports.')
+                            return()
+                                                             
+                        displayed_mob.add_to_automatic_route((destination_x, destination_y))
+                        click_move_minimap()
+                        flags.show_selection_outlines = True
+                        constants.last_selection_outline_switch = constants.current_time
+                    elif displayed_mob.add_path_to_automatic_route((destination_x, destination_y)): #if not adjacent, fill in the least costly route to the chosen tile
+                        click_move_minimap()
+                        flags.show_selection_outlines = True
+                        constants.last_selection_outline_switch = constants.current_time
+                    else:
+                        text_utility.print_to_screen('This unit cannot find a route from the most recently chosen destination to that tile.')
+                        
         elif not clicked_button:
             click_move_minimap()
 
@@ -403,19 +636,18 @@ def click_move_minimap():
     Output:
         None
     '''
-    for current_grid in status.grid_list: #if grid clicked, move minimap to location clicked
+    for current_cell in constants.hit_test_manager.find('cells', constants.mouse_position): #if grid clicked, move minimap to location clicked
+        current_grid = current_cell.grid
         if current_grid.showing:
-            for current_cell in current_grid.get_flat_cell_list():
-                if current_cell.touching_mouse():
-                    if current_grid == status.minimap_grid: #if minimap clicked, calibrate to corresponding place on main map
-                        if current_cell.terrain != 'none': #if off map, do not move minimap there
-                            main_x, main_y = current_grid.get_main_grid_coordinates(current_cell.x, current_cell.y)
-                            status.minimap_grid.calibrate(main_x, main_y)
-                    elif current_grid == status.strategic_map_grid:
-                        status.minimap_grid.calibrate(current_cell.x, current_cell.y)
-                    else: #if abstract grid, show the inventory of the tile clicked without calibrating minimap
-                        actor_utility.calibrate_actor_info_display(status.tile_info_display, current_grid.cell_list[0][0].tile)
-                    return
+            if current_grid == status.minimap_grid: #if minimap clicked, calibrate to corresponding place on main map
+                if current_cell.terrain != 'none': #if off map, do not move minimap there
+                    main_x, main_y = current_grid.get_main_grid_coordinates(current_cell.x, current_cell.y)
+                    status.minimap_grid.calibrate(main_x, main_y)
+            elif current_grid == status.strategic_map_grid:
+                status.minimap_grid.calibrate(current_cell.x, current_cell.y)
+            else: #if abstract grid, show the inventory of the tile clicked without calibrating minimap
+                actor_utility.calibrate_actor_info_display(status.tile_info_display, current_grid.cell_list[0][0].tile)
+            return
 
 def debug_print():
     '''
@@ -428,3 +660,12 @@ def debug_print():
     '''
     print('')
     print(constants.effect_manager)
+    print(constants.combined_surface_cache)
+    print(constants.text_surface_cache)
+    print(constants.hit_test_manager)
+    print(constants.target_index_manager)
+    print(constants.pathfinding_manager)
+    print(constants.actor_registry_manager)
+    print(constants.event_manager)
+    print(constants.random_manager)
+    print(constants.save_slot_manager)
@@ -1,6 +1,5 @@
 #Contains functions that manage market prices and sale of commodities
 
-import random
 from . import text_utility, utility
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -17,17 +16,17 @@ def adjust_prices():
     num_increased = 4
     num_decreased = 2
     for i in range(num_increased):
-        changed_commodity = random.choice(constants.commodity_types)
+        changed_commodity = constants.random_manager.get_stream('market').choice(constants.commodity_types)
         while changed_commodity == 'consumer goods':
-            changed_commodity = random.choice(constants.commodity_types) #consumer goods price is changed separately and should not be changed here
+            changed_commodity = constants.random_manager.get_stream('market').choice(constants.commodity_types) #consumer goods price is changed separately and should not be changed here
         change_price(changed_commodity, 1)
     for i in range(num_decreased):
-        changed_commodity = random.choice(constants.commodity_types)
+        changed_commodity = constants.random_manager.get_stream('market').choice(constants.commodity_types)
         while changed_commodity == 'consumer goods':
-            changed_commodity = random.choice(constants.commodity_types) #consumer goods price is changed separately and should not be changed here
+            changed_commodity = constants.random_manager.get_stream('market').choice(constants.commodity_types) #consumer goods price is changed separately and should not be changed here
         change_price(changed_commodity, -1)
         
-    consumer_goods_roll = random.randrange(1, 7)
+    consumer_goods_roll = constants.random_manager.get_stream('market').randrange(1, 7)
     
     if consumer_goods_roll == 1:
         change_price('consumer goods', 1)
@@ -105,7 +104,7 @@ def attempt_worker_upkeep_change(change_type, worker_type):
     Output:
         None
     '''
-    if random.randrange(1, 7) >= 4: #half chance of change
+    if constants.random_manager.get_stream('market').randrange(1, 7) >= 4: #half chance of change
         current_price = status.worker_types[worker_type].upkeep
         if change_type == 'increase':
             changed_price = round(current_price + constants.worker_upkeep_increment, 2)
@@ -128,7 +127,7 @@ def attempt_slave_recruitment_cost_change(change_type):
     Output:
         None
     '''
-    if random.randrange(1, 7) >= 4:
+    if constants.random_manager.get_stream('market').randrange(1, 7) >= 4:
         current_price = status.worker_types['slave'].recruitment_cost
         if change_type == 'increase':
             changed_price = round(current_price + constants.slave_recruitment_cost_increment, 2)
@@ -156,7 +155,7 @@ def calculate_subsidies(projected = False):
         elif public_opinion > 50:
             public_opinion -= 1
     else:
-        public_opinion += random.randrange(-10, 11)
+        public_opinion += constants.random_manager.get_stream('market').randrange(-10, 11)
         
     subsidies = public_opinion / 5
     for i in range(599, round(constants.money), 100): #remove 10% of subsidies for each 100 money over 500
@@ -206,7 +205,7 @@ def count_available_workers():
         int: Returns the total number of wandering workers and available workers between all villages and slums
     '''
     num_available_workers = 0
-    for current_village in status.village_list:
+    for current_village in constants.actor_registry_manager.get_index('available_workers', 'village'):
         num_available_workers += current_village.available_workers
     for current_slums in status.slums_list:
         num_available_workers += current_slums.available_workers
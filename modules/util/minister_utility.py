@@ -3,6 +3,7 @@
 import modules.constants.constants as constants
 import modules.constants.status as status
 import modules.util.game_transitions as game_transitions
+import modules.util.traversal_utility as traversal_utility
 
 def check_corruption(minister_type):
     '''
@@ -37,6 +38,7 @@ def calibrate_minister_info_display(new_minister):
     '''
     if new_minister == 'none':
         print(0/0)
+    traversal_utility.invalidate_interface_visibility()
     status.displayed_minister = new_minister
     target = 'none'
     if status.displayed_minister:
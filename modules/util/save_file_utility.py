@@ -0,0 +1,259 @@
+#Contains functions for reading and writing save files made of separately compressed and checksummed sections, listed in a table of contents after a versioned header
+
+import os
+import struct
+import zlib
+import lzma
+import pickle
+
+save_file_signature = b'SFASAVE\x00'
+save_file_version = 1
+header_format = struct.Struct('<8sHHI') #signature, format version, number of sections, checksum of the table of contents
+table_entry_format = struct.Struct('<16sBQQQI') #section name, compression type, offset, stored length, uncompressed length, checksum of stored data
+compression_types = ['none', 'zlib', 'lzma']
+
+def compress(data, compression):
+    '''
+    Description:
+        Compresses the inputted data with the inputted type of compression
+    Input:
+        bytes data: Data to compress
+        string compression: Type of compression, like 'none', 'zlib', or 'lzma'
+    Output:
+        bytes: Returns the compressed data
+    '''
+    if compression == 'zlib':
+        return(zlib.compress(data, 6))
+    elif compression == 'lzma':
+        return(lzma.compress(data))
+    return(data)
+
+def decompress(data, compression):
+    '''
+    Description:
+        Decompresses the inputted data that was compressed with the inputted type of compression
+    Input:
+        bytes data: Data to decompress
+        string compression: Type of compression, like 'none', 'zlib', or 'lzma'
+    Output:
+        bytes: Returns the decompressed data
+    '''
+    if compression == 'zlib':
+        return(zlib.decompress(data))
+    elif compression == 'lzma':
+        return(lzma.decompress(data))
+    return(data)
+
+def pickle_sections(sections):
+    '''
+    Description:
+        Pickles the value of each inputted section, creating a snapshot of the sections that is not affected by later changes to the game and can be written on another thread
+    Input:
+        tuple list sections: List of (name, value, compression) tuples for each section, with a string name of up to 16 characters, any type picklable value, and string
+            compression type
+    Output:
+        tuple list: Returns a list of (name, pickled data, compression) tuples for each section
+    '''
+    return([(section_name, pickle.dumps(section_value, pickle.HIGHEST_PROTOCOL), compression) for section_name, section_value, compression in sections])
+
+def write_save_file(file_path, pickled_sections):
+    '''
+    Description:
+        Writes the inputted sections to the inputted file in the save file format - a header, a table of contents with each section's location, compression, and checksum, then
+            each section's compressed data. Sections are written in the inputted order, which should be the order they are loaded in
+    Input:
+        string file_path: Path of file to write
+        tuple list pickled_sections: List of (name, pickled data, compression) tuples for each section, as returned by pickle_sections
+    Output:
+        None
+    '''
+    table_entries = []
+    section_data = []
+    offset = header_format.size + table_entry_format.size * len(pickled_sections)
+    for section_name, uncompressed_data, compression in pickled_sections:
+        stored_data = compress(uncompressed_data, compression)
+        table_entries.append(table_entry_format.pack(section_name.encode('ascii'), compression_types.index(compression), offset, len(stored_data), len(uncompressed_data),
+            zlib.crc32(stored_data)))
+        section_data.append(stored_data)
+        offset += len(stored_data)
+    table_of_contents = b''.join(table_entries)
+    write_file_atomically(file_path, [header_format.pack(save_file_signature, save_file_version, len(pickled_sections), zlib.crc32(table_of_contents)), table_of_contents] +
+        section_data)
+
+def write_file_atomically(file_path, data_list):
+    '''
+    Description:
+        Writes the inputted data to a temporary file, makes sure it is stored on disk, and then renames it to the inputted file path. The file is either completely replaced or
+            not changed at all, even if the game crashes while writing
+    Input:
+        string file_path: Path of file to write
+        bytes list data_list: Data to write, in order
+    Output:
+        None
+    '''
+    temporary_file_path = file_path + '.tmp'
+    with open(temporary_file_path, 'wb') as handle:
+        for data in data_list:
+            handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary_file_path, file_path)
+
+def read_table_of_contents(handle):
+    '''
+    Description:
+        Reads the header and table of contents of the inputted save file, without reading any sections
+    Input:
+        file handle: Binary file to read from, positioned at the start of the file
+    Output:
+        dictionary: Returns a dictionary with the name of each section as keys and dictionaries with its 'compression', 'offset', 'stored_length', 'uncompressed_length', and
+            'checksum' as values, in the order the sections are stored
+    '''
+    header = handle.read(header_format.size)
+    if len(header) < header_format.size:
+        raise ValueError('save file is too short to have a header')
+    signature, version, num_sections, table_checksum = header_format.unpack(header)
+    if signature != save_file_signature:
+        raise ValueError('not a save file')
+    if version > save_file_version:
+        raise ValueError('save file version ' + str(version) + ' is newer than supported version ' + str(save_file_version))
+    table_of_contents = handle.read(table_entry_format.size * num_sections)
+    if len(table_of_contents) < table_entry_format.size * num_sections or zlib.crc32(table_of_contents) != table_checksum:
+        raise ValueError('save file table of contents is damaged')
+    sections = {}
+    for section_name, compression, offset, stored_length, uncompressed_length, checksum in table_entry_format.iter_unpack(table_of_contents):
+        sections[section_name.rstrip(b'\x00').decode('ascii')] = {
+            'compression': compression_types[compression],
+            'offset': offset,
+            'stored_length': stored_length,
+            'uncompressed_length': uncompressed_length,
+            'checksum': checksum
+        }
+    return(sections)
+
+def read_pickled_section(handle, table_of_contents, section_name):
+    '''
+    Description:
+        Reads, checks, and decompresses the inputted section of the inputted save file, without reading any other sections or unpickling the section
+    Input:
+        file handle: Binary file to read from
+        dictionary table_of_contents: Table of contents of the file, as returned by read_table_of_contents
+        string section_name: Name of section to read
+    Output:
+        bytes: Returns the section's pickled data
+    '''
+    if not section_name in table_of_contents:
+        raise ValueError('save file has no ' + section_name + ' section')
+    entry = table_of_contents[section_name]
+    handle.seek(entry['offset'])
+    stored_data = handle.read(entry['stored_length'])
+    if len(stored_data) < entry['stored_length'] or zlib.crc32(stored_data) != entry['checksum']:
+        raise ValueError('save file ' + section_name + ' section is damaged')
+    uncompressed_data = decompress(stored_data, entry['compression'])
+    if len(uncompressed_data) != entry['uncompressed_length']:
+        raise ValueError('save file ' + section_name + ' section is damaged')
+    return(uncompressed_data)
+
+def read_section(handle, table_of_contents, section_name):
+    '''
+    Description:
+        Reads, checks, decompresses, and unpickles the inputted section of the inputted save file, without reading any other sections
+    Input:
+        file handle: Binary file to read from
+        dictionary table_of_contents: Table of contents of the file, as returned by read_table_of_contents
+        string section_name: Name of section to read
+    Output:
+        any type: Returns the value saved in the section
+    '''
+    return(pickle.loads(read_pickled_section(handle, table_of_contents, section_name)))
+
+def verify_section(handle, table_of_contents, section_name, chunk_size = 65536):
+    '''
+    Description:
+        Checks that the inputted section of the inputted save file is complete, matches its checksum, and decompresses to its saved length. The section is read and decompressed
+            in chunks that are discarded after being checked, so a section can be checked without holding it in memory
+    Input:
+        file handle: Binary file to read from
+        dictionary table_of_contents: Table of contents of the file, as returned by read_table_of_contents
+        string section_name: Name of section to check
+        int chunk_size = 65536: Maximum number of bytes to read or decompress at a time
+    Output:
+        None
+    '''
+    if not section_name in table_of_contents:
+        raise ValueError('save file has no ' + section_name + ' section')
+    entry = table_of_contents[section_name]
+    if entry['compression'] == 'zlib':
+        decompressor = zlib.decompressobj()
+    elif entry['compression'] == 'lzma':
+        decompressor = lzma.LZMADecompressor()
+    else:
+        decompressor = 'none'
+    handle.seek(entry['offset'])
+    remaining_length = entry['stored_length']
+    checksum = 0
+    uncompressed_length = 0
+    try:
+        while remaining_length > 0:
+            stored_chunk = handle.read(min(chunk_size, remaining_length))
+            if not stored_chunk: #file ended before the section did
+                break
+            remaining_length -= len(stored_chunk)
+            checksum = zlib.crc32(stored_chunk, checksum)
+            if decompressor == 'none':
+                uncompressed_length += len(stored_chunk)
+            elif entry['compression'] == 'zlib':
+                while stored_chunk: #input that would decompress to more than chunk_size bytes is kept in unconsumed_tail
+                    uncompressed_length += len(decompressor.decompress(stored_chunk, chunk_size))
+                    stored_chunk = decompressor.unconsumed_tail
+            else:
+                uncompressed_length += len(decompressor.decompress(stored_chunk, chunk_size))
+                while not (decompressor.needs_input or decompressor.eof): #input that would decompress to more than chunk_size bytes is kept by the decompressor
+                    uncompressed_length += len(decompressor.decompress(b'', chunk_size))
+        if entry['compression'] == 'zlib':
+            uncompressed_length += len(decompressor.flush())
+    except (zlib.error, lzma.LZMAError):
+        raise ValueError('save file ' + section_name + ' section is damaged')
+    if remaining_length > 0 or checksum != entry['checksum'] or uncompressed_length != entry['uncompressed_length'] or (decompressor != 'none' and not decompressor.eof):
+        raise ValueError('save file ' + section_name + ' section is damaged')
+
+def verify_sections(handle, section_names):
+    '''
+    Description:
+        Reads the table of contents of the inputted save file, then checks each of the inputted sections, allowing a damaged file to be found before any of it is used. Only the
+            table of contents is kept, so each section can be read again when it is needed
+    Input:
+        file handle: Binary file to read from, positioned at the start of the file
+        string list section_names: Names of the sections to check
+    Output:
+        dictionary: Returns the file's table of contents, as returned by read_table_of_contents
+    '''
+    table_of_contents = read_table_of_contents(handle)
+    for section_name in section_names:
+        verify_section(handle, table_of_contents, section_name)
+    return(table_of_contents)
+
+def read_save_metadata(file_path):
+    '''
+    Description:
+        Reads only the metadata section of the inputted save file, like its country, turn, money, and when it was saved
+    Input:
+        string file_path: Path of save file to read
+    Output:
+        dictionary: Returns the saved metadata dictionary
+    '''
+    with open(file_path, 'rb') as handle:
+        return(read_section(handle, read_table_of_contents(handle), 'metadata'))
+
+def is_save_file(handle):
+    '''
+    Description:
+        Returns whether the inputted file starts with the save file signature, rather than being from before the save file format was added
+    Input:
+        file handle: Binary file to check, positioned at the start of the file
+    Output:
+        boolean: Returns whether the file is in the save file format. The file is returned to its original position
+    '''
+    signature = handle.read(len(save_file_signature))
+    handle.seek(-1 * len(signature), 1)
+    return(signature == save_file_signature)
@@ -0,0 +1,144 @@
+#Contains functions that advance the game without a player, resolving notifications and dice instantly so that many turns can be simulated for balance and regression testing
+
+from . import turn_management_utility
+import modules.constants.constants as constants
+import modules.constants.status as status
+import modules.constants.flags as flags
+
+def start_game(country, seed = 'none'):
+    '''
+    Description:
+        Starts a new headless game as the inputted country, skipping the tutorial and automatically appointing the starting ministers. While headless, sounds and music are not
+            played and the display does not need to be updated
+    Input:
+        country country: Country being played in the new game
+        int/string seed = 'none': Seed for the new game's random number streams, or 'none' to choose a random seed
+    Output:
+        boolean: Returns whether the game is still running after the new game's starting notifications are resolved
+    '''
+    flags.headless = True
+    constants.effect_manager.set_effect('skip_intro', True)
+    constants.save_load_manager.new_game(country, seed)
+    flags.loading = False
+    return(resolve_notifications())
+
+def fill_minister_positions():
+    '''
+    Description:
+        Appoints available ministers to any empty minister positions, as turns can not be ended while a position is empty
+    Input:
+        None
+    Output:
+        None
+    '''
+    for current_position in constants.minister_types:
+        if status.current_ministers[current_position] == None and len(status.available_minister_list) > 0:
+            status.available_minister_list[0].appoint(current_position)
+
+def resolve_notifications():
+    '''
+    Description:
+        Resolves each displayed notification in order until none remain, instantly finishing dice rolls and clicking each notification. Choice notifications are resolved by
+            choosing their last option, which is normally the option to cancel
+    Input:
+        None
+    Output:
+        boolean: Returns False if the game ended and is waiting for the player to return to the main menu, otherwise returns True
+    '''
+    while status.displayed_notification:
+        current_notification = status.displayed_notification
+        if current_notification.notification_type == 'roll':
+            for current_die in status.dice_list.copy():
+                current_die.finish_rolling()
+        elif current_notification.notification_type == 'choice':
+            choice_types = [current_choice_button.button_type for current_choice_button in current_notification.choice_buttons]
+            if 'confirm main menu' in choice_types and 'quit' in choice_types: #game over notification
+                return(False)
+            current_notification.choice_buttons[-1].on_click()
+        else:
+            current_notification.on_click()
+        if status.displayed_notification == current_notification: #if notification could not be removed, stop rather than clicking it forever
+            break
+    return(True)
+
+def play_turn():
+    '''
+    Description:
+        Ends the player's turn and completes the ai's turn, combat phase, and start of the next player turn, resolving any notifications along the way
+    Input:
+        None
+    Output:
+        boolean: Returns False if the game ended during the turn, otherwise returns True
+    '''
+    fill_minister_positions()
+    turn_management_utility.end_turn()
+    while not flags.player_turn:
+        if not resolve_notifications():
+            return(False)
+        turn_management_utility.manage_enemy_turn()
+    return(resolve_notifications())
+
+def play_turns(num_turns):
+    '''
+    Description:
+        Plays the inputted number of turns, stopping early if the game ends
+    Input:
+        int num_turns: Number of turns to play
+    Output:
+        int: Returns the number of turns that were completed
+    '''
+    for turns_completed in range(num_turns):
+        if not play_turn():
+            return(turns_completed)
+    return(num_turns)
+
+def simulate_game(country, num_turns, seed = 'none'):
+    '''
+    Description:
+        Starts a new headless game as the inputted country and plays up to the inputted number of turns, recording statistics at the end of each turn
+    Input:
+        country country: Country being played in the new game
+        int num_turns: Maximum number of turns to play
+        int/string seed = 'none': Seed for the new game's random number streams, or 'none' to choose a random seed
+    Output:
+        dictionary list: Returns a dictionary of statistics for each completed turn, with the last dictionary's 'game_over' value being True if the game ended early
+            'turn': int value - Turn number after the turn was completed
+            'money': float value - Company money at the end of the turn
+            'public_opinion': int value - Public opinion at the end of the turn
+            'minister_theft': float value - Total money stolen by ministers since the start of the game
+            'units_lost': int value - Total player-controlled units removed since the start of the game
+            'villages_converted': int value - Number of villages pacified to an aggressiveness of 3 or lower, at which they can not send out hostile warriors
+            'game_over': boolean value - Whether the game ended during the turn
+    '''
+    running = start_game(country, seed)
+    previous_stolen_money = {}
+    for current_minister in status.minister_list:
+        previous_stolen_money[current_minister] = current_minister.stolen_money
+    previous_pmobs = set(status.pmob_list)
+    minister_theft = 0
+    units_lost = 0
+    turn_statistics = []
+    while running and len(turn_statistics) < num_turns:
+        running = play_turn()
+        for current_minister in status.minister_list:
+            stolen_money_change = current_minister.stolen_money - previous_stolen_money.get(current_minister, 0)
+            if stolen_money_change > 0: #money can also leave stolen money through bribes and trials, which is not new theft
+                minister_theft += stolen_money_change
+            previous_stolen_money[current_minister] = current_minister.stolen_money
+        current_pmobs = set(status.pmob_list)
+        units_lost += len(previous_pmobs - current_pmobs)
+        previous_pmobs = current_pmobs
+        villages_converted = 0
+        for current_village in status.village_list:
+            if current_village.population > 0 and current_village.aggressiveness <= 3:
+                villages_converted += 1
+        turn_statistics.append({
+            'turn': constants.turn,
+            'money': constants.money,
+            'public_opinion': constants.public_opinion,
+            'minister_theft': minister_theft,
+            'units_lost': units_lost,
+            'villages_converted': villages_converted,
+            'game_over': not running
+        })
+    return(turn_statistics)
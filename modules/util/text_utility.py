@@ -1,23 +1,35 @@
 #Contains functions that manage the text box and other miscellaneous text display utility
 
 import pygame
+from . import drawing_utility
 import modules.constants.constants as constants
 import modules.constants.status as status
 
-def text(message, font):
+def text(message, font, color='none', size='none'):
     '''
     Description:
-        Returns a rendered pygame.Surface of the inputted text
+        Returns a rendered pygame.Surface of the inputted text. Rendered text is stored in the text surface cache, so repeatedly rendering the same text returns the same surface, which
+            should not be modified
     Input:
         string message: Text to be rendered
         font font: Constructs font with which the text is rendered
+        string/int tuple color = 'none': Color to render the text in, like 'white' or (0, 0, 0) - uses the font's color by default
+        float tuple size = 'none': Two values representing the pixel width and height to scale the rendered text to - the text's natural size is used by default
     Output:
         pygame.Surface: Rendered pygame.Surface of the inputted text
     '''
-    try:
-        text_surface = font.pygame_font.render(message, False, font.color)
-    except:
-        text_surface = pygame.Surface((1, 1)) #prevents error when trying to render very small text (of width 0) on very low resolutions
+    if color == 'none':
+        color = font.color
+    key = (message, font.name, font.size, color, size)
+    text_surface = constants.text_surface_cache.get(key)
+    if text_surface == 'none':
+        try:
+            text_surface = font.pygame_font.render(message, False, color)
+        except:
+            text_surface = pygame.Surface((1, 1)) #prevents error when trying to render very small text (of width 0) on very low resolutions
+        if size != 'none':
+            text_surface = pygame.transform.scale(text_surface, size)
+        constants.text_surface_cache.set(key, text_surface)
     return(text_surface)
 
 def manage_text_list(text_list, max_length):
@@ -46,6 +58,7 @@ def print_to_screen(input_message):
         None
     '''
     status.text_list.append(input_message)
+    mark_text_box_dirty()
 
     
 def print_to_previous_message(message):
@@ -58,6 +71,18 @@ def print_to_previous_message(message):
         None
     '''
     status.text_list[-1] = status.text_list[-1] + message
+    mark_text_box_dirty()
+
+def mark_text_box_dirty():
+    '''
+    Description:
+        Records that the text box at the bottom of the screen has changed and should be redrawn, covering the full screen width because the text box widens to fit its text
+    Input:
+        None
+    Output:
+        None
+    '''
+    drawing_utility.mark_dirty((0, constants.display_height - constants.text_box_height, constants.display_width, constants.text_box_height))
 
 def remove_underscores(message):
     '''
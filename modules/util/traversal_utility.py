@@ -1,22 +1,37 @@
 #Contains functions to manage interface collection traversal, doing particular actions for each element with simple decision-making
 
+from . import drawing_utility
 import modules.constants.status as status
+import modules.constants.flags as flags
 
-def draw_interface_elements(interface_elements):
+def update_interface_elements(interface_elements):
     '''
     Description:
-        Recursively traverses through each of the inputted interface elements and their member trees, updating each element's showing attribute to its current can_show()
-            value and, if it showing, drawing it - if an element is not showing, elements below it can not show either
+        Recursively traverses through each of the inputted interface elements and their member trees, updating each element's showing attribute and rebuilding the draw
+            list without drawing anything - allows elements that change showing status to report their regions before anything is drawn. The draw list is reused by later
+            frames until the interface's visibility is invalidated again
     Input:
-        interface_element list interface_elements: List of interface elements to traverse through - no element in the list should be a member of any other element in the
-            list, either directly or indirectly. This will preferably be the list of all 'root' elements
+        interface_element list interface_elements: List of interface elements to traverse through, preferably the list of all 'root' elements
+    Output:
+        None
     '''
+    flags.interface_visibility_outdated = False #cleared before traversing so that invalidations while drawing apply to the next frame
+    status.draw_list = []
     for current_interface_element in interface_elements:
         collection_traversal(current_interface_element, pretraversal_action=set_showing, alternative_action=set_not_showing, condition=check_showing,
                 posttraversal_action=update_collection)
-    for current_interface_element in status.draw_list:
-        current_interface_element.draw()
-    status.draw_list = []
+
+def invalidate_interface_visibility():
+    '''
+    Description:
+        Records that the showing status of interface elements may have changed, like after the game mode, displayed actor, or an element's collection changes. Each element's
+            showing attribute and the draw list are only updated before the next frame after being invalidated - otherwise, the previous frame's draw list is reused
+    Input:
+        None
+    Output:
+        None
+    '''
+    flags.interface_visibility_outdated = True
 
 def collection_traversal(current_element, **kwargs):
     '''
@@ -66,6 +81,9 @@ def set_showing(current_element):
     '''
     old_showing = current_element.showing
     current_element.showing = current_element.can_show()
+    if old_showing != current_element.showing:
+        drawing_utility.mark_image_dirty(current_element)
+        invalidate_interface_visibility() #other elements' can_show may depend on this element's showing, so update again next frame until nothing changes
     return(old_showing or current_element.showing) #if wasn't showing and still not showing, lower collection elements don't need to be updated - can skip traversal
 
 def update_collection(current_element):
@@ -95,6 +113,8 @@ def set_not_showing(current_element):
     if not current_element.showing:
         return(False)
     current_element.showing = False
+    drawing_utility.mark_image_dirty(current_element)
+    invalidate_interface_visibility()
     return(True)
 
 def check_showing(current_element):
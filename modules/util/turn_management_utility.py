@@ -1,6 +1,6 @@
 #Contains functions that manage what happens at the end of each turn, like worker upkeep and price changes
 
-import random
+import itertools
 from . import text_utility, actor_utility, trial_utility, market_utility, utility, game_transitions
 import modules.constants.constants as constants
 import modules.constants.status as status
@@ -15,22 +15,27 @@ def end_turn():
     Output:
         None
     '''
+    status.minimap_grid.start_calibration_batch() #units may move many times at the end of the turn, only calibrate minimap to the last one
     remove_excess_inventory()
     for current_pmob in status.pmob_list:
         current_pmob.end_turn_move()
     flags.player_turn = False
     status.player_turn_queue = []
     start_enemy_turn()
+    status.minimap_grid.end_calibration_batch()
 
 def start_enemy_turn():
     '''
     Description:
-        Starts the ai's turn, resetting their units to maximum movement points, spawning warriors, etc.
+        Starts the ai's turn, resetting their units to maximum movement points, spawning warriors, etc. Deselects any selected npmob, as a selected npmob would otherwise skip
+            the checks that unselected npmobs make before moving, making its turn depend on whether the player last selected it
     Input:
         first_turn = False: Whether this is the first turn - do not pay upkeep, etc. when the game first starts
     Output:
         None
     '''
+    if status.displayed_mob and status.displayed_mob.is_npmob:
+        actor_utility.calibrate_actor_info_display(status.mob_info_display, None)
     manage_warriors()
     manage_beasts()
     reset_mobs('npmobs')
@@ -51,15 +56,16 @@ def start_player_turn(first_turn = False):
     text_utility.print_to_screen('')
     text_utility.print_to_screen('Turn ' + str(constants.turn + 1))
     if not first_turn:
+        status.minimap_grid.start_calibration_batch()
         for current_pmob in status.pmob_list:
             if current_pmob.is_vehicle:
                 current_pmob.reembark()
-        for current_building in status.building_list:
-            if current_building.building_type == 'resource':
-                current_building.reattach_work_crews()
+        for current_resource_building in status.resource_building_list:
+            current_resource_building.reattach_work_crews()
         manage_attrition() #have attrition before or after enemy turn? Before upkeep?
         manage_production()
         reset_mobs('pmobs')
+        manage_movement_destinations()
         manage_villages()
         manage_public_opinion()
         manage_upkeep()
@@ -74,6 +80,7 @@ def start_player_turn(first_turn = False):
         manage_lore()
         actor_utility.reset_action_prices()
         game_end_check()
+        status.minimap_grid.end_calibration_batch()
 
     flags.player_turn = True #player_turn also set to True in main_loop when enemies done moving
     flags.enemy_combat_phase = False
@@ -90,6 +97,9 @@ def start_player_turn(first_turn = False):
     else:
         actor_utility.calibrate_actor_info_display(status.mob_info_display, None, override_exempt=True)
 
+    if not (first_turn or flags.headless or constants.money < 0): #bankrupt games end instead of being autosaved, and headless games are not saved
+        constants.save_load_manager.request_autosave()
+
 def reset_mobs(mob_type):
     '''
     Description:
@@ -115,6 +125,19 @@ def reset_mobs(mob_type):
             current_mob.reset_movement_points()
             current_mob.set_disorganized(False)
 
+def manage_movement_destinations():
+    '''
+    Description:
+        Moves each pmob with a go to order along its route at the start of the turn, using as many of its movement points as possible
+    Input:
+        None
+    Output:
+        None
+    '''
+    for current_pmob in status.pmob_list.copy():
+        if current_pmob.movement_destination != 'none' and not (current_pmob.in_vehicle or current_pmob.in_group or current_pmob.in_building):
+            current_pmob.follow_movement_destination()
+
 def manage_attrition():
     '''
     Description:
@@ -128,9 +151,8 @@ def manage_attrition():
     for current_pmob in status.pmob_list:
         if not (current_pmob.in_vehicle or current_pmob.in_group or current_pmob.in_building): #vehicles, groups, and buildings handle attrition for their submobs
             current_pmob.manage_health_attrition()
-    for current_building in status.building_list:
-        if current_building.building_type == 'resource':
-            current_building.manage_health_attrition()
+    for current_resource_building in status.resource_building_list:
+        current_resource_building.manage_health_attrition()
 
     for current_pmob in status.pmob_list:
         current_pmob.manage_inventory_attrition()
@@ -167,7 +189,8 @@ def remove_excess_inventory():
 def manage_production():
     '''
     Description:
-        Orders each work crew in a production building to attempt commodity production and displays a production report of commodities for which production was attempted and how much of each was produced
+        Orders each work crew in a production building to attempt commodity production and displays a production report of commodities for which production was attempted and how much of each was produced. The random values for
+            all production attempts controlled by each minister are drawn together before any attempts are resolved
     Input:
         None
     Output:
@@ -177,17 +200,24 @@ def manage_production():
     for current_commodity in constants.collectable_resources:
         constants.commodities_produced[current_commodity] = 0
         expected_production[current_commodity] = 0
+    minister_production_attempts = {} #work crews attempting production and their buildings, sorted by controlling minister
     for current_resource_building in status.resource_building_list:
         if not current_resource_building.damaged:
             for current_work_crew in current_resource_building.contained_work_crews:
-                if current_work_crew.movement_points >= 1:
+                if current_work_crew.movement_points >= 1: #do not attempt production if unit already did something this turn or suffered from attrition
                     if current_work_crew.veteran:
                         expected_production[current_resource_building.resource_type] += 0.75 * current_resource_building.efficiency
                     else:
                         expected_production[current_resource_building.resource_type] += 0.5 * current_resource_building.efficiency
-            current_resource_building.produce()
+                    minister_production_attempts.setdefault(current_work_crew.controlling_minister, []).append((current_work_crew, current_resource_building))
             if not current_resource_building.resource_type in constants.attempted_commodities:
                 constants.attempted_commodities.append(current_resource_building.resource_type)
+    for current_minister in minister_production_attempts:
+        num_attempts = sum([current_resource_building.efficiency for current_work_crew, current_resource_building in minister_production_attempts[current_minister]])
+        corruption_stream = constants.random_manager.get_stream('corruption')
+        roll_values = iter([corruption_stream.random() for current_attempt in range(num_attempts)])
+        for current_work_crew, current_resource_building in minister_production_attempts[current_minister]:
+            current_work_crew.attempt_production(current_resource_building, roll_values)
     manage_production_report(expected_production)
 
 def manage_production_report(expected_production):
@@ -314,7 +344,7 @@ def manage_worker_price_changes():
     '''
     for worker_type in status.worker_types:
         if status.worker_types[worker_type].upkeep_variance:
-            worker_roll = random.randrange(1, 7)
+            worker_roll = constants.random_manager.get_stream('market').randrange(1, 7)
             if worker_roll >= 5:
                 current_price = status.worker_types[worker_type].upkeep
                 changed_price = round(current_price - constants.worker_upkeep_increment, 2)
@@ -328,7 +358,7 @@ def manage_worker_price_changes():
                 text_utility.print_to_screen('An shortage of ' + worker_type + ' workers has increased their upkeep from ' + str(current_price) + ' to ' + str(changed_price) + '.')
 
     if constants.slave_traders_strength > 0:
-        worker_roll = random.randrange(1, 7)
+        worker_roll = constants.random_manager.get_stream('market').randrange(1, 7)
         if worker_roll == 6:
             current_price = status.worker_types['slave'].recruitment_cost
             changed_price = round(current_price - constants.slave_recruitment_cost_increment, 2)
@@ -352,15 +382,13 @@ def manage_worker_migration():
     '''
     num_village_workers = actor_utility.get_num_available_workers('village') + constants.num_wandering_workers
     num_slums_workers = actor_utility.get_num_available_workers('slums')
-    if num_village_workers > num_slums_workers and random.randrange(1, 7) >= 5: #1/3 chance of activating
+    if num_village_workers > num_slums_workers and constants.random_manager.get_stream('migration').randrange(1, 7) >= 5: #1/3 chance of activating
         trigger_worker_migration()
 
     for current_slums in status.slums_list:
-        population_increase = 0
-        for current_worker in range(current_slums.available_workers):
-            if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
-                population_increase += 1
-                market_utility.attempt_worker_upkeep_change('decrease', 'African')
+        population_increase = constants.random_manager.binomial('migration', current_slums.available_workers, 1 / 216) #each worker has a 1/216 chance to roll 1 on 3 D6
+        for current_worker in range(population_increase):
+            market_utility.attempt_worker_upkeep_change('decrease', 'African')
         if population_increase > 0:
             current_slums.change_population(population_increase)
 
@@ -376,20 +404,17 @@ def trigger_worker_migration(): #resolves migration if it occurs
     '''
     possible_source_village_list = actor_utility.get_migration_sources() #list of villages that could have migration
     destination_cell_list = actor_utility.get_migration_destinations()
+    destination_weights = get_migration_destination_weights(destination_cell_list)
 
-    if destination_cell_list:
-        weighted_destination_cell_list = create_weighted_migration_destinations(destination_cell_list)
+    if sum(destination_weights) > 0:
 
         village_destination_dict = {}
         village_num_migrated_dict = {}
         for source_village in possible_source_village_list:
-            num_migrated = 0
-            for available_worker in range(source_village.available_workers):
-                if random.randrange(1, 7) >= 4:
-                    num_migrated += 1
+            num_migrated = constants.random_manager.binomial('migration', source_village.available_workers, 1 / 2) #each worker has a 1/2 chance to roll 4+ on D6
 
             if num_migrated > 0:
-                destination = random.choice(weighted_destination_cell_list)
+                destination = constants.random_manager.get_stream('migration').choices(destination_cell_list, weights=destination_weights)[0]
                 if not destination.has_building('slums'):
                     destination.create_slums()
                 source_village.change_available_workers(-1 * num_migrated)
@@ -399,13 +424,14 @@ def trigger_worker_migration(): #resolves migration if it occurs
                 village_num_migrated_dict[source_village] = num_migrated
 
         wandering_num_migrated_dict = {}
-        for i in range(constants.num_wandering_workers):
-            destination = random.choice(weighted_destination_cell_list)
-            if not destination.has_building('slums'):
-                destination.create_slums()
-            destination.get_building('slums').change_population(1)
-            constants.num_wandering_workers -= 1
-            wandering_num_migrated_dict[destination] = wandering_num_migrated_dict.get(destination, 0) + 1
+        wandering_destination_counts = constants.random_manager.multinomial('migration', constants.num_wandering_workers, destination_weights) #each wandering worker chooses a weighted destination
+        for destination, num_migrated in zip(destination_cell_list, wandering_destination_counts):
+            if num_migrated > 0:
+                if not destination.has_building('slums'):
+                    destination.create_slums()
+                destination.get_building('slums').change_population(num_migrated)
+                constants.num_wandering_workers -= num_migrated
+                wandering_num_migrated_dict[destination] = num_migrated
                 
         if village_num_migrated_dict or wandering_num_migrated_dict:        
             migration_report_text = 'A wave of migration from villages to your colony has occurred as African workers search for employment. /n /n'
@@ -434,16 +460,16 @@ def trigger_worker_migration(): #resolves migration if it occurs
                     'zoom_destination': destination.tile
                 })
     
-def create_weighted_migration_destinations(destination_cell_list):
+def get_migration_destination_weights(destination_cell_list):
     '''
     Description:
-        Analyzes a list of destinations for a migration event and creates a weighted list from which cells with more employment buildings and lower slum populations are more likely to be chosen
+        Analyzes a list of destinations for a migration event and returns the weight of each, with cells with more employment buildings and lower slum populations being more likely to be chosen
     Input:
         cell list destination_cell_list: list of cells that have employment buildings to migrate to
     Output:
-        cell list: Returns a weighted list of cells in which cells with more employment buildings and lower slum populations appear a greater number of times
+        int list: Returns the weight of each cell in the inputted list, with cells with more employment buildings and lower slum populations having higher weights
     '''
-    weighted_cell_list = []
+    destination_weights = []
     for current_cell in destination_cell_list:
         num_poi = 0 #points of interest
         if current_cell.has_intact_building('port'):
@@ -459,10 +485,8 @@ def create_weighted_migration_destinations(destination_cell_list):
             population_weight = max_population_weight - current_cell.get_building('slums').available_workers
         else: #5+
             population_weight = 1
-        total_weight = population_weight * num_poi
-        for i in range(total_weight):
-            weighted_cell_list.append(current_cell)
-    return(weighted_cell_list)
+        destination_weights.append(population_weight * num_poi)
+    return(destination_weights)
 
 def manage_warriors():
     '''
@@ -488,7 +512,7 @@ def manage_villages(verbose: bool = True):
     for current_village in status.village_list:
         if current_village.population > 0:
             previous_aggressiveness = current_village.aggressiveness
-            roll = random.randrange(1, 7)
+            roll = constants.random_manager.get_stream('ai').randrange(1, 7)
             if roll <= 2: #1-2
                 current_village.change_aggressiveness(-1)
             #3-4 does nothing
@@ -501,7 +525,7 @@ def manage_villages(verbose: bool = True):
                         'message': text,
                         'zoom_destination': current_village.cell.tile,
                     })
-        if random.randrange(1, 7) == 6 and random.randrange(1, 7) == 6:
+        if constants.random_manager.get_stream('ai').randrange(1, 7) == 6 and constants.random_manager.get_stream('ai').randrange(1, 7) == 6:
             previous_population = current_village.population
             current_village.change_population(1)
             if previous_population <= 0 and current_village.cell.visible:
@@ -524,7 +548,7 @@ def manage_beasts():
     for current_beast in beast_list:
         current_beast.check_despawn()
 
-    if random.randrange(1, 7) == 1:
+    if constants.random_manager.get_stream('ai').randrange(1, 7) == 1:
         actor_utility.spawn_beast()
     
 def manage_enemy_movement():
@@ -536,9 +560,110 @@ def manage_enemy_movement():
     Output:
         None
     '''
+    status.minimap_grid.start_calibration_batch()
     for current_npmob in status.npmob_list:
         if not current_npmob.creation_turn == constants.turn: #if not created this turn
             current_npmob.end_turn_move()
+    status.minimap_grid.end_calibration_batch()
+
+def manage_enemy_turn():
+    '''
+    Description:
+        Does the next step of the ai's turn, spawning, moving, or removing the npmob at the front of the enemy turn queue and setting the delay before the next step based on what
+            was shown. Once all npmobs are done with their turns, starts the combat phase, after which the player's turn starts
+    Input:
+        None
+    Output:
+        None
+    '''
+    enemy_turn_done = True
+    for enemy in status.npmob_list:
+        if not enemy.turn_done:
+            enemy_turn_done = False
+            break
+    if enemy_turn_done:
+        flags.player_turn = True
+        flags.enemy_combat_phase = True
+        manage_combat()
+    else:
+        current_enemy = status.enemy_turn_queue[0]
+        removed = False
+        spawning = False
+        did_nothing = False
+        moving = False
+        if current_enemy.npmob_type == 'native_warriors' and current_enemy.despawning:
+            if current_enemy == status.displayed_mob or not current_enemy.visible():
+                current_enemy.remove_complete()
+                removed = True
+                
+        elif current_enemy.npmob_type == 'native_warriors' and current_enemy.creation_turn == constants.turn: #if unit just created
+            spawn_cell = current_enemy.grids[0].find_cell(current_enemy.x, current_enemy.y)
+            if (status.minimap_grid.center_x, status.minimap_grid.center_y) == (current_enemy.x, current_enemy.y) and spawn_cell.visible: #if camera just moved to spawn location to show spawning
+                spawning = True
+                current_enemy.show_images()
+                current_enemy.select()
+                current_enemy.attack_on_spawn()
+                current_enemy.turn_done = True
+            else: #if camera did not move to spawn location
+                spawning = True
+                if spawn_cell.visible: #if spawn location visible but camera hasn't moved there yet, move camera there
+                    status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
+                else: #if spawn location not visible, end turn
+                    current_enemy.show_images()
+                    current_enemy.turn_done = True 
+    
+        elif not current_enemy.visible(): #if not just spawned and hidden, do action without displaying
+            current_enemy.end_turn_move()
+            moving = True
+            
+        elif current_enemy == status.displayed_mob: #if enemy is selected and did not just spawn, move it while minimap follows
+            if not current_enemy.creation_turn == constants.turn: #don't do anything on first turn, but still move camera to spawn location if visible
+                current_enemy.end_turn_move() #do_turn()
+                moving = True
+                if current_enemy.visible():
+                    if current_enemy != status.displayed_mob:
+                        current_enemy.select()
+                    else:
+                        status.minimap_grid.calibrate(current_enemy.x, current_enemy.y)
+            else:
+                current_enemy.turn_done = True
+            
+        if (not (removed or spawning)) and (not current_enemy.creation_turn == constants.turn) and current_enemy.visible(): #if unit visible and not selected, start its turn
+            if current_enemy.npmob_type == 'native_warriors' and len(current_enemy.find_target_steps()) == 0 and not current_enemy.despawning: #if native warriors have no target, they stand still and no movement is shown
+                did_nothing = True
+                current_enemy.turn_done = True
+            
+            elif current_enemy.npmob_type == 'beast' and current_enemy.find_target_steps() == [(0, 0)] and not current_enemy.images[0].current_cell.has_pmob():
+                #if beasts stand still and don't attack anything, no movement is shown
+                did_nothing = True
+                current_enemy.turn_done = True
+            elif current_enemy.visible(): #if unit will do an action, move the camera to it and select it
+                current_enemy.select()
+                                                             
+        elif current_enemy.creation_turn == constants.turn and not spawning: #if enemy visible but just spawned, end turn
+            did_nothing = True
+            current_enemy.turn_done = True
+
+        if removed: #show unit despawning if visible
+            current_enemy.turn_done = True
+            if not current_enemy.visible():
+                constants.end_turn_wait_time = 0
+            else:
+                constants.end_turn_wait_time = 1
+            status.enemy_turn_queue.pop(0)
+            
+        else: #If unit visible, have short delay depending on action taken to let user see it
+            if (not spawning) and (did_nothing or not current_enemy.visible()): #do not wait if not visible or nothing to show, exception for spawning units, which may not be visible as user watches them spawn
+                constants.end_turn_wait_time = 0
+            elif spawning and not current_enemy.grids[0].find_cell(current_enemy.x, current_enemy.y).visible: #do not wait if spawning unit won't be visible even after it spawns
+                constants.end_turn_wait_time = 0
+            elif moving and not current_enemy.turn_done:#if will move again after this
+                constants.end_turn_wait_time = 0.25
+            else: #if done with turn
+                constants.end_turn_wait_time = 0.5
+
+            if current_enemy.turn_done:
+                status.enemy_turn_queue.pop(0)
 
 def manage_combat():
     '''
@@ -569,12 +694,12 @@ def manage_ministers():
         if current_minister.just_removed and current_minister.current_position == 'none':
             current_minister.respond('fired')
             removing_minister = True
-        elif current_minister.current_position == 'none' and random.randrange(1, 7) == 1 and random.randrange(1, 7) <= 2: #1/18 chance of switching out available ministers
+        elif current_minister.current_position == 'none' and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) <= 2: #1/18 chance of switching out available ministers
             removed_ministers.append(current_minister)
-        elif (random.randrange(1, 7) == 1 and random.randrange(1, 7) <= 2 and random.randrange(1, 7) <= 2 and (random.randrange(1, 7) <= 3 or constants.evil > random.randrange(0, 100))) or constants.effect_manager.effect_active('farm_upstate'):
+        elif (constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) <= 2 and constants.random_manager.get_stream('corruption').randrange(1, 7) <= 2 and (constants.random_manager.get_stream('corruption').randrange(1, 7) <= 3 or constants.evil > constants.random_manager.get_stream('corruption').randrange(0, 100))) or constants.effect_manager.effect_active('farm_upstate'):
             removed_ministers.append(current_minister)
         else: #if not retired/fired
-            if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1: #1/36 chance to increase relevant specific skill
+            if constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1: #1/36 chance to increase relevant specific skill
                 current_minister.gain_experience()
         current_minister.just_removed = False
 
@@ -588,7 +713,7 @@ def manage_ministers():
 
         evidence_lost = 0
         for i in range(current_minister.corruption_evidence):
-            if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
+            if constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1:
                 evidence_lost += 1
         if evidence_lost > 0:
             if current_minister.current_position == 'none':
@@ -614,14 +739,14 @@ def manage_ministers():
             current_minister.appoint('none')
         current_minister.remove()
 
-    if (len(status.minister_list) <= constants.minister_limit - 2 and random.randrange(1, 7) == 1) or len(status.minister_list) <= 9: #chance if at least 2 missing or guaranteed if not enough to fill cabinet
+    if (len(status.minister_list) <= constants.minister_limit - 2 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1) or len(status.minister_list) <= 9: #chance if at least 2 missing or guaranteed if not enough to fill cabinet
         while len(status.minister_list) < constants.minister_limit:
             constants.actor_creation_manager.create_minister(False, {})
         constants.notification_manager.display_notification({
             'message': 'Several new minister candidates are available for appointment and can be found in the candidate pool. /n /n',
         })
-    first_roll = random.randrange(1, 7)
-    second_roll = random.randrange(1, 7)
+    first_roll = constants.random_manager.get_stream('corruption').randrange(1, 7)
+    second_roll = constants.random_manager.get_stream('corruption').randrange(1, 7)
     if first_roll == 1 and second_roll <= 3:
         constants.fear_tracker.change(-1)
     manage_minister_rumors()
@@ -636,13 +761,13 @@ def manage_minister_rumors():
         None
     '''
     for current_minister in status.minister_list:
-        if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
+        if constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1:
             current_minister.attempt_rumor('loyalty', 'none')
         for skill_type in constants.minister_types:
             if skill_type == current_minister.current_position:
-                if random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
+                if constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1:
                     current_minister.attempt_rumor(skill_type, 'none')
-            elif random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1 and random.randrange(1, 7) == 1:
+            elif constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1 and constants.random_manager.get_stream('corruption').randrange(1, 7) == 1:
                 current_minister.attempt_rumor(skill_type, 'none')
         #1/36 of getting loyalty report
         #if currently employed, 1/36 of getting report on working skill
@@ -691,7 +816,7 @@ def manage_commodity_sales():
             actual_revenue = 0
                 
             for i in range(sold_commodities[current_commodity]):
-                individual_sell_price = sell_price + random.randrange(-1, 2) + trade_minister.get_roll_modifier()
+                individual_sell_price = sell_price + constants.random_manager.get_stream('market').randrange(-1, 2) + trade_minister.get_roll_modifier()
                 if trade_minister.check_corruption() and individual_sell_price > 1:
                     money_stolen += 1
                     individual_sell_price -= 1
@@ -699,7 +824,7 @@ def manage_commodity_sales():
                     individual_sell_price = 1
                 reported_revenue += individual_sell_price
                 actual_revenue += individual_sell_price
-                if random.randrange(1, 7) <= 1: #1/6 chance
+                if constants.random_manager.get_stream('market').randrange(1, 7) <= 1: #1/6 chance
                     market_utility.change_price(current_commodity, -1)
 
             text += str(sold_commodities[current_commodity]) + ' ' + current_commodity + ' sold for ' + str(actual_revenue) + ' money (expected ' + str(expected_revenue) + ') /n /n'
@@ -725,7 +850,7 @@ def manage_lore():
         None
     '''
     if status.current_lore_mission == None:
-        if (random.randrange(1, 7) == 1 and random.randrange(1, 7) <= 2) or constants.effect_manager.effect_active('instant_lore_mission'):
+        if (constants.random_manager.get_stream('lore').randrange(1, 7) == 1 and constants.random_manager.get_stream('lore').randrange(1, 7) <= 2) or constants.effect_manager.effect_active('instant_lore_mission'):
             constants.actor_creation_manager.create_lore_mission(False, {})
 
 def end_turn_warnings():
@@ -742,8 +867,8 @@ def end_turn_warnings():
             text = 'Warning: if you do not reappoint ' + current_minister.name + ' by the end of the turn, he will be considered fired, leaving the candidate pool and incurring a large public opinion penalty. /n /n'
             current_minister.display_message(text)
 
-    for current_cell in status.strategic_map_grid.get_flat_cell_list(): # Warn for insufficient warehouses
-        if current_cell.visible and current_cell.tile.get_inventory_used() > current_cell.tile.inventory_capacity:
+    for current_cell in itertools.compress(status.strategic_map_grid.get_flat_cell_list(), status.strategic_map_grid.visibility): # Warn for insufficient warehouses in explored cells
+        if current_cell.tile.get_inventory_used() > current_cell.tile.inventory_capacity:
             text = 'Warning: the warehouses at (' + str(current_cell.x) + ', ' + str(current_cell.y) + ') are not sufficient to hold the commodities stored there. /n /n'
             text += 'Any commodities exceeding the tile\'s storage capacity will be lost at the end of the turn. /n /n'
             constants.notification_manager.display_notification({
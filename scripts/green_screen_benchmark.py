@@ -0,0 +1,64 @@
+# Compares the previous per-pixel green screen recoloring with drawing_utility.replace_color on the minister portrait assets, checking that both produce identical images
+# Run with py scripts/green_screen_benchmark.py from the main folder
+
+import os
+import sys
+import glob
+import time
+import random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+sys.path.insert(0, os.getcwd())
+from modules.util import drawing_utility
+import modules.constants.constants as constants
+
+def per_pixel_replace_color(surface, old_color, new_color):
+    '''
+    Description:
+        Previous recoloring method, checking and setting each pixel individually
+    Input:
+        pygame.Surface surface: Surface to recolor in place
+        int tuple old_color: Three values representing the red, green, and blue values of the color to replace
+        int tuple new_color: Three values representing the red, green, and blue values to replace the old color with
+    Output:
+        None
+    '''
+    width, height = surface.get_size()
+    for x in range(width):
+        for y in range(height):
+            current_color = surface.get_at((x, y))
+            if current_color[0] == old_color[0] and current_color[1] == old_color[1] and current_color[2] == old_color[2]:
+                surface.set_at((x, y), (new_color[0], new_color[1], new_color[2], current_color[3]))
+
+def recolor(surface, replace_function, new_colors):
+    '''
+    Description:
+        Replaces each green screen color of the inputted surface with the corresponding inputted color using the inputted function
+    Input:
+        pygame.Surface surface: Surface to recolor in place
+        function replace_function: Function used to replace each color
+        int tuple list new_colors: Colors to replace each green screen color with, in order
+    Output:
+        float: Returns the number of seconds taken
+    '''
+    start_time = time.perf_counter()
+    for old_color, new_color in zip(constants.green_screen_colors, new_colors):
+        replace_function(surface, old_color, new_color)
+    return(time.perf_counter() - start_time)
+
+random.seed(0)
+per_pixel_time = 0.0
+replace_color_time = 0.0
+image_paths = sorted(glob.glob('graphics/ministers/portraits/*/*.png'))
+for image_path in image_paths:
+    new_colors = [(random.randrange(256), random.randrange(256), random.randrange(256)) for index in range(len(constants.green_screen_colors))]
+    per_pixel_image = pygame.image.load(image_path)
+    replace_color_image = pygame.image.load(image_path)
+    per_pixel_time += recolor(per_pixel_image, per_pixel_replace_color, new_colors)
+    replace_color_time += recolor(replace_color_image, drawing_utility.replace_color, new_colors)
+    if pygame.image.tobytes(per_pixel_image, 'RGBA') != pygame.image.tobytes(replace_color_image, 'RGBA'):
+        print('Mismatch: ' + image_path)
+
+print(str(len(image_paths)) + ' portrait images')
+print('Per pixel: ' + str(round(per_pixel_time * 1000, 1)) + ' ms')
+print('replace_color: ' + str(round(replace_color_time * 1000, 1)) + ' ms')
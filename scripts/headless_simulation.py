@@ -0,0 +1,36 @@
+# Starts a headless game and plays turns without a player, resolving notifications and dice instantly, then reports how quickly turns were simulated
+# Run with py scripts/headless_simulation.py [number of turns] [seed] from the main folder
+
+import os
+import sys
+import time
+import random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.getcwd())
+from modules.setup import *
+from modules.util import simulation_utility
+import modules.constants.constants as constants
+import modules.constants.status as status
+
+num_turns = 100
+seed = 0
+if len(sys.argv) > 1:
+    num_turns = int(sys.argv[1])
+if len(sys.argv) > 2:
+    seed = int(sys.argv[2])
+
+setup(debug_tools, misc, worker_types_config, equipment_types_config, terrains, commodities, def_ministers, def_countries, transactions, actions, lore,
+      value_trackers, buttons, europe_screen, ministers_screen, trial_screen, new_game_setup_screen, mob_interface, tile_interface, unit_organization_interface,
+      settlement_interface, inventory_interface, minister_interface, country_interface
+)
+random.seed(seed)
+simulation_utility.start_game(random.choice(status.country_list), seed)
+
+start_time = time.perf_counter()
+turns_completed = simulation_utility.play_turns(num_turns)
+elapsed_time = time.perf_counter() - start_time
+
+print(status.current_country.name + ', seed ' + str(seed))
+print(str(turns_completed) + '/' + str(num_turns) + ' turns completed, ending on turn ' + str(constants.turn) + ' with ' + str(constants.money) + ' money')
+print(str(round(elapsed_time, 2)) + ' seconds, ' + str(round(turns_completed * 60 / max(elapsed_time, 0.001))) + ' turns per minute')
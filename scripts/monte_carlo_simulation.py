@@ -0,0 +1,109 @@
+# Plays many independent headless games in parallel across a process pool, each with its own seed and country, and writes each game's per-turn statistics as it completes
+# Results are written as .csv rows for each turn of each game, or as one line of JSON for each game for any other file extension
+# Run with py scripts/monte_carlo_simulation.py [number of games] [number of turns] [output file] [country name] from the main folder
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import multiprocessing
+import concurrent.futures
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.getcwd())
+from modules.setup import *
+from modules.util import simulation_utility
+import modules.constants.status as status
+
+statistic_names = ['turn', 'money', 'public_opinion', 'minister_theft', 'units_lost', 'villages_converted', 'game_over']
+
+def simulate_game(game_index, seed, num_turns, country_name):
+    '''
+    Description:
+        Sets up the game in this process, then plays a headless game with the inputted seed as the inputted country. Each game runs in its own process, as setup and the game state
+            are stored in module-level variables
+    Input:
+        int game_index: Index of this game in the batch
+        int seed: Seed for the game's random number streams
+        int num_turns: Maximum number of turns to play
+        string country_name: Name of the country to play as, or 'none' to cycle through each country based on the game index
+    Output:
+        dictionary: Returns a dictionary containing the game's index, seed, country name, and list of per-turn statistics
+    '''
+    setup(debug_tools, misc, worker_types_config, equipment_types_config, terrains, commodities, def_ministers, def_countries, transactions, actions, lore,
+          value_trackers, buttons, europe_screen, ministers_screen, trial_screen, new_game_setup_screen, mob_interface, tile_interface, unit_organization_interface,
+          settlement_interface, inventory_interface, minister_interface, country_interface
+    )
+    if country_name == 'none':
+        country = status.country_list[game_index % len(status.country_list)]
+    else:
+        country = [current_country for current_country in status.country_list if current_country.name == country_name][0]
+    random.seed(seed)
+    return({
+        'game': game_index,
+        'seed': seed,
+        'country': country.name,
+        'turns': simulation_utility.simulate_game(country, num_turns, seed)
+    })
+
+if __name__ == '__main__':
+    num_games = 8
+    num_turns = 50
+    output_file_path = 'monte_carlo_results.csv'
+    country_name = 'none'
+    if len(sys.argv) > 1:
+        num_games = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        num_turns = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        output_file_path = sys.argv[3]
+    if len(sys.argv) > 4:
+        country_name = sys.argv[4]
+    writing_csv = output_file_path.endswith('.csv')
+
+    start_time = time.perf_counter()
+    country_results = {}
+    failed_games = []
+    with open(output_file_path, 'w', newline='') as output_file:
+        if writing_csv:
+            csv_writer = csv.writer(output_file)
+            csv_writer.writerow(['game', 'seed', 'country'] + statistic_names)
+        #spawned processes are used on all platforms so that each game starts from a freshly imported state, and each process is replaced after a single game
+        with concurrent.futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'), max_tasks_per_child=1) as executor:
+            futures = {}
+            for game_index in range(num_games):
+                seed = game_index
+                futures[executor.submit(simulate_game, game_index, seed, num_turns, country_name)] = (game_index, seed)
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as error: #a game that fails is reported and skipped rather than ending the run
+                    game_index, seed = futures[future]
+                    failed_games.append((game_index, seed))
+                    print('Game ' + str(game_index) + ' (seed ' + str(seed) + ') failed: ' + repr(error))
+                    continue
+                if writing_csv:
+                    for current_turn in result['turns']:
+                        csv_writer.writerow([result['game'], result['seed'], result['country']] + [current_turn[statistic_name] for statistic_name in statistic_names])
+                else:
+                    output_file.write(json.dumps(result) + '\n')
+                output_file.flush()
+
+                if not result['turns']:
+                    continue
+                final_turn = result['turns'][-1]
+                country_results.setdefault(result['country'], []).append(final_turn)
+                print('Game ' + str(result['game']) + ' (' + result['country'] + '): turn ' + str(final_turn['turn']) + ', ' + str(round(final_turn['money'], 1)) + ' money' +
+                    (', bankrupt' if final_turn['game_over'] else ''))
+
+    print()
+    for current_country_name in sorted(country_results):
+        final_turns = country_results[current_country_name]
+        num_bankrupt = len([final_turn for final_turn in final_turns if final_turn['game_over']])
+        average_money = sum([final_turn['money'] for final_turn in final_turns]) / len(final_turns)
+        print(current_country_name + ': ' + str(num_bankrupt) + '/' + str(len(final_turns)) + ' bankrupt within ' + str(num_turns) + ' turns, average final money ' + str(round(average_money, 1)))
+    if failed_games:
+        print(str(len(failed_games)) + ' games failed: ' + ', '.join(['game ' + str(game_index) + ' (seed ' + str(seed) + ')' for game_index, seed in sorted(failed_games)]))
+    print(str(num_games) + ' games of ' + str(num_turns) + ' turns in ' + str(round(time.perf_counter() - start_time, 1)) + ' seconds')
@@ -0,0 +1,182 @@
+#Checks that the random manager's binomial and multinomial samplers match the exact distributions they replace
+#Run with py -m pytest tests from the main folder
+
+import os
+import sys
+import math
+import itertools
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.tools.data_managers.random_manager_template import random_manager_template
+
+class fixed_value_stream():
+    '''
+    Stream that always returns the same value, used to find which result the binomial sampler gives for each value
+    '''
+    def __init__(self, value):
+        '''
+        Description:
+            Initializes this object
+        Input:
+            double value: Value returned by random()
+        Output:
+            None
+        '''
+        self.value = value
+
+    def random(self):
+        '''
+        Description:
+            Returns this stream's value
+        Input:
+            None
+        Output:
+            double: Returns this stream's value
+        '''
+        return(self.value)
+
+def binomial_chance(num_trials, success_chance, num_successes):
+    '''
+    Description:
+        Returns the exact chance of the inputted number of successes out of the inputted number of independent trials
+    Input:
+        int num_trials: Number of trials
+        double success_chance: Chance of each trial succeeding
+        int num_successes: Number of successes
+    Output:
+        double: Returns the chance of exactly that many successes
+    '''
+    return(math.comb(num_trials, num_successes) * success_chance ** num_successes * (1 - success_chance) ** (num_trials - num_successes))
+
+def multinomial_chance(counts, weights):
+    '''
+    Description:
+        Returns the exact chance of each option being chosen the inputted number of times, with each trial choosing an option with chance proportional to its weight
+    Input:
+        int list counts: Number of trials that chose each option
+        double list weights: Weight of each option
+    Output:
+        double: Returns the chance of exactly those counts
+    '''
+    total_weight = sum(weights)
+    chance = math.factorial(sum(counts))
+    for count, weight in zip(counts, weights):
+        chance *= (weight / total_weight) ** count / math.factorial(count)
+    return(chance)
+
+def chi_square_limit(degrees_of_freedom):
+    '''
+    Description:
+        Returns the chi-square value exceeded by chance only 0.1% of the time, using the Wilson-Hilferty approximation
+    Input:
+        int degrees_of_freedom: Degrees of freedom of the test
+    Output:
+        double: Returns the critical chi-square value
+    '''
+    return(degrees_of_freedom * (1 - 2 / (9 * degrees_of_freedom) + 3.09 * math.sqrt(2 / (9 * degrees_of_freedom))) ** 3)
+
+class test_random_manager(unittest.TestCase):
+    '''
+    Tests for the random manager's samplers
+    '''
+    def setUp(self):
+        '''
+        Description:
+            Creates a random manager with a fixed seed before each test
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.random_manager = random_manager_template(['migration'])
+        self.random_manager.set_seed(12345)
+
+    def test_binomial_matches_exact_chances(self):
+        '''
+        Description:
+            Checks that the values leading to each number of successes cover the exact binomial chance of that number. Each result is reached by a single interval of values,
+                so evenly spaced values find each interval's length to within the spacing
+        Input:
+            None
+        Output:
+            None
+        '''
+        num_values = 200000
+        for num_trials, success_chance in [(1, 1 / 2), (6, 1 / 2), (40, 1 / 2), (15, 1 / 216), (216, 1 / 216), (1000, 1 / 216), (25, 0.3), (60, 0.9)]:
+            result_counts = [0] * (num_trials + 1)
+            for value_index in range(num_values):
+                self.random_manager.streams['migration'] = fixed_value_stream((value_index + 0.5) / num_values)
+                result_counts[self.random_manager.binomial('migration', num_trials, success_chance)] += 1
+            for num_successes in range(num_trials + 1):
+                self.assertAlmostEqual(result_counts[num_successes] / num_values, binomial_chance(num_trials, success_chance, num_successes), delta=2 / num_values,
+                    msg=str((num_trials, success_chance, num_successes)))
+
+    def test_binomial_edge_cases(self):
+        '''
+        Description:
+            Checks that results with no trials or certain outcomes are returned without using the stream
+        Input:
+            None
+        Output:
+            None
+        '''
+        self.random_manager.streams['migration'] = None
+        self.assertEqual(self.random_manager.binomial('migration', 0, 1 / 2), 0)
+        self.assertEqual(self.random_manager.binomial('migration', 10, 0), 0)
+        self.assertEqual(self.random_manager.binomial('migration', 10, 1), 10)
+
+    def test_binomial_sample_distribution(self):
+        '''
+        Description:
+            Checks that binomial results from a seeded stream pass a chi-square test against the exact chances, with results too unlikely to test merged together
+        Input:
+            None
+        Output:
+            None
+        '''
+        num_samples = 20000
+        for num_trials, success_chance in [(12, 1 / 2), (216, 1 / 216), (500, 1 / 216), (30, 0.2)]:
+            result_counts = [0] * (num_trials + 1)
+            for sample_index in range(num_samples):
+                result_counts[self.random_manager.binomial('migration', num_trials, success_chance)] += 1
+            observed = []
+            expected = []
+            for num_successes in range(num_trials + 1):
+                if len(expected) > 0 and expected[-1] < 5:
+                    observed[-1] += result_counts[num_successes]
+                    expected[-1] += binomial_chance(num_trials, success_chance, num_successes) * num_samples
+                else:
+                    observed.append(result_counts[num_successes])
+                    expected.append(binomial_chance(num_trials, success_chance, num_successes) * num_samples)
+            chi_square = sum([(observed[index] - expected[index]) ** 2 / expected[index] for index in range(len(expected)) if expected[index] > 0])
+            self.assertLess(chi_square, chi_square_limit(len(expected) - 1), msg=str((num_trials, success_chance)))
+
+    def test_multinomial_matches_weighted_choices(self):
+        '''
+        Description:
+            Checks that splitting trials between options with conditional binomials, as done for wandering workers choosing migration destinations, gives the same distribution
+                as each trial making an independent weighted choice
+        Input:
+            None
+        Output:
+            None
+        '''
+        num_samples = 30000
+        for num_trials, weights in [(4, [5, 10, 0, 3, 2]), (6, [1, 1, 1]), (3, [0, 4, 1, 15])]:
+            result_counts = {}
+            for sample_index in range(num_samples):
+                counts = tuple(self.random_manager.multinomial('migration', num_trials, weights))
+                self.assertEqual(sum(counts), num_trials)
+                result_counts[counts] = result_counts.get(counts, 0) + 1
+            possible_counts = [counts for counts in itertools.product(range(num_trials + 1), repeat=len(weights)) if sum(counts) == num_trials and
+                multinomial_chance(counts, weights) > 0]
+            for counts in result_counts:
+                self.assertIn(counts, possible_counts)
+            chi_square = 0
+            for counts in possible_counts:
+                expected = multinomial_chance(counts, weights) * num_samples
+                chi_square += (result_counts.get(counts, 0) - expected) ** 2 / expected
+            self.assertLess(chi_square, chi_square_limit(len(possible_counts) - 1), msg=str((num_trials, weights)))
+
+if __name__ == '__main__':
+    unittest.main()
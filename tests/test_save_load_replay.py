@@ -0,0 +1,103 @@
+#Checks that a loaded game continues exactly as the game that was saved would have, with the same random results for each subsystem
+#Run with py -m pytest tests from the main folder
+
+import os
+import sys
+import unittest
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def get_game_state():
+    '''
+    Description:
+        Returns a summary of the current game's state, including the order of each registry and the state of each random stream, that is equal for two games only if they have
+            continued identically. Appearance that is not drawn from the random streams, like the names and portraits of new ministers, is not included
+    Input:
+        None
+    Output:
+        tuple: Returns a summary of the current game's state
+    '''
+    import modules.constants.constants as constants
+    import modules.constants.status as status
+    return((
+        constants.turn,
+        round(constants.money, 6),
+        constants.public_opinion,
+        constants.evil,
+        constants.fear,
+        sorted(constants.item_prices.items()),
+        [(current_mob.name, current_mob.x, current_mob.y, current_mob.movement_points, current_mob.is_pmob) for current_mob in status.mob_list],
+        [(current_npmob.name, current_npmob.x, current_npmob.y) for current_npmob in status.npmob_list],
+        [(current_building.building_type, current_building.x, current_building.y, current_building.damaged) for current_building in status.building_list],
+        [(current_village.name, current_village.population, current_village.aggressiveness, current_village.available_workers) for current_village in status.village_list],
+        [(current_minister.current_position, current_minister.general_skill, sorted(current_minister.specific_skills.items()), current_minister.corruption_threshold,
+            round(current_minister.stolen_money, 6)) for current_minister in status.minister_list],
+        constants.random_manager.to_save_dict()
+    ))
+
+class test_save_load_replay(unittest.TestCase):
+    '''
+    Tests for replaying a game after saving and loading it
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Description:
+            Sets up the game once for all tests, as setup and the game state are stored in module-level variables. The tests are skipped if the game's files can not be loaded
+                in this environment, like if the music folders are missing
+        Input:
+            None
+        Output:
+            None
+        '''
+        try:
+            from modules.setup import setup, debug_tools, misc, worker_types_config, equipment_types_config, terrains, commodities, def_ministers, def_countries, \
+                transactions, actions, lore, value_trackers, buttons, europe_screen, ministers_screen, trial_screen, new_game_setup_screen, mob_interface, tile_interface, \
+                unit_organization_interface, settlement_interface, inventory_interface, minister_interface, country_interface
+            setup(debug_tools, misc, worker_types_config, equipment_types_config, terrains, commodities, def_ministers, def_countries, transactions, actions, lore,
+                value_trackers, buttons, europe_screen, ministers_screen, trial_screen, new_game_setup_screen, mob_interface, tile_interface, unit_organization_interface,
+                settlement_interface, inventory_interface, minister_interface, country_interface
+            )
+        except (OSError, UnicodeDecodeError) as error:
+            raise unittest.SkipTest('The game could not be set up in this environment: ' + str(error))
+        os.makedirs('save_games', exist_ok=True)
+
+    def test_replay_after_load(self):
+        '''
+        Description:
+            Plays a seeded game, saves it, and records the following turns. Then loads the save and plays the same turns again, checking that the loaded game matches the
+                saved game and continues identically
+        Input:
+            None
+        Output:
+            None
+        '''
+        import modules.constants.constants as constants
+        import modules.constants.status as status
+        import modules.constants.flags as flags
+        from modules.util import simulation_utility, game_transitions
+        file_name = 'replay_test.pickle'
+        num_replayed_turns = 8
+        self.addCleanup(lambda: os.path.exists('save_games/' + file_name) and os.remove('save_games/' + file_name))
+
+        simulation_utility.start_game(status.Belgium, 3)
+        self.assertEqual(simulation_utility.play_turns(30), 30)
+        saved_state = get_game_state()
+        constants.save_load_manager.save_game(file_name)
+        expected_states = []
+        for current_turn in range(num_replayed_turns):
+            simulation_utility.play_turn()
+            expected_states.append(get_game_state())
+
+        game_transitions.to_main_menu(override=True)
+        constants.save_load_manager.load_game(file_name)
+        simulation_utility.resolve_notifications()
+        flags.loading = False
+        self.assertEqual(get_game_state(), saved_state)
+        for current_turn in range(num_replayed_turns):
+            simulation_utility.play_turn()
+            self.assertEqual(get_game_state(), expected_states[current_turn], msg='Turn ' + str(current_turn + 1) + ' after loading')
+
+if __name__ == '__main__':
+    unittest.main()